@@ -0,0 +1,308 @@
+"""
+Focus Notifier — ses sentezi
+  • Sinüs bip sesi; NumPy varsa vektörel, yoksa array tabanlı
+  • Tek seferde toplu writeframes
+  • (freq, duration, volume, repeat, sample_rate) anahtarlı disk önbelleği
+  • Çalma: kalıcı AudioPlayer; winsound / null / dosya çıkışları
+  • Oynatıcı ve çıkışlar zamanı `clock` üzerinden okur (clock.py)
+"""
+
+import array
+import collections
+import hashlib
+import io
+import math
+import os
+import sys
+import threading
+import wave
+
+from clock import SYSTEM
+from metrics import PLAY_DISPATCH, PLAY_SECONDS
+
+try:
+    import numpy as np
+except ImportError:   # opsiyonel bağımlılık
+    np = None
+
+SAMPLE_RATE = 44100
+SILENCE     = 0.07   # bipler arası sessizlik (sn)
+
+
+def _tone_numpy(freq, n, volume, sample_rate):
+    i = np.arange(n, dtype=np.float64)
+    ramp = n * 0.1
+    env = np.minimum(np.minimum(i / ramp, (n - i) / ramp), 1.0)
+    wave_ = np.sin(2 * np.pi * freq * i / sample_rate)
+    return (32767 * volume * env * wave_).astype("<i2").tobytes()
+
+
+def _tone_array(freq, n, volume, sample_rate):
+    ramp = n * 0.1
+    k = 2 * math.pi * freq / sample_rate
+    amp = 32767 * volume
+    sin = math.sin
+    buf = array.array("h", [
+        int(amp * min(i / ramp, (n - i) / ramp, 1.0) * sin(k * i))
+        for i in range(n)
+    ])
+    if sys.byteorder == "big":
+        buf.byteswap()
+    return buf.tobytes()
+
+
+def synth_beep(freq=880, duration=0.3, volume=0.9, repeat=6,
+               sample_rate=SAMPLE_RATE):
+    """16-bit mono PCM döndür: (bip + sessizlik) × repeat.
+
+    Tek bir bip periyodu sentezlenir, tekrarlar bayt kopyasıyla oluşur.
+    """
+    n = int(sample_rate * duration)
+    synth = _tone_numpy if np is not None else _tone_array
+    beep = synth(freq, n, volume, sample_rate)
+    silence = bytes(2 * int(sample_rate * SILENCE))
+    return (beep + silence) * repeat
+
+
+def generate_beep_wav(path, freq=880, duration=0.3, volume=0.9, repeat=6,
+                      sample_rate=SAMPLE_RATE):
+    """Sinüs dalgası tabanlı alarm sesi üret."""
+    pcm = synth_beep(freq, duration, volume, repeat, sample_rate)
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return path
+
+
+def _expected_size(duration, repeat, sample_rate):
+    n = int(sample_rate * duration) + int(sample_rate * SILENCE)
+    return 44 + 2 * n * repeat   # 44 bayt RIFF/WAVE başlığı
+
+
+def cached_beep_wav(directory, freq=880, duration=0.3, volume=0.9, repeat=6,
+                    sample_rate=SAMPLE_RATE):
+    """Parametrelere göre adlandırılmış WAV'ı döndür; yoksa üret.
+
+    Dosya adı parametre özetini içerir, aynı ayarlar için dosya zaten
+    varsa sentez tamamen atlanır. Yazım geçici dosya + os.replace ile
+    yapılır, yarım kalmış bir dosya önbellek isabeti sayılmaz.
+    """
+    key = f"{freq}|{duration}|{volume}|{repeat}|{sample_rate}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    path = os.path.join(directory, f"fn_alarm_{digest}.wav")
+    try:
+        if os.path.getsize(path) == _expected_size(duration, repeat, sample_rate):
+            return path
+    except OSError:
+        pass
+    tmp = f"{path}.{os.getpid()}.tmp"
+    generate_beep_wav(tmp, freq, duration, volume, repeat, sample_rate)
+    os.replace(tmp, path)
+    return path
+
+
+# ══════════════════════════════════════════════════
+#  ÇALMA — kalıcı oynatıcı + takılabilir çıkışlar
+# ══════════════════════════════════════════════════
+def _wav_bytes(pcm, sample_rate):
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
+class Sound:
+    """Belleğe önceden yüklenmiş 16-bit mono ses."""
+
+    __slots__ = ("pcm", "sample_rate", "wav", "duration")
+
+    def __init__(self, pcm, sample_rate=SAMPLE_RATE):
+        self.pcm         = pcm
+        self.sample_rate = sample_rate
+        self.wav         = _wav_bytes(pcm, sample_rate)   # SND_MEMORY için
+        self.duration    = len(pcm) / 2 / sample_rate
+
+    @classmethod
+    def from_file(cls, path):
+        with wave.open(path, 'rb') as wf:
+            return cls(wf.readframes(wf.getnframes()), wf.getframerate())
+
+
+class NullBackend:
+    """Ses çıkarmaz; `realtime` ise ses süresi kadar bekler."""
+
+    name = "null"
+
+    def __init__(self, realtime=False, clock=SYSTEM):
+        self.realtime = realtime
+        self.clock    = clock
+
+    def play(self, sound):
+        t = self.clock.perf()
+        if self.realtime:
+            self.clock.sleep(sound.duration)
+        return t
+
+    def close(self):
+        pass
+
+
+class FileSinkBackend:
+    """Çalınan her sesi tek bir WAV dosyasına ekler (Linux test makineleri)."""
+
+    name = "file"
+
+    def __init__(self, path, clock=SYSTEM):
+        self.path  = path
+        self.clock = clock
+        self._wf   = None
+
+    def play(self, sound):
+        if self._wf is None:
+            self._wf = wave.open(self.path, 'wb')
+            self._wf.setnchannels(1)
+            self._wf.setsampwidth(2)
+            self._wf.setframerate(sound.sample_rate)
+        t = self.clock.perf()
+        self._wf.writeframes(sound.pcm)
+        return t
+
+    def close(self):
+        if self._wf is not None:
+            self._wf.close()
+            self._wf = None
+
+
+class WinsoundBackend:
+    """Bellekteki WAV'ı winsound ile senkron çalar — süreç başlatmaz."""
+
+    name = "winsound"
+
+    def __init__(self, clock=SYSTEM):
+        import winsound
+        self._ws   = winsound
+        self.clock = clock
+
+    def play(self, sound):
+        ws = self._ws
+        t = self.clock.perf()
+        ws.PlaySound(sound.wav, ws.SND_MEMORY | ws.SND_NODEFAULT)
+        return t
+
+    def close(self):
+        pass
+
+
+def make_backend(spec="auto", clock=SYSTEM):
+    """'auto' | 'null' | 'winsound' | WAV dosya yolu (dosya çıkışı)."""
+    if spec == "null":
+        return NullBackend(clock=clock)
+    if spec == "winsound":
+        return WinsoundBackend(clock)
+    if spec == "auto":
+        try:
+            return WinsoundBackend(clock)
+        except ImportError:   # Windows dışı
+            return NullBackend(clock=clock)
+    return FileSinkBackend(spec, clock)
+
+
+class AudioPlayer:
+    """Uzun ömürlü oynatıcı: tek worker thread, önceden yüklenmiş sesler.
+
+    `play()` beklemez; istekler kuyruğa girer ve sırayla çalınır. Aynı ses
+    için kuyrukta bekleyen ikinci istek birleştirilir (çakışan alarmlar tek
+    çalma). Tetikleme → çıkış çağrısı (dispatch) gecikmesi ms olarak
+    `latencies`'e yazılır: kuyrukta ve yüklemede geçen süre. Arka uçlar
+    sesi çıkışa verecek çağrının (PlaySound / writeframes) hemen öncesini
+    döndürür; cihazın ilk örneği çalma anı ölçülmez (winsound bellekteki
+    sesi asenkron çalamadığı için çağrı dönünce ses bitmiş olur).
+    Zamanlar `clock.perf` ile; verilen arka uç aynı saati kullanmalıdır.
+    """
+
+    def __init__(self, backend=None, clock=SYSTEM):
+        self.backend   = backend
+        self.clock     = clock
+        self.latencies = collections.deque(maxlen=64)
+        self._sounds   = {}
+        self._loaders  = {}
+        self._pending  = collections.OrderedDict()   # ad -> ilk tetikleme zamanı
+        self._cond     = threading.Condition()
+        self._thread   = None
+        self._closed   = False
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._closed = False
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="audio")
+                self._thread.start()
+
+    def load(self, name, loader):
+        """`loader()` → Sound; worker thread'de bir kez çalışır."""
+        with self._cond:
+            self._loaders[name] = loader
+            self._cond.notify()
+
+    def play(self, name):
+        t = self.clock.perf()
+        with self._cond:
+            self._pending.setdefault(name, t)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        t, self._thread = self._thread, None
+        if t is not None:
+            t.join(timeout=1.0)
+
+    def stats(self):
+        lat = sorted(self.latencies)
+        if not lat:
+            return {"count": 0}
+        return {"count": len(lat), "last_ms": self.latencies[-1],
+                "p50_ms": lat[len(lat) // 2], "max_ms": lat[-1]}
+
+    # ── Worker ─────────────────────────────────────
+    def _sound(self, name):
+        snd = self._sounds.get(name)
+        if snd is None:
+            loader = self._loaders.pop(name, None)
+            if loader is not None:
+                snd = self._sounds[name] = loader()
+        return snd
+
+    def _run(self):
+        if self.backend is None:
+            self.backend = make_backend(clock=self.clock)
+        try:
+            while True:
+                with self._cond:
+                    while not (self._closed or self._pending or self._loaders):
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    if self._pending:
+                        name, t_trig = self._pending.popitem(last=False)
+                    else:
+                        name, t_trig = next(iter(self._loaders)), None
+                try:
+                    snd = self._sound(name)
+                    if snd is not None and t_trig is not None:
+                        t0 = self.clock.perf()
+                        t_out = self.backend.play(snd)
+                        PLAY_SECONDS.observe(self.clock.perf() - t0)
+                        PLAY_DISPATCH.observe(t_out - t_trig)
+                        self.latencies.append((t_out - t_trig) * 1000)
+                except Exception:
+                    pass
+        finally:
+            self.backend.close()
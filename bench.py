@@ -0,0 +1,515 @@
+"""
+Focus Notifier — başsız performans ölçümleri
+  • Sıcak yollar: ton sentezi, WAV önbelleği, format_sw, drum / kronometre
+    halkası / lap listesi / çoklu kronometre / alarm listesi çizimi, zamanlayıcı çalma
+    gecikmesi ve uyanmaları, sanal zamanda bir günlük çalma, thread → Tk olay
+    köprüsü, olay günlüğü, metrik sayaçları
+  • Çizim, çağrıları sayan RecordingCanvas üzerinde ölçülür (ekran gerekmez);
+    --tk ile gerçek Tk canvas kullanılır (DISPLAY yoksa ve Xvfb varsa başlatılır)
+  • Sonuçlar bench_baseline.json ile karşılaştırılır; --save tabanı günceller
+  • Kullanım: python bench.py [--tk] [--save] [--quick] [--only drum_frame,...]
+"""
+
+import argparse
+import collections
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+from audio import cached_beep_wav, synth_beep
+from bridge import EventBridge
+from journal import KIND_FIRE, Journal
+from metrics import Registry
+from scheduler import PendingIndex, Scheduler
+from simulate import make_service, run as simulate_run
+from stopwatch import LapLog, StopwatchBank, format_sw
+from widgets import (AlarmListView, DrumRenderer, LapListView, StopwatchRing,
+                     TimerListView)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "bench_baseline.json")
+SLOWER = 1.25   # tabandan bu kat yavaşsa "GERİLEME"
+
+
+class RecordingCanvas:
+    """Tk canvas yerine geçer: öğe oluşturma / güncelleme çağrılarını sayar."""
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self._next = 0
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return self._create
+        raise AttributeError(name)
+
+    def _create(self, *args, **kw):
+        self.calls["create"] += 1
+        self._next += 1
+        return self._next
+
+    def itemconfig(self, item, **kw):
+        self.calls["itemconfig"] += 1
+
+    def coords(self, item, *args):
+        self.calls["coords"] += 1
+
+    def delete(self, *items):
+        self.calls["delete"] += 1
+
+    def bind(self, *args, **kw):
+        pass
+
+    def set(self, *args):   # scrollbar yerine de geçer
+        pass
+
+    def take(self):
+        """Sayaçları döndür ve sıfırla."""
+        out = dict(self.calls)
+        self.calls.clear()
+        return out
+
+
+class TkCanvas:
+    """Gerçek Tk canvas; kare başına oluşturulan öğeyi find_all ile sayar."""
+
+    def __init__(self, root):
+        import tkinter as tk
+        self.root = root
+        self.cv = tk.Canvas(root, width=480, height=300)
+        self.cv.pack()
+        self._items = 0
+
+    def __getattr__(self, name):
+        return getattr(self.cv, name)
+
+    def set(self, *args):
+        pass
+
+    def flush(self):
+        self.root.update_idletasks()
+
+    def take(self):
+        n = len(self.cv.find_all())
+        out, self._items = {"create": n - self._items}, n
+        return out
+
+
+# ══════════════════════════════════════════════════
+#  ÖLÇÜM YARDIMCILARI
+# ══════════════════════════════════════════════════
+def _best_us(fn, n, repeat=3):
+    """`fn`'in n çağrısının en iyi tekrarında çağrı başına µs."""
+    best = None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for _ in range(n):
+            fn()
+        dt = (time.perf_counter() - t) / n * 1e6
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def _per_frame(counts, frames):
+    return {f"{k}_per_frame": round(v / frames, 3) for k, v in sorted(counts.items())}
+
+
+def _pct(sorted_vals, p):
+    return sorted_vals[min(len(sorted_vals) - 1, int(len(sorted_vals) * p))]
+
+
+# ══════════════════════════════════════════════════
+#  ÖLÇÜMLER
+# ══════════════════════════════════════════════════
+def bench_tone_synth(ctx):
+    return {"us": _best_us(synth_beep, 3 if ctx.quick else 10, repeat=2)}
+
+
+def bench_wav_cache_hit(ctx):
+    with tempfile.TemporaryDirectory() as d:
+        cached_beep_wav(d)   # ilk çağrı yazar; ölçülen önbellek isabeti
+        return {"us": _best_us(lambda: cached_beep_wav(d), 200)}
+
+
+def bench_format_sw(ctx):
+    vals = [i * 0.37 for i in range(1000)]
+    def run():
+        for v in vals:
+            format_sw(v)
+    return {"us": _best_us(run, 5 if ctx.quick else 20) / len(vals)}
+
+
+def _frame_bench(ctx, make, frames, step, repeat=3):
+    """Her tekrarda taze canvas + bileşen; en iyi kare süresi ve kare başına
+    canvas çağrıları."""
+    best = None
+    for _ in range(repeat):
+        cv = ctx.canvas()
+        obj = make(cv)
+        cv.take()
+        t = time.perf_counter()
+        for f in frames:
+            step(obj, f)
+            ctx.flush(cv)
+        us = (time.perf_counter() - t) / len(frames) * 1e6
+        best = us if best is None else min(best, us)
+        counts = cv.take()
+        if isinstance(cv, TkCanvas):
+            cv.destroy()
+    return {"us": best, **_per_frame(counts, len(frames))}
+
+
+def bench_drum_frame(ctx):
+    def make(cv):
+        r = DrumRenderer(cv, [f"{v:02d}" for v in range(60)])
+        r.render(0.0)
+        return r
+    # Yumuşak kaydırma: kare başına 0.05 satır
+    steps = [i * 0.05 for i in range(1, 201 if ctx.quick else 1201)]
+    return _frame_bench(ctx, make, steps, DrumRenderer.render)
+
+
+def bench_ring_frame(ctx):
+    # 30 ms'lik kareler
+    frames = [i * 0.03 for i in range(1, 401 if ctx.quick else 2001)]
+    return _frame_bench(ctx, lambda cv: StopwatchRing(cv, 110), frames,
+                        StopwatchRing.render)
+
+
+def bench_lap_list(ctx):
+    """Her yeni lap'te görünümü yenile (lap sayısı büyürken)."""
+    n = 2000 if ctx.quick else 10000
+    times = [i * 1.7 + (i % 7) * 0.1 for i in range(1, n + 1)]
+
+    def step(view, t):
+        view.laps.append(t)
+        view.refresh()
+    res = _frame_bench(ctx, lambda cv: LapListView(cv, LapLog(), 404, 138, cv),
+                       times, step, repeat=1 if ctx.quick else 2)
+    res["laps"] = n
+    return res
+
+
+def bench_timer_list(ctx):
+    """Ortak tick: binlerce kronometre (yarısı çalışıyor), 30 ms'lik kareler."""
+    n = 2000 if ctx.quick else 20000
+    clock = [0.0]
+
+    def make(cv):
+        clock[0] = 0.0
+        bank = StopwatchBank(clock=lambda: clock[0])
+        for i in range(n):
+            j = bank.add(f"görev {i}")
+            if i % 2 == 0:
+                bank.start(j)
+        view = TimerListView(cv, bank, 404, 362)
+        view.render()
+        return view
+
+    def step(view, t):
+        clock[0] = t
+        view.render()
+    frames = [i * 0.03 for i in range(1, 401 if ctx.quick else 2001)]
+    res = _frame_bench(ctx, make, frames, step)
+    res["timers"] = n
+    return res
+
+
+def bench_alarm_list(ctx):
+    """Binlerce bekleyen alarm; saniyelik geri sayım kareleri (kaydırma yok)
+    ve tek alarm ekleme / iptalinin sıralı görünüme uygulanması."""
+    n = 5000 if ctx.quick else 50000
+    t0 = 1_800_000_000.0
+    items = [SimpleNamespace(deadline=t0 + 60 + i * 37,
+                             args=(f"alarm {i}", "", i % 3 == 0, None, None))
+             for i in range(n)]
+
+    def make(cv):
+        view = AlarmListView(cv, 404, 430)
+        view.set_items(items)
+        view.render(t0)
+        return view
+
+    def step(view, t):
+        view.render(t0 + t)
+    frames = list(range(1, 121 if ctx.quick else 601))
+    res = _frame_bench(ctx, make, frames, step)
+    res["alarms"] = n
+
+    sched = Scheduler()
+    for it in items:
+        sched.add(it.deadline, None, *it.args)
+    index = PendingIndex(sched)
+    last = [None, 0]
+
+    def change():   # bir önceki eklenen iptal, yenisi eklenir
+        if last[0] is not None:
+            last[0].cancel()
+        last[1] += 1
+        last[0] = sched.add(t0 + (last[1] * 7919) % (n * 37), None,
+                            "yeni", "", False, None, None)
+        index.sync()
+    res["change_us"] = _best_us(change, 200)
+    return res
+
+
+def bench_bridge(ctx):
+    """Worker thread'inden olay gönder + Tk tarafında toplu işle (olay başına)."""
+    n = 20000 if ctx.quick else 100000
+    bridge = EventBridge(RecordingCanvas())
+    seen = [0]
+
+    def on_tick(i):
+        seen[0] += 1
+    bridge.on("tick", on_tick)
+    bridge.on("show", lambda: None, coalesce=True)
+
+    def work():
+        post = bridge.post
+        for i in range(n):
+            post("tick", i)
+            if i % 8 == 0:
+                post("show")
+    t = time.perf_counter()
+    worker = threading.Thread(target=work)
+    worker.start()
+    while worker.is_alive() or seen[0] < n:
+        bridge.pump()
+    dt = time.perf_counter() - t
+    return {"us": dt / n * 1e6, "pumps": bridge.pumps, "max_batch": bridge.max_batch}
+
+
+def bench_journal(ctx):
+    """Halka tampona ekleme (kayıt başına) ve bir saatlik aralık sorgusu."""
+    n = 20000 if ctx.quick else 200000
+    with tempfile.TemporaryDirectory() as d:
+        j = Journal(os.path.join(d, "j.bin"))
+        t0 = 1.7e9
+        t = time.perf_counter()
+        for i in range(n):
+            j.append(KIND_FIRE, "Mola Zamanı!", t0 + i * 60, i, 1, ts=t0 + i * 60 + 0.02)
+        append_us = (time.perf_counter() - t) / n * 1e6
+        mid = t0 + (n - len(j) // 2) * 60
+        query_us = _best_us(lambda: list(j.between(mid, mid + 3600)), 50)
+        j.close()
+    return {"us": append_us, "range_query_us": query_us, "records": n}
+
+
+def bench_metrics(ctx):
+    """Sıcak yol enstrümantasyonu: sayaç artırma ve histogram gözlemi (ns)."""
+    reg = Registry()
+    c = reg.counter("c_total", "c")
+    h = reg.histogram("h_seconds", "h", (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5))
+    vals = [(i % 97) / 1000 for i in range(1000)]
+
+    def incs():
+        for _ in vals:
+            c.inc()
+
+    def observes():
+        for v in vals:
+            h.observe(v)
+    n = 20 if ctx.quick else 200
+    return {"inc_ns": _best_us(incs, n) / len(vals) * 1000,
+            "observe_ns": _best_us(observes, n) / len(vals) * 1000,
+            "render_us": _best_us(reg.render, n)}
+
+
+def bench_scheduler(ctx):
+    """Çalma gecikmesi (deadline → callback) ve uyanma sayısı."""
+    n = 50 if ctx.quick else 200
+    sched = Scheduler()
+    lat = []
+    done = threading.Event()
+
+    def cb(h):
+        lat.append(time.time() - h.deadline)
+        if len(lat) == n:
+            done.set()
+
+    sched.start()
+    t0 = time.time()
+    base = t0 + 0.05
+    for i in range(n):
+        sched.add(base + i * 0.005, cb)
+    done.wait(10)
+    busy = time.time() - t0
+    busy_wakeups = sched.wakeups
+    # Boşta: tek uzak alarm varken uyanma (eklemenin kendi uyandırması hariç)
+    sched.add(time.time() + 3600, cb)
+    time.sleep(0.05)
+    idle0 = sched.wakeups
+    idle_t = 1.0 if ctx.quick else 3.0
+    time.sleep(idle_t)
+    idle_wakeups = sched.wakeups - idle0
+    sched.stop()
+    lat.sort()
+    ms = [x * 1000 for x in lat]
+    return {"fire_p50_ms": _pct(ms, 0.5), "fire_p99_ms": _pct(ms, 0.99),
+            "fire_max_ms": ms[-1] if ms else None, "fired": len(ms),
+            "busy_wakeups_per_min": round(busy_wakeups / busy * 60, 1),
+            "idle_wakeups_per_min": round(idle_wakeups / idle_t * 60, 1)}
+
+
+def bench_sim_day(ctx):
+    """Sanal saatle 24 saat: binlerce tek seferlik + tekrarlı alarm (çalma başına)."""
+    n = 2000 if ctx.quick else 20000
+    start = 1_800_000_000.0
+
+    def once():
+        service = make_service(start)
+        for i in range(n):
+            service.add_at(start + (i * 7919) % 86400, f"alarm {i}", "", False)
+        for k in range(20):
+            service.add_rule(f"every {5 + k}m", f"kural {k}", "", False)
+        t = time.perf_counter()
+        fires = simulate_run(service, 24)
+        return time.perf_counter() - t, len(fires), service.scheduler.wakeups
+    dt, fired, wakeups = min(once() for _ in range(3))
+    return {"us": dt / fired * 1e6, "day_ms": dt * 1000, "fired": fired,
+            "wakeups": wakeups}
+
+
+BENCHES = collections.OrderedDict(
+    (f.__name__[len("bench_"):], f) for f in (
+        bench_tone_synth, bench_wav_cache_hit, bench_format_sw,
+        bench_drum_frame, bench_ring_frame, bench_lap_list, bench_timer_list,
+        bench_alarm_list, bench_bridge, bench_journal, bench_metrics, bench_scheduler,
+        bench_sim_day))
+
+
+# ══════════════════════════════════════════════════
+#  ÇALIŞTIRMA
+# ══════════════════════════════════════════════════
+class Context:
+    def __init__(self, quick, root=None):
+        self.quick = quick
+        self.root  = root
+        self.mode  = "tk" if root is not None else "recording"
+
+    def canvas(self):
+        return TkCanvas(self.root) if self.root is not None else RecordingCanvas()
+
+    @staticmethod
+    def flush(cv):
+        if isinstance(cv, TkCanvas):
+            cv.flush()
+
+
+def _start_display():
+    """DISPLAY yoksa ve Xvfb kuruluysa sanal ekran başlat; süreci döndür."""
+    if os.environ.get("DISPLAY") or os.name == "nt":
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None
+    proc = subprocess.Popen([xvfb, ":97", "-screen", "0", "640x480x24"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = ":97"
+    time.sleep(0.5)
+    return proc
+
+
+def _open_tk():
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Tk açılamadı ({e}); RecordingCanvas kullanılıyor.", file=sys.stderr)
+        return None
+    root.withdraw()
+    return root
+
+
+def _load_baseline(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _fmt(v):
+    return f"{v:.3f}" if isinstance(v, float) else str(v)
+
+
+def compare(res, base, slower=SLOWER):
+    """Ölçüleri tabanla karşılaştır; süreler (us, *_ms) yavaşlamaya, kare
+    başına çağrı sayıları her değişikliğe işaretlenir."""
+    lines = []
+    for k, v in res.items():
+        ref = base.get(k)
+        note = ""
+        if isinstance(ref, (int, float)) and isinstance(v, (int, float)) and ref:
+            ratio = v / ref
+            flag = ""
+            if k == "us" or k.endswith(("_ms", "_us", "_ns")):
+                # Milisaniye altı gecikmeler gürültülü: 1 ms'den küçük fark sayılmaz
+                if ratio > slower and (not k.endswith("_ms") or v - ref > 1.0):
+                    flag = "  GERİLEME"
+            elif k.endswith("_per_frame") and v != ref:
+                flag = "  DEĞİŞTİ"   # deterministik: çizim işi değişti
+            note = f"  (taban {_fmt(ref)}, x{ratio:.2f}){flag}"
+        lines.append(f"  {k:<26} {_fmt(v):>12}{note}")
+    return lines
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Focus Notifier performans ölçümleri")
+    p.add_argument("--tk", action="store_true",
+                   help="gerçek Tk canvas (gerekirse Xvfb) ile çiz")
+    p.add_argument("--quick", action="store_true", help="kısa çalıştırma")
+    p.add_argument("--save", action="store_true", help="sonuçları taban olarak kaydet")
+    p.add_argument("--only", default="", metavar="AD,AD",
+                   help="sadece bu ölçümler: " + ",".join(BENCHES))
+    p.add_argument("--baseline", default=BASELINE_PATH, metavar="DOSYA")
+    p.add_argument("--threshold", type=float, default=SLOWER, metavar="KAT",
+                   help=f"gerileme eşiği (varsayılan {SLOWER})")
+    args = p.parse_args(argv)
+
+    xvfb = _start_display() if args.tk else None
+    root = _open_tk() if args.tk else None
+    ctx = Context(args.quick, root)
+    names = [n for n in args.only.split(",") if n] or list(BENCHES)
+    unknown = [n for n in names if n not in BENCHES]
+    if unknown:
+        p.error(f"bilinmeyen ölçüm: {', '.join(unknown)}")
+
+    baseline = _load_baseline(args.baseline)
+    base_res = baseline.get(ctx.mode, {})
+    results = {}
+    regress = False
+    try:
+        print(f"# canvas: {ctx.mode}, python {platform.python_version()}, "
+              f"{platform.system()} {platform.machine()}")
+        for name in names:
+            res = BENCHES[name](ctx)
+            res = {k: round(v, 3) if isinstance(v, float) else v for k, v in res.items()}
+            results[name] = res
+            print(name)
+            lines = compare(res, base_res.get(name, {}), args.threshold)
+            regress |= any(line.endswith("GERİLEME") for line in lines)
+            print("\n".join(lines), flush=True)
+    finally:
+        if root is not None:
+            root.destroy()
+        if xvfb is not None:
+            xvfb.terminate()
+
+    if args.save:
+        baseline[ctx.mode] = {**base_res, **results}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+        print(f"taban kaydedildi: {args.baseline}")
+    return 1 if regress and not args.save else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Focus Notifier — worker thread'leri → Tk ana döngüsü olay köprüsü
+  • Worker'lar (scheduler, tepsi, IPC, içe aktarma) Tk'ye hiç dokunmaz;
+    sadece `post(tür, ...)` ile kuyruğa olay bırakır (queue.SimpleQueue)
+  • Tk tarafı tek bir periyodik pompa ile kuyruğu toplu boşaltır;
+    aynı partide tekrarlanan birleştirilebilir olaylar bir kez işlenir
+  • Pompa aralığı uyarlanır: boş geçen her pompada iki katına çıkar
+    (`idle_ms` tavanına dek), olay gelince yeniden `interval`'e iner —
+    tepside boşta seyrek uyanma, olay patlamasında hızlı teslim
+  • `request()`: Tk thread'inde çalışan işleyicinin sonucunu bekler
+  • tkinter import etmez: `after` sağlayan bir host yeter
+"""
+
+import queue
+import threading
+
+
+class BridgeTimeout(Exception):
+    """`request()` süresi içinde Tk thread'i yanıt vermedi."""
+
+
+class _Reply:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done  = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class EventBridge:
+    """Tipli olay kanalı.
+
+    `on(tür, fn)` ile işleyici kaydedilir (Tk thread'inde, başta).
+    `post()` her thread'den çağrılabilir ve sadece kuyruğa ekler;
+    kayıtlı olmayan tür hemen KeyError verir. `coalesce` türleri bir
+    partide yalnızca son argümanlarıyla bir kez işlenir.
+
+    Worker'lar Tk'yi uyandırmaz: başka thread'den `after_idle` ana döngü
+    meşgulken bloklanır, kapanışta RuntimeError verir. Teslimatı her zaman
+    Tk thread'indeki pompa yapar; gecikme en fazla `idle_ms`.
+    """
+
+    MAX_BATCH = 256   # tek pompada en fazla olay; kalanlar sonraki pompaya
+
+    def __init__(self, host, interval_ms=50, idle_ms=None):
+        self._host      = host
+        self.interval   = interval_ms
+        self.idle_ms    = idle_ms or interval_ms
+        self._delay     = interval_ms
+        self._q         = queue.SimpleQueue()
+        self._handlers  = {}
+        self._coalesce  = set()
+        self._after     = None
+        self._running   = False
+        self._tk_thread = None
+        self.posted     = 0
+        self.handled    = 0
+        self.pumps      = 0      # uyanma sayısı
+        self.max_batch  = 0
+
+    def on(self, kind, fn, coalesce=False):
+        self._handlers[kind] = fn
+        if coalesce:
+            self._coalesce.add(kind)
+
+    def post(self, kind, *args):
+        if kind not in self._handlers:
+            raise KeyError(f"bilinmeyen olay: {kind}")
+        self.posted += 1
+        self._q.put((kind, args, None))
+
+    def request(self, kind, *args, timeout=1.0):
+        """Olayı gönder ve işleyicinin dönüş değerini bekle (Tk thread'i
+        dışından). İşleyicinin hatası burada yeniden fırlatılır."""
+        if kind not in self._handlers:
+            raise KeyError(f"bilinmeyen olay: {kind}")
+        if threading.get_ident() == self._tk_thread:
+            return self._handlers[kind](*args)   # Tk thread'inden: bekleme yok
+        reply = _Reply()
+        self.posted += 1
+        self._q.put((kind, args, reply))
+        if not reply.done.wait(timeout):
+            raise BridgeTimeout(kind)
+        if reply.error is not None:
+            raise reply.error
+        return reply.value
+
+    # ── Tk thread'i ────────────────────────────────
+    def start(self):
+        self._tk_thread = threading.get_ident()
+        self._running = True
+        if self._after is None:
+            self._delay = self.interval
+            self._after = self._host.after(self._delay, self._tick)
+
+    def stop(self):
+        """Pompayı durdur (bir işleyicinin içinden de çağrılabilir)."""
+        self._running = False
+        if self._after is not None:
+            self._host.after_cancel(self._after)
+            self._after = None
+
+    def set_interval(self, ms, idle_ms=None):
+        """Pompa aralığı ve boştaki tavanı (ör. pencere tepsideyken seyrek);
+        bekleyen pompa yeni aralıkla yeniden kurulur."""
+        self.interval = ms
+        self.idle_ms = max(idle_ms or ms, ms)
+        self._delay = ms
+        if self._running and self._after is not None:
+            self._host.after_cancel(self._after)
+            self._after = self._host.after(ms, self._tick)
+
+    def _tick(self):
+        self._after = None
+        n = 1   # işleyici hatası: aralık sıfırlansın
+        try:
+            n = self.pump()
+        finally:
+            if self._running:
+                if n:
+                    self._delay = self.interval
+                else:
+                    self._delay = min(self._delay * 2, self.idle_ms)
+                self._after = self._host.after(self._delay, self._tick)
+
+    def pump(self):
+        """Bekleyen olayları bir parti halinde işle; işlenen sayıyı döndür."""
+        self.pumps += 1
+        batch = []
+        get = self._q.get_nowait
+        try:
+            while len(batch) < self.MAX_BATCH:
+                batch.append(get())
+        except queue.Empty:
+            pass
+        if not batch:
+            return 0
+        self.max_batch = max(self.max_batch, len(batch))
+        if self._coalesce:
+            last = {}
+            for i, (kind, _, reply) in enumerate(batch):
+                if kind in self._coalesce and reply is None:
+                    last[kind] = i
+        first_error = None
+        for i, (kind, args, reply) in enumerate(batch):
+            if reply is None and kind in self._coalesce and last[kind] != i:
+                continue
+            self.handled += 1
+            try:
+                value = self._handlers[kind](*args)
+            except Exception as e:
+                # Partinin kalanı yine işlensin; ilk hata sonunda Tk'ye iletilir
+                if reply is None:
+                    first_error = first_error or e
+                    continue
+                reply.error = e
+            else:
+                if reply is not None:
+                    reply.value = value
+            if reply is not None:
+                reply.done.set()
+        if first_error is not None:
+            raise first_error
+        return len(batch)
@@ -0,0 +1,63 @@
+"""
+Focus Notifier — takılabilir saat
+  • Zamana bağlı bileşenler (zamanlayıcı, çekirdek, bildirim, ses, UI kare
+    saati, geri sayım, kronometreler) saati dışarıdan alır; varsayılan SYSTEM
+  • VirtualClock: elle ilerletilen saat — bir günlük çalmalar gerçek
+    beklemeden milisaniyeler içinde oynatılır (simulate.py)
+  • Zamanlayıcı, çekirdek, bildirim ve ses saat nesnesini, UI bileşenleri tek bir
+    callable'ı alır (ör. `Stopwatch(CLOCK.perf)`); hepsi aynı zamanı görür
+"""
+
+import threading
+import time as _time
+from datetime import datetime
+
+
+class SystemClock:
+    """Gerçek saat: time / monotonic / perf_counter / datetime.now."""
+
+    time      = staticmethod(_time.time)
+    monotonic = staticmethod(_time.monotonic)
+    perf      = staticmethod(_time.perf_counter)
+    sleep     = staticmethod(_time.sleep)
+
+    def now(self):
+        return datetime.now()
+
+
+SYSTEM = SystemClock()
+
+
+class VirtualClock:
+    """Sadece `advance` / `set` ile ilerleyen saat.
+
+    monotonic ve perf, başlangıçtan beri geçen sanal saniyedir; `sleep`
+    beklemez, saati ileri alır. Geri gitmez (ValueError).
+    """
+
+    def __init__(self, start=None):
+        self._t0   = SYSTEM.time() if start is None else float(start)
+        self._t    = self._t0
+        self._lock = threading.Lock()
+
+    def time(self):
+        return self._t
+
+    def monotonic(self):
+        return self._t - self._t0
+
+    perf = monotonic
+
+    def now(self):
+        return datetime.fromtimestamp(self._t)
+
+    def set(self, t):
+        with self._lock:
+            if t < self._t:
+                raise ValueError(f"sanal saat geri alınamaz: {t} < {self._t}")
+            self._t = t
+
+    def advance(self, secs):
+        self.set(self._t + secs)
+
+    sleep = advance
@@ -0,0 +1,218 @@
+"""
+Focus Notifier — başsız (headless) çekirdek
+  • Alarm servisi: zamanlayıcı + bildirim + alarm sesi + kalıcı depo
+  • Tekrarlı alarmlar: çaldıktan sonra kuraldan tek bir sonraki deadline
+  • tkinter import etmez; GUI (main.py) ve daemon (daemon.py) ortak kullanır
+"""
+
+import os
+
+from clock import SYSTEM
+from paths import DATA_DIR
+from scheduler import Scheduler, next_occurrence
+from audio import AudioPlayer, Sound, cached_beep_wav
+from journal import FLAG_RECURRING, FLAG_SOUND, KIND_FIRE, KIND_SNOOZE, KIND_STOP
+from metrics import ALARMS_FIRED, ALARMS_SCHEDULED, FIRE_LATENCY
+from notify import NotificationDispatcher
+from recurrence import RuleError, compile_rule
+from store import RULE, UID
+
+# Kalıcı dosyalar (depo, geçmiş, günlük, ses önbelleği) DATA_DIR'de (paths.py)
+STORE_PATH   = os.path.join(DATA_DIR, "fn_alarms.jsonl")
+HISTORY_DIR  = os.path.join(DATA_DIR, "fn_history")
+JOURNAL_PATH = os.path.join(DATA_DIR, "fn_journal.bin")
+
+
+class AlarmService:
+    """Alarm ekle / iptal et; çalınca bildirim gönder ve ses çal.
+
+    `listeners` içindeki fonksiyonlar alarm çaldıktan sonra handle ile,
+    scheduler thread'inde çağrılır (UI kendi thread'ine aktarmalıdır).
+    Depo verilmişse alarmlar günlüğe yazılır ve `start()` onları geri yükler;
+    geçmiş (history.History) verilmişse her çalma oraya kaydedilir;
+    günlük (journal.Journal) verilmişse çalma / durdurma / erteleme olayları
+    gecikmeleriyle birlikte halka tampona yazılır.
+    Dış kaynaktan (takvim) gelen alarmlar `uid` ile `by_uid`'de tutulur.
+    Tüm zaman okumaları `clock` üzerinden (sanal saatle simülasyon için).
+    """
+
+    MISSED_GRACE = 300   # kapalıyken kaçırılan alarm bu kadar sn içindeyse yine çal
+    SNOOZE_MIN   = 5
+
+    def __init__(self, sound_dir=DATA_DIR, player=None, notifier=None, store=None,
+                 history=None, journal=None, clock=SYSTEM):
+        self.clock      = clock
+        self.scheduler  = Scheduler(clock)
+        self.store      = store
+        self.history    = history
+        self.journal    = journal
+        self.last_fired = None
+        self.player     = player or AudioPlayer(clock=clock)
+        self.notifier   = notifier or NotificationDispatcher(clock=clock)
+        self.sound_dir  = sound_dir
+        self.listeners  = []
+        self.by_uid     = {}   # uid -> handle (içe aktarılan alarmlar)
+        self._beep_path = None
+
+    @property
+    def beep_path(self):
+        # Önbellekli WAV ilk ihtiyaçta hazırlanır
+        if self._beep_path is None:
+            self._beep_path = cached_beep_wav(self.sound_dir)
+        return self._beep_path
+
+    def start(self):
+        self.restore()
+        if self.history is not None:
+            self.history.load()   # yazan süreç: çökmeden kalanları onar
+        self.scheduler.start()
+        self.notifier.start()
+        # Alarm sesi oynatıcı thread'inde bir kez belleğe alınır
+        self.player.start()
+        self.player.load("alarm", lambda: Sound.from_file(self.beep_path))
+
+    def stop(self):
+        self.scheduler.stop()
+        self.notifier.close()
+        self.player.close()
+        if self.store is not None:
+            self.store.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.history is not None:
+            self.history.close()
+
+    def restore(self):
+        """Depodaki alarmları zamanlayıcıya aktar; eski kaçırılanları düşür
+        (tekrarlı olanlar bir sonraki çalmaya ilerletilir)."""
+        if self.store is None:
+            return 0
+        now = self.clock.time()
+        cutoff = now - self.MISSED_GRACE
+        fire = self._fire
+        items = []
+        for row in self.store.load():
+            _, aid, deadline, title, message, sound = row[:6]
+            uid = row[UID] if len(row) > UID else None
+            rule = None
+            if len(row) > RULE and row[RULE]:
+                try:
+                    rule = compile_rule(row[RULE])
+                except RuleError:
+                    self.store.remove(aid)
+                    continue
+            if deadline < cutoff:
+                if rule is None:
+                    self.store.remove(aid)
+                    continue
+                deadline = rule.next_after(now)
+                if deadline is None:   # `until` geçmiş: seri bitti
+                    self.store.remove(aid)
+                    continue
+                self.store.reschedule(aid, deadline)
+            items.append((deadline, fire, (title, message, bool(sound), rule, uid), aid))
+        ALARMS_SCHEDULED.inc(len(items))
+        for h in self.scheduler.add_many(items):
+            if h.args[4] is not None:
+                self.by_uid[h.args[4]] = h
+        return len(items)
+
+    def add(self, hour, minute, title, message, sound=True):
+        return self.add_at(next_occurrence(hour, minute, self.clock.now()),
+                           title, message, sound)
+
+    def add_at(self, deadline, title, message, sound=True, uid=None, rule=None):
+        """`deadline`'da çal; `rule` verilirse sonrası kuraldan (ör. takvimde
+        ilk çalma DTSTART'a bağlı, bugünden sonra)."""
+        if isinstance(rule, str):
+            rule = compile_rule(rule)
+        return self._add(deadline, title, message, sound, rule, uid)
+
+    def add_rule(self, rule, title, message, sound=True, uid=None):
+        """Tekrar kuralıyla alarm ekle (metin ya da derlenmiş Rule)."""
+        if isinstance(rule, str):
+            rule = compile_rule(rule)
+        deadline = rule.next_after(self.clock.time())
+        if deadline is None:
+            raise RuleError(f"kuralın çalacağı an kalmadı: {rule.text!r}")
+        return self._add(deadline, title, message, sound, rule, uid)
+
+    def _add(self, deadline, title, message, sound, rule, uid):
+        key = None
+        if self.store is not None:
+            key = self.store.add(deadline, title, message, sound,
+                                 rule.text if rule else None, uid)[1]
+        h = self.scheduler.add(deadline, self._fire, title, message, sound,
+                               rule, uid, key=key)
+        ALARMS_SCHEDULED.inc()
+        if uid is not None:
+            self.by_uid[uid] = h
+        return h
+
+    def reschedule(self, handle, deadline):
+        if handle.reschedule(deadline) and self.store is not None:
+            self.store.reschedule(handle.key, deadline)
+
+    def cancel(self, handle):
+        if handle.cancel():
+            if self.store is not None:
+                self.store.remove(handle.key)
+            self._log(KIND_STOP, handle, handle.deadline)
+        uid = handle.args[4]
+        if uid is not None and self.by_uid.get(uid) is handle:
+            del self.by_uid[uid]
+
+    def snooze(self, handle=None, minutes=SNOOZE_MIN):
+        """Son çalan (ya da verilen) alarmı `minutes` dk sonra tek sefer
+        yeniden çal; yeni handle'ı döndür (çalan yoksa None)."""
+        handle = handle or self.last_fired
+        if handle is None:
+            return None
+        title, message, sound = handle.args[:3]
+        h = self._add(self.clock.time() + minutes * 60, title, message, sound, None, None)
+        self._log(KIND_SNOOZE, h, h.deadline)
+        return h
+
+    def pending(self):
+        return self.scheduler.pending()
+
+    def _log(self, kind, handle, target):
+        if self.journal is None:
+            return
+        title, _, sound, rule = handle.args[:4]
+        flags = (FLAG_SOUND if sound else 0) | (FLAG_RECURRING if rule else 0)
+        try:
+            self.journal.append(kind, title, target, handle.key, flags,
+                                ts=self.clock.time())
+        except ValueError:
+            pass   # kapanışta kapatılmış mmap
+
+    def _fire(self, handle, title, message, sound, rule, uid):
+        target = handle.deadline
+        now = self.clock.time()
+        FIRE_LATENCY.observe(now - target)
+        ALARMS_FIRED.inc()
+        self.last_fired = handle
+        nxt = rule.next_after(max(handle.deadline, now)) if rule is not None else None
+        if nxt is not None:
+            # Sadece bir sonraki deadline hesaplanır; handle aynı kalır
+            self.reschedule(handle, nxt)
+        else:   # tek seferlik ya da serinin son çalması
+            if self.store is not None:
+                self.store.remove(handle.key)
+            if uid is not None and self.by_uid.get(uid) is handle:
+                del self.by_uid[uid]
+        if sound:
+            self.player.play("alarm")   # beklemez; bildirimden önce tetikle
+        self.notifier.submit(title, message)   # toast ayrı thread'de
+        self._log(KIND_FIRE, handle, target)
+        if self.history is not None:
+            try:
+                self.history.record_alarm(now)
+            except OSError:
+                pass
+        for fn in list(self.listeners):
+            try:
+                fn(handle)
+            except Exception:
+                pass
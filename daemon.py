@@ -0,0 +1,142 @@
+"""
+Focus Notifier — GUI'siz daemon
+  • Yalnızca çekirdeği çalıştırır: Tk yorumlayıcısı hiç yüklenmez
+  • Kullanım: python daemon.py --at 09:30 --at 14:00 --title "Mola" --msg "Kalk!"
+             python daemon.py --rule "every 50m 09:00-18:00 weekdays"
+  • Başka bir örnek (GUI ya da daemon) çalışıyorsa alarmlar ona iletilir
+"""
+
+import argparse
+import os
+import sys
+import threading
+
+from audio import AudioPlayer, make_backend
+from core import HISTORY_DIR, JOURNAL_PATH, STORE_PATH, AlarmService
+from history import History
+import instance
+from journal import Journal
+import metrics
+from recurrence import RuleError, compile_rule
+from store import AlarmStore
+
+
+def parse_hhmm(text):
+    try:
+        h, m = (int(p) for p in text.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"HH:MM bekleniyor: {text!r}")
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise argparse.ArgumentTypeError(f"geçersiz saat: {text!r}")
+    return h, m
+
+
+def parse_rule(text):
+    try:
+        return compile_rule(text)
+    except RuleError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_parser():
+    p = argparse.ArgumentParser(description="Focus Notifier — GUI'siz alarm daemon'u")
+    p.add_argument("--at", type=parse_hhmm, action="append", default=[],
+                   metavar="HH:MM", help="alarm saati (tekrarlanabilir)")
+    p.add_argument("--rule", type=parse_rule, action="append", default=[],
+                   metavar="KURAL", help='tekrar kuralı, ör. "weekdays 09:00" '
+                                         'ya da "every 50m 09:00-18:00"')
+    p.add_argument("--import", dest="imports", action="append", default=[],
+                   metavar="DOSYA", help=".ics / .csv takvimden alarmlar (UID farkıyla)")
+    p.add_argument("--title", default="Mola Zamanı!")
+    p.add_argument("--msg", default="Kalk, biraz gez, su iç! 💧")
+    p.add_argument("--no-sound", action="store_true", help="sesli alarmı kapat")
+    p.add_argument("--audio", default="auto", metavar="auto|null|winsound|DOSYA.wav",
+                   help="ses çıkışı; WAV yolu verilirse çalınan sesler dosyaya yazılır")
+    p.add_argument("--store", default=STORE_PATH, metavar="DOSYA",
+                   help="alarm günlüğü (GUI ile ortak); '-' ile kalıcılık kapalı")
+    p.add_argument("--forever", action="store_true",
+                   help="tüm alarmlar çaldıktan sonra da çalışmaya devam et")
+    p.add_argument("--metrics", action="store_true",
+                   help=f"Prometheus uç noktası: http://{metrics.HOST}:{metrics.PORT}/metrics")
+    return p
+
+
+def forward_alarms(args):
+    """Çalışan örneğe ilet; örnek yoksa None."""
+    cmds = [{"cmd": "add", "at": f"{h:02d}:{m:02d}"} for h, m in args.at]
+    cmds += [{"cmd": "rule", "rule": r.text} for r in args.rule]
+    cmds += [{"cmd": "import", "path": os.path.abspath(p)} for p in args.imports]
+    rc = 0
+    for cmd in cmds or [{"cmd": "ping"}]:
+        cmd.update(title=args.title, msg=args.msg, sound=not args.no_sound)
+        reply = instance.forward(cmd)
+        if reply is None:
+            return None
+        rc |= instance.print_reply(reply)
+    return rc
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    ipc = instance.CommandServer.claim()
+    if ipc is None:
+        rc = forward_alarms(args)
+        if rc is not None:
+            return rc
+        # Portu yabancı bir süreç tutuyor: başka porttan devam
+        ipc = instance.CommandServer.claim(fallback=True)
+    if ipc is None:
+        print(f"{instance.HOST}:{instance.PORT} kullanımda.", file=sys.stderr)
+        return 1
+    store = None if args.store == "-" else AlarmStore(args.store)
+    service = AlarmService(player=AudioPlayer(make_backend(args.audio)),
+                           store=store, history=History(HISTORY_DIR),
+                           journal=Journal(JOURNAL_PATH))
+    done = threading.Event()
+
+    def on_fired(handle):
+        if not args.forever and len(service.scheduler) == 0:
+            done.set()
+
+    service.listeners.append(on_fired)
+    service.start()
+    if args.metrics or metrics.ENABLED:
+        metrics.watch_service(service)
+        if metrics.MetricsServer.start() is None:
+            print(f"{metrics.HOST}:{metrics.PORT} kullanımda; metrikler kapalı",
+                  file=sys.stderr)
+    ipc.serve(lambda cmd: instance.service_command(service, cmd)
+              or {"ok": False, "msg": "daemon'da pencere / kronometre yok"})
+    for h, m in args.at:
+        service.add(h, m, args.title, args.msg, not args.no_sound)
+    for rule in args.rule:
+        service.add_rule(rule, args.title, args.msg, not args.no_sound)
+    for path in args.imports:
+        instance.print_reply(instance.service_command(
+            service, {"cmd": "import", "path": path, "sound": not args.no_sound}))
+    if not len(service.scheduler) and not args.forever:
+        print("Alarm yok (--at HH:MM, --rule ya da --import ekleyin).", file=sys.stderr)
+        ipc.close()
+        service.stop()
+        return 2
+
+    # Windows'ta Event.wait() Ctrl+C ile kesilmez; orada kısa aralıkla bekle
+    timeout = 1.0 if os.name == "nt" else None
+    try:
+        while not done.wait(timeout):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ipc.close()
+        service.stop()
+    st = service.player.stats()
+    if st["count"]:
+        print(f"ses gecikmesi (tetikleme → çıkış çağrısı): son {st['last_ms']:.2f} ms, "
+              f"p50 {st['p50_ms']:.2f} ms, en kötü {st['max_ms']:.2f} ms",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Focus Notifier — bellek ve uyanma ölçümü
+  • RSS: Linux /proc/self/statm, Windows GetProcessMemoryInfo,
+    diğerlerinde ru_maxrss (tepe değer)
+  • Ön plan / arka plan (tepsi) için ayrı uyanma sayımı: dakika başına
+  • Kullanım: python main.py status   (çalışan örneğe iletilir)
+"""
+
+import os
+import sys
+import threading
+import time
+
+
+def rss_bytes():
+    """Sürecin yerleşik belleği (bayt); ölçülemiyorsa None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if os.name == "nt":
+        try:
+            return _win_rss()
+        except (OSError, AttributeError):
+            return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _win_rss():
+    import ctypes
+    from ctypes import wintypes
+
+    class PMC(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+            (n, ctypes.c_size_t) for n in (
+                "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+    k32 = ctypes.windll.kernel32
+    k32.GetCurrentProcess.restype = wintypes.HANDLE
+    get = k32.K32GetProcessMemoryInfo
+    get.argtypes = (wintypes.HANDLE, ctypes.POINTER(PMC), wintypes.DWORD)
+    pmc = PMC()
+    pmc.cb = ctypes.sizeof(PMC)
+    if not get(k32.GetCurrentProcess(), ctypes.byref(pmc), pmc.cb):
+        raise OSError("GetProcessMemoryInfo")
+    return pmc.WorkingSetSize
+
+
+class ModeMeter:
+    """Kip başına (ör. "ön plan" / "arka plan") uyanma hızı ve RSS.
+
+    `counter()` toplam uyanma sayısını döndürür (birden çok saatin toplamı
+    olabilir). `switch()` biten kipin süresini, uyanmalarını ve o andaki
+    RSS'ini biriktirir; rapor o anki kipi de içerir. Her thread'den okunabilir.
+    """
+
+    def __init__(self, counter, mode, clock=time.monotonic):
+        self.counter = counter
+        self.clock   = clock
+        self.mode    = mode
+        self.totals  = {}   # kip -> [süre sn, uyanma, son RSS]
+        self._lock   = threading.Lock()
+        self._t      = clock()
+        self._n      = counter()
+
+    def _close(self):
+        t, n = self.clock(), self.counter()
+        row = self.totals.setdefault(self.mode, [0.0, 0, None])
+        row[0] += t - self._t
+        row[1] += n - self._n
+        row[2] = rss_bytes()
+        self._t, self._n = t, n
+
+    def switch(self, mode):
+        with self._lock:
+            if mode != self.mode:
+                self._close()
+                self.mode = mode
+
+    def snapshot(self):
+        """{kip: {"secs", "wakeups", "per_min", "rss"}} — o anki kip dahil."""
+        with self._lock:
+            self._close()
+            totals = {m: list(row) for m, row in self.totals.items()}
+        return {mode: {"secs": secs, "wakeups": n, "rss": rss,
+                       "per_min": n / secs * 60 if secs >= 1 else 0.0}
+                for mode, (secs, n, rss) in totals.items()}
+
+    def report_lines(self):
+        snap = self.snapshot()
+        lines = [f"kip: {self.mode}"]
+        for mode, r in snap.items():
+            rss = f"{r['rss'] / 2**20:6.1f} MB" if r["rss"] is not None else "     ? MB"
+            lines.append(f"{mode:<10} RSS {rss}  {r['per_min']:7.1f} uyanma/dk  "
+                         f"({r['wakeups']} / {r['secs']:.0f} sn)")
+        return lines
@@ -0,0 +1,152 @@
+"""
+Focus Notifier — ortak UI kare saati
+  • Saniyelik aboneler duvar saatinin saniye sınırına hizalı, tek after zinciri
+  • Hızlı aboneler (ör. 30 ms) monotonic saatle kaymasız; sadece aktifken çalışır
+  • Askıya alınınca (pencere tepside) hiçbir after kurulmaz; abonelik
+    durumları korunur, geri gelince saniyelik aboneler hemen tazelenir
+  • tkinter import etmez: `after` / `after_cancel` sağlayan bir host yeter
+"""
+
+import time
+
+
+class Subscription:
+    """FrameClock aboneliği; pause / resume / cancel."""
+
+    __slots__ = ("_clock", "callback", "interval", "active", "_due")
+
+    def __init__(self, clock, callback, interval, active):
+        self._clock   = clock
+        self.callback = callback
+        self.interval = interval   # ms
+        self.active   = active
+        self._due     = None       # hızlı aboneler: sonraki monotonic zaman
+
+    def pause(self):
+        if self.active:
+            self.active = False
+            self._clock._arm()
+
+    def resume(self, immediate=True):
+        if not self.active:
+            self.active = True
+            self._due = None
+            if immediate and self.interval >= 1000 and not self._clock.suspended:
+                self.callback(self._clock.wall())
+            self._clock._arm()
+
+    def cancel(self):
+        self.active = False
+        self._clock._remove(self)
+
+
+class FrameClock:
+    """Tüm periyodik UI geri çağrıları için tek saat.
+
+    Geri çağrılar `callback(now)` ile çağrılır; `now` aynı karede tüm
+    aboneler için ortak duvar saati (epoch sn) değeridir, böylece başlık
+    saati ile geri sayım aynı saniyeyi gösterir.
+    """
+
+    GUARD_MS = 5   # saniye sınırının hemen sonrasına planla
+
+    def __init__(self, host, monotonic=time.monotonic, wall=time.time):
+        self._host      = host
+        self.monotonic  = monotonic
+        self.wall       = wall
+        self._second    = []   # interval >= 1000 ms
+        self._fast      = []   # interval < 1000 ms
+        self._sec_after  = None
+        self._fast_after = None
+        self.suspended  = False
+        self.wakeups    = 0
+
+    def subscribe(self, callback, interval_ms, active=True):
+        """`interval_ms` aralıkla `callback(now)` çağır."""
+        sub = Subscription(self, callback, interval_ms, False)
+        (self._second if interval_ms >= 1000 else self._fast).append(sub)
+        if active:
+            sub.resume()
+        return sub
+
+    def _remove(self, sub):
+        for group in (self._second, self._fast):
+            if sub in group:
+                group.remove(sub)
+        self._arm()
+
+    # ── Askıya alma ────────────────────────────────
+    def suspend(self):
+        """Tüm zincirleri durdur; `active` bayrakları olduğu gibi kalır."""
+        self.suspended = True
+        self._arm()
+
+    def restore(self):
+        """Askıdan çık: aktif saniyelik aboneleri hemen çağır, zinciri kur."""
+        if not self.suspended:
+            return
+        self.suspended = False
+        now = self.wall()
+        for s in self._fast:
+            s._due = None
+        for s in list(self._second):
+            if s.active:
+                s.callback(now)
+        self._arm()
+
+    # ── Planlama ───────────────────────────────────
+    def _arm(self):
+        host = self._host
+        if self.suspended:
+            for name in ("_sec_after", "_fast_after"):
+                if getattr(self, name) is not None:
+                    host.after_cancel(getattr(self, name))
+                    setattr(self, name, None)
+            return
+        if any(s.active for s in self._second):
+            if self._sec_after is None:
+                ms = int(self.wall() * 1000) % 1000
+                self._sec_after = host.after(1000 - ms + self.GUARD_MS,
+                                             self._on_second)
+        elif self._sec_after is not None:
+            host.after_cancel(self._sec_after)
+            self._sec_after = None
+
+        fast = [s for s in self._fast if s.active]
+        if fast:
+            if self._fast_after is None:
+                now = self.monotonic()
+                for s in fast:
+                    if s._due is None:
+                        s._due = now + s.interval / 1000
+                due = min(s._due for s in fast)
+                self._fast_after = host.after(max(0, int((due - now) * 1000)),
+                                              self._on_fast)
+        elif self._fast_after is not None:
+            host.after_cancel(self._fast_after)
+            self._fast_after = None
+
+    def _on_second(self):
+        self._sec_after = None
+        self.wakeups += 1
+        now = self.wall()
+        sec = int(now)
+        for s in list(self._second):
+            step = max(1, round(s.interval / 1000))
+            if s.active and sec % step == 0:
+                s.callback(now)
+        self._arm()
+
+    def _on_fast(self):
+        self._fast_after = None
+        self.wakeups += 1
+        mono = self.monotonic()
+        now = self.wall()
+        for s in list(self._fast):
+            if s.active and s._due is not None and s._due <= mono + 0.001:
+                s._due += s.interval / 1000
+                if s._due < mono:
+                    # Çok geride kaldıysa (ör. uzun bir blok) yeniden hizala
+                    s._due = mono + s.interval / 1000
+                s.callback(now)
+        self._arm()
@@ -0,0 +1,220 @@
+"""
+Focus Notifier — oturum geçmişi
+  • Her alarm çalması ve kronometre oturumu kalıcı olarak kaydedilir
+  • Sütunlu disk biçimi: ts.f64 / kind.u8 / dur.f32 (array, sadece ekleme)
+  • Günlük ve haftalık özetler olay başına bellekte artımlı güncellenir;
+    "son bir yılda günlük odak dakikası" ham olaylar taranmadan yanıtlanır
+  • Olay başına disk işi: açık tutulan üç sütun dosyasına ekleme. Özet
+    dosyası en fazla FLUSH_S'de bir ve kapanışta yazılır; çökmede eksik
+    kalan olaylar yüklemede sütunlardan yeniden işlenir
+  • Onarım (sütunları kırpma, özeti yeniden yazma) sadece yazan süreçte;
+    `readonly=True` okuyucu (komut satırı) çalışan uygulamanın dosyalarına
+    dokunmaz
+  • Kullanım: python history.py [gün sayısı]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from datetime import date, datetime, timedelta
+
+KIND_ALARM     = 1
+KIND_STOPWATCH = 2
+
+# Özet satırı: [alarm sayısı, kronometre oturumu, odak saniyesi]
+ALARMS, SESSIONS, FOCUS = 0, 1, 2
+
+
+def _day_key(d):
+    return d.isoformat()
+
+
+def _week_key(d):
+    y, w, _ = d.isocalendar()
+    return f"{y}-W{w:02d}"
+
+
+class History:
+    """Sütunlu olay günlüğü + önceden toplanmış günlük/haftalık özetler.
+
+    `readonly=True`: sadece okur; başka süreç eklerken de güvenli.
+    """
+
+    COLUMNS = (("ts", "d"), ("kind", "B"), ("dur", "f"))
+    FLUSH_S = 30.0   # özetin diske yazılması için en fazla gecikme
+
+    def __init__(self, directory, readonly=False):
+        self.dir    = directory
+        self.readonly = readonly
+        self.daily  = {}   # "YYYY-MM-DD" -> [alarm, oturum, odak sn]
+        self.weekly = {}   # "YYYY-Www"   -> [alarm, oturum, odak sn]
+        self.count  = 0    # özetlere işlenmiş olay sayısı
+        self._lock  = threading.Lock()
+        self._loaded = False
+        self._files = None   # sütun dosyaları ("ab", açık tutulur)
+        self._timer = None   # bekleyen özet yazımı
+
+    def _path(self, name):
+        return os.path.join(self.dir, name)
+
+    # ── Yükleme ────────────────────────────────────
+    def load(self):
+        """Özetleri oku; sütunlarda özetten fazla olay varsa (çökme) sadece
+        fazlasını işle."""
+        with self._lock:
+            self._load()
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.readonly:
+            os.makedirs(self.dir, exist_ok=True)
+        try:
+            with open(self._path("rollup.json"), encoding="utf-8") as f:
+                data = json.load(f)
+            self.daily, self.weekly = data["daily"], data["weekly"]
+            self.count = data["count"]
+        except (OSError, ValueError, KeyError):
+            self.daily, self.weekly, self.count = {}, {}, 0
+        n = self._column_len()
+        if not self.readonly:
+            # Yarım kalmış son olay: sütunları ortak uzunluğa kırp. Okuyucu
+            # kırpmaz: yazan süreç iki sütun yazımı arasında olabilir
+            for name, code in self.COLUMNS:
+                p = self._path(f"{name}.col")
+                if os.path.exists(p):
+                    os.truncate(p, n * array(code).itemsize)
+        if n > self.count:
+            ts, kind, dur = self.read(self.count, n)
+            for i in range(len(ts)):
+                self._roll(ts[i], kind[i], dur[i])
+            self.count = n
+            if not self.readonly:
+                self._save_rollup()
+
+    def _column_len(self):
+        n = None
+        for name, code in self.COLUMNS:
+            try:
+                size = os.path.getsize(self._path(f"{name}.col"))
+            except OSError:
+                size = 0
+            k = size // array(code).itemsize
+            n = k if n is None else min(n, k)
+        return n
+
+    def read(self, start=0, stop=None):
+        """Ham sütunları [start, stop) aralığında array olarak döndür."""
+        if stop is None:
+            stop = self._column_len()
+        out = []
+        for name, code in self.COLUMNS:
+            a = array(code)
+            with open(self._path(f"{name}.col"), "rb") as f:
+                f.seek(start * a.itemsize)
+                a.fromfile(f, max(0, stop - start))
+            out.append(a)
+        return out
+
+    # ── Kayıt ──────────────────────────────────────
+    def _roll(self, ts, kind, dur):
+        d = datetime.fromtimestamp(ts).date()
+        for table, key in ((self.daily, _day_key(d)), (self.weekly, _week_key(d))):
+            row = table.get(key)
+            if row is None:
+                row = table[key] = [0, 0, 0.0]
+            if kind == KIND_ALARM:
+                row[ALARMS] += 1
+            else:
+                row[SESSIONS] += 1
+            row[FOCUS] += dur
+
+    def _open(self):
+        if self._files is None:
+            self._files = [open(self._path(f"{name}.col"), "ab")
+                           for name, _ in self.COLUMNS]
+        return self._files
+
+    def _save_rollup(self):
+        tmp = self._path("rollup.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"count": self.count, "daily": self.daily,
+                       "weekly": self.weekly}, f, separators=(",", ":"))
+        os.replace(tmp, self._path("rollup.json"))
+
+    def record(self, kind, dur=0.0, ts=None):
+        if self.readonly:
+            raise PermissionError("salt okunur geçmiş")
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            self._load()
+            for (_, code), f, v in zip(self.COLUMNS, self._open(), (ts, kind, dur)):
+                array(code, (v,)).tofile(f)
+                f.flush()   # fsync yok; başka süreç / çökme sonrası görünür
+            self._roll(ts, kind, dur)
+            self.count += 1
+            if self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_S, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Bekleyen özeti diske yaz."""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer.cancel()
+            self._timer = None
+            try:
+                self._save_rollup()
+            except OSError:
+                pass   # sütunlar yerinde; özet yüklemede yeniden kurulur
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            for f in self._files or ():
+                f.close()
+            self._files = None
+
+    def record_alarm(self, ts=None):
+        self.record(KIND_ALARM, 0.0, ts)
+
+    def record_session(self, seconds, ts=None):
+        if seconds > 0:
+            self.record(KIND_STOPWATCH, seconds, ts)
+
+    # ── Sorgular (sadece özetlerden) ───────────────
+    def day(self, d):
+        with self._lock:
+            self._load()
+            return list(self.daily.get(_day_key(d), (0, 0, 0.0)))
+
+    def week(self, d):
+        with self._lock:
+            self._load()
+            return list(self.weekly.get(_week_key(d), (0, 0, 0.0)))
+
+    def focus_minutes_per_day(self, days=365, end=None):
+        """[(tarih, dakika), ...] — son `days` gün, eskiden yeniye."""
+        end = end or date.today()
+        with self._lock:
+            self._load()
+            get = self.daily.get
+            out = []
+            for k in range(days - 1, -1, -1):
+                d = end - timedelta(days=k)
+                row = get(_day_key(d))
+                out.append((d, row[FOCUS] / 60 if row else 0.0))
+            return out
+
+
+if __name__ == "__main__":
+    from core import HISTORY_DIR
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    for d, minutes in History(HISTORY_DIR, readonly=True).focus_minutes_per_day(days):
+        print(f"{d}  {minutes:7.1f} dk")
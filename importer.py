@@ -0,0 +1,305 @@
+"""
+Focus Notifier — takvim içe aktarma (.ics / .csv)
+  • Dosya satır satır okunur; etkinlikler üretici (generator) olarak akar,
+    dosya ya da etkinlik listesi bellekte tutulmaz
+  • VEVENT: DTSTART + (varsa ilk VALARM TRIGGER) → alarm zamanı;
+    basit RRULE (DAILY / WEEKLY;BYDAY, COUNT / UNTIL ile) tekrar kuralına
+    çevrilir; ilk çalma DTSTART'tan önce olmaz. Çevrilemeyen seriler
+    ayrıca sayılır, tek seferlik alarma dönüştürülmez
+  • Yeniden içe aktarmada UID'ye göre sadece fark uygulanır:
+    yeni → ekle, değişen → güncelle, dosyadan silinen → iptal
+  • Kullanım: python main.py import takvim.ics   (çalışan örneğe iletilir)
+"""
+
+import csv
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+from recurrence import RuleError, compile_rule
+
+# Bir etkinlik: (uid, deadline epoch sn, başlık, mesaj, kural metni | None);
+# tekrarlı etkinlikte deadline serinin ilk alarmıdır (DTSTART + tetikleyici)
+UNSUPPORTED = "?"   # kural yerine: bu RRULE çevrilemiyor
+COUNT_MAX   = 10000   # daha uzun COUNT serileri sınırsız sayılır
+
+_DURATION = re.compile(r"([+-])?P(?:(\d+)W)?(?:(\d+)D)?"
+                       r"(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_BYDAY    = {"MO": "mon", "TU": "tue", "WE": "wed", "TH": "thu",
+             "FR": "fri", "SA": "sat", "SU": "sun"}
+_DAYS     = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_zones    = {}
+
+
+def _zone(tzid):
+    """TZID → tzinfo; bilinmiyorsa (ya da zoneinfo verisi yoksa) None = yerel."""
+    if tzid not in _zones:
+        try:
+            from zoneinfo import ZoneInfo
+            _zones[tzid] = ZoneInfo(tzid)
+        except Exception:
+            _zones[tzid] = None
+    return _zones[tzid]
+
+
+def _unescape(v):
+    return (v.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",")
+             .replace("\\;", ";").replace("\\\\", "\\"))
+
+
+def _parse_dt(params, value):
+    """DTSTART/TRIGGER değeri → tz'li ya da yerel datetime."""
+    if len(value) == 8 or "VALUE=DATE" in params and "DATE-TIME" not in params:
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    dt = datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                  int(value[9:11]), int(value[11:13]), int(value[13:15] or 0))
+    if value.endswith("Z"):
+        return dt.replace(tzinfo=timezone.utc)
+    i = params.find("TZID=")
+    if i >= 0:
+        tz = _zone(params[i + 5:].split(";")[0].strip('"'))
+        if tz is not None:
+            return dt.replace(tzinfo=tz)
+    return dt
+
+
+def _parse_duration(value):
+    m = _DURATION.match(value)
+    if m is None:
+        return None
+    sign, w, d, h, mi, s = m.groups()
+    td = timedelta(weeks=int(w or 0), days=int(d or 0), hours=int(h or 0),
+                   minutes=int(mi or 0), seconds=int(s or 0))
+    return -td if sign == "-" else td
+
+
+def _rule_for(rrule, start, when):
+    """Basit RRULE'u tekrar kuralına çevir; desteklenmiyorsa UNSUPPORTED.
+
+    `start` DTSTART, `when` ilk alarmın yerel zamanıdır; tetikleyici gün
+    değiştiriyorsa (ör. gece yarısından önce) BYDAY günleri aynı kadar
+    kaydırılır. UNTIL ve COUNT, son alarmın zamanı olarak `until`'e çevrilir.
+    """
+    parts = dict(p.split("=", 1) for p in rrule.upper().split(";") if "=" in p)
+    if parts.get("INTERVAL", "1") != "1":
+        return UNSUPPORTED
+    hhmm = f"{when.hour:02d}:{when.minute:02d}"
+    if parts.get("FREQ") == "DAILY" and "BYDAY" not in parts:
+        text = f"daily {hhmm}"
+    elif parts.get("FREQ") == "WEEKLY":
+        shift = (when.date() - start.date()).days
+        days = []
+        for d in parts.get("BYDAY", "").split(","):
+            if d not in _BYDAY:
+                if d:
+                    return UNSUPPORTED   # "1MO" gibi sıra numaralı günler
+                continue
+            days.append(_DAYS[(_DAYS.index(_BYDAY[d]) + shift) % 7])
+        if not days:
+            days = [_DAYS[when.weekday()]]
+        text = f"{','.join(days)} {hhmm}"
+    else:
+        return UNSUPPORTED
+    try:
+        if "UNTIL" in parts:
+            until = _parse_dt("", parts["UNTIL"])
+            if len(parts["UNTIL"]) == 8:
+                until += timedelta(days=1, seconds=-1)   # tarih: gün sonuna dek
+            # UNTIL etkinliğin başlangıcını sınırlar; alarm tetikleyici kadar kayık
+            last = until.timestamp() + (when - start).total_seconds()
+        elif "COUNT" in parts:
+            count = int(parts["COUNT"])
+            if count < 1:
+                return UNSUPPORTED
+            last = None
+            if count <= COUNT_MAX:
+                rule, last = compile_rule(text), when.timestamp() - 1
+                for _ in range(count):
+                    last = rule.next_after(last)
+        else:
+            return text
+    except (ValueError, IndexError):
+        return UNSUPPORTED
+    if last is None:
+        return text
+    return f"{text} until {datetime.fromtimestamp(last):%Y-%m-%dT%H:%M}"
+
+
+def _unfold(f):
+    """RFC 5545 satır katlamasını aç: boşlukla başlayan satır öncekine eklenir."""
+    prev = None
+    for line in f:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if prev is not None:
+                prev += line[1:]
+            continue
+        if prev is not None:
+            yield prev
+        prev = line
+    if prev is not None:
+        yield prev
+
+
+def parse_ics(f):
+    """Açık .ics dosyasından etkinlikleri sırayla üret."""
+    ev = None
+    in_alarm = False
+    for line in _unfold(f):
+        name, _, value = line.partition(":")
+        name, _, params = name.partition(";")
+        name = name.upper()
+        if name == "BEGIN":
+            if value == "VEVENT":
+                ev = {}
+            elif value == "VALARM" and ev is not None:
+                in_alarm = True
+        elif name == "END":
+            if value == "VALARM":
+                in_alarm = False
+            elif value == "VEVENT" and ev is not None:
+                out = _event(ev)
+                ev = None
+                if out is not None:
+                    yield out
+        elif ev is None:
+            continue
+        elif in_alarm:
+            if name == "TRIGGER" and "trigger" not in ev:   # sadece ilk VALARM
+                ev["trigger"] = (params.upper(), value)
+        elif name in ("UID", "SUMMARY", "DESCRIPTION", "RRULE", "STATUS"):
+            ev[name] = value
+        elif name == "DTSTART":
+            ev["DTSTART"] = (params.upper(), value)
+
+
+def _event(ev):
+    if ev.get("STATUS", "").upper() == "CANCELLED" or "DTSTART" not in ev:
+        return None
+    try:
+        start = _parse_dt(*ev["DTSTART"])
+        when = start
+        trig = ev.get("trigger")
+        if trig is not None:
+            params, value = trig
+            if "DATE-TIME" in params:
+                when = _parse_dt(params, value)
+            else:
+                delta = _parse_duration(value)
+                if delta is not None:
+                    when = start + delta
+    except (ValueError, IndexError):
+        return None
+    local = datetime.fromtimestamp(when.timestamp())
+    rule = _rule_for(ev["RRULE"], datetime.fromtimestamp(start.timestamp()),
+                     local) if "RRULE" in ev else None
+    uid = ev.get("UID") or f"{ev['DTSTART'][1]}/{ev.get('SUMMARY', '')}"
+    title = _unescape(ev.get("SUMMARY", "")) or "Takvim"
+    return uid, when.timestamp(), title, _unescape(ev.get("DESCRIPTION", "")), rule
+
+
+# CSV başlıkları (büyük/küçük harf duyarsız); ilk eşleşen kullanılır
+_CSV_COLS = {"uid": ("uid", "id"), "start": ("start", "dtstart", "when", "date"),
+             "title": ("title", "summary", "subject"),
+             "message": ("message", "description", "msg"), "rule": ("rule",)}
+
+
+def parse_csv(f):
+    """Başlıklı CSV: uid, start (YYYY-MM-DD HH:MM), title, message[, rule]."""
+    reader = csv.reader(f)
+    header = [h.strip().lower() for h in next(reader, [])]
+    idx = {}
+    for key, names in _CSV_COLS.items():
+        idx[key] = next((header.index(n) for n in names if n in header), None)
+    if idx["start"] is None and idx["rule"] is None:
+        raise ValueError("CSV'de 'start' ya da 'rule' sütunu yok")
+
+    def get(row, key):
+        i = idx[key]
+        return row[i].strip() if i is not None and i < len(row) else ""
+
+    for row in reader:
+        start, rule = get(row, "start"), get(row, "rule") or None
+        try:
+            deadline = datetime.fromisoformat(start).timestamp() if start else 0.0
+        except ValueError:
+            continue
+        if not start and not rule:
+            continue
+        uid = get(row, "uid") or f"{start}/{get(row, 'title')}"
+        yield uid, deadline, get(row, "title") or "Takvim", get(row, "message"), rule
+
+
+def read_events(path):
+    """Uzantıya göre ayrıştırıcı seç; dosya okundukça etkinlik üret."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        parse = parse_csv if path.lower().endswith(".csv") else parse_ics
+        yield from parse(f)
+
+
+def sync(service, events, source, sound=True):
+    """Etkinlikleri servise uygula; sadece `source` kaynağının farkı işlenir.
+
+    Alarm uid'leri "kaynak#UID" biçimindedir; akışta görünmeyen eski
+    uid'ler iptal edilir. Tekrarlı etkinliğin ilk çalması deadline'dan
+    (DTSTART) önce olmaz. Sayımları sözlük olarak döndürür.
+    """
+    prefix = source + "#"
+    now = service.clock.time()
+    seen = set()
+    counts = dict(added=0, changed=0, removed=0, unchanged=0, skipped=0,
+                  unsupported=0)
+    for uid, deadline, title, message, rule in events:
+        uid = prefix + uid
+        seen.add(uid)
+        old = service.by_uid.get(uid)
+        if old is not None and not old.active:
+            old = None
+        if rule == UNSUPPORTED:
+            counts["unsupported"] += 1
+            if old is not None:
+                service.cancel(old)
+            continue
+        if rule is not None:
+            try:
+                compiled = compile_rule(rule)
+            except RuleError:
+                counts["skipped"] += 1
+                continue
+            deadline = compiled.next_after(max(now, deadline - 1))
+        if deadline is None or deadline <= now:
+            counts["skipped"] += 1   # geçmiş: tekrarsız ya da bitmiş seri
+            if old is not None:
+                service.cancel(old)
+            continue
+        if old is not None:
+            o_title, o_msg, o_sound, o_rule = old.args[:4]
+            same = (o_title == title and o_msg == message and o_sound == sound
+                    and (o_rule.text if o_rule else None) == rule)
+            if same and old.deadline == deadline:
+                counts["unchanged"] += 1
+                continue
+            if same:
+                service.reschedule(old, deadline)   # sadece saat değişti
+                counts["changed"] += 1
+                continue
+            service.cancel(old)
+        service.add_at(deadline, title, message, sound, uid=uid, rule=rule)
+        counts["changed" if old is not None else "added"] += 1
+    for uid in [u for u in list(service.by_uid) if u.startswith(prefix)]:
+        h = service.by_uid.get(uid)
+        if uid not in seen and h is not None:
+            service.cancel(h)
+            counts["removed"] += 1
+    return counts
+
+
+def import_file(service, path, source=None, sound=True):
+    """Dosyayı içe aktar; kaynak adı varsayılan olarak dosya adıdır."""
+    return sync(service, read_events(path), source or os.path.basename(path), sound)
+
+
+def format_counts(c):
+    return (f"eklendi {c['added']}, değişti {c['changed']}, silindi {c['removed']}, "
+            f"aynı {c['unchanged']}, atlandı {c['skipped']}"
+            + (f", desteklenmeyen tekrar {c['unsupported']}" if c.get("unsupported") else ""))
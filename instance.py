@@ -0,0 +1,253 @@
+"""
+Focus Notifier — tek örnek + yerel komut kanalı
+  • İlk örnek 127.0.0.1:PORT'u dinler; dinleyebilmek kilidin kendisidir.
+    Port yabancı bir süreçteyse boş bir porta geçer; anahtar dosyası
+    (kullanıcı veri dizininde) anahtarı ve dinlenen portu taşır
+  • Sonraki çağrılar komutunu (göster, alarm ekle, kronometre…) ilk örneğe
+    iletip çıkar — Tk ve çekirdek modüller hiç yüklenmez
+  • Satır başına bir JSON istek / yanıt; anahtar dosyası yabancı istemcileri eler
+  • Kullanım: python main.py add 09:30 --title "Mola"   (çalışan örneğe iletilir)
+"""
+
+import json
+import os
+import secrets
+import socket
+import sys
+import threading
+
+from paths import DATA_DIR
+
+# Onefile EXE'de her süreç kendi _MEIxxxx dizinine açılır: anahtar, ikinci
+# çağrının da okuyabilmesi için kullanıcı veri dizininde
+KEY_PATH = os.path.join(DATA_DIR, "fn_instance.key")
+HOST     = "127.0.0.1"
+PORT     = int(os.environ.get("FN_IPC_PORT", "47291"))
+
+# Komut satırında komut sayılmayan, süreç açılışına ait bayraklar
+PROCESS_FLAGS = ("--startup-report", "--profile-ui", "--metrics")
+
+
+def parse_command(argv):
+    """Komut satırını istek sözlüğüne çevir; komut yoksa {"cmd": "show"}."""
+    argv = [a for a in argv if a not in PROCESS_FLAGS]
+    if not argv:
+        return {"cmd": "show"}
+    import argparse
+    p = argparse.ArgumentParser(prog="main.py",
+                                description="Çalışan Focus Notifier'a komut gönder")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("show", help="pencereyi göster")
+    sub.add_parser("ping", help="çalışan örnek var mı")
+    sub.add_parser("list", help="bekleyen alarmlar")
+    sub.add_parser("status", help="RSS ve dakika başına uyanma (ön plan / arka plan)")
+    for name, arg, help_ in (("add", "at", "HH:MM alarmı ekle"),
+                             ("rule", "rule", 'tekrar kuralı ekle, ör. "weekdays 09:00"')):
+        sp = sub.add_parser(name, help=help_)
+        sp.add_argument(arg)
+        sp.add_argument("--title", default="Mola Zamanı!")
+        sp.add_argument("--msg", default="Kalk, biraz gez, su iç! 💧")
+        sp.add_argument("--no-sound", dest="sound", action="store_false")
+    sp = sub.add_parser("snooze", help="son çalan alarmı ertele")
+    sp.add_argument("minutes", nargs="?", type=int, default=5)
+    sp = sub.add_parser("stopwatch", help="kronometre")
+    sp.add_argument("action", choices=("start", "pause", "toggle", "lap", "reset"))
+    sp = sub.add_parser("timer", help="adlandırılmış görev kronometresi")
+    sp.add_argument("action", choices=("start", "pause", "toggle", "reset", "remove", "list"))
+    sp.add_argument("name", nargs="?")
+    sp = sub.add_parser("import", help=".ics / .csv takvimi içe aktar (UID farkı)")
+    sp.add_argument("path")
+    sp.add_argument("--source", help="kaynak adı (varsayılan: dosya adı)")
+    sp.add_argument("--no-sound", dest="sound", action="store_false")
+    cmd = vars(p.parse_args(argv))
+    if cmd["cmd"] == "import":
+        cmd["path"] = os.path.abspath(cmd["path"])   # sunucunun çalışma dizini farklı
+    return cmd
+
+
+def read_key():
+    """Anahtar dosyasından (anahtar, port); dosya yoksa ("", PORT)."""
+    try:
+        with open(KEY_PATH, encoding="utf-8") as f:
+            parts = f.read().split()
+    except OSError:
+        return "", PORT
+    try:
+        return parts[0], int(parts[1])
+    except (IndexError, ValueError):
+        return (parts[0] if parts else ""), PORT
+
+
+def forward(cmd, timeout=2.0):
+    """Çalışan örneğe gönder; yanıt sözlüğünü ya da (örnek yoksa) None döndür.
+
+    Portu dinleyen süreç bizim protokolümüzü konuşmuyorsa (bağlantıyı
+    kapatır, JSON dışı yanıt verir, anahtar dosyası yokken susar) örnek
+    yok sayılır.
+    """
+    key, port = read_key()
+    try:
+        sock = socket.create_connection((HOST, port), timeout=0.25)
+    except OSError:
+        return None
+    with sock:
+        sock.settimeout(timeout)
+        try:
+            sock.sendall((json.dumps({**cmd, "key": key}) + "\n").encode())
+            line = sock.makefile("r", encoding="utf-8").readline()
+        except socket.timeout:
+            if not key:
+                return None   # anahtar yazan örnek yok: yanıtsız yabancı süreç
+            # Gerçek örnek meşgul olabilir: ikinci bir örnek açılmasın
+            return {"ok": False, "msg": f"{HOST}:{port} yanıt vermedi"}
+        except OSError:
+            return None
+    try:
+        reply = json.loads(line)
+    except ValueError:
+        return None
+    return reply if isinstance(reply, dict) and "ok" in reply else None
+
+
+def print_reply(reply):
+    """Yanıtı yaz; çıkış kodunu döndür."""
+    out = sys.stdout if reply.get("ok") else sys.stderr
+    if reply.get("msg"):
+        print(reply["msg"], file=out)
+    return 0 if reply.get("ok") else 1
+
+
+def _parse_hhmm(text):
+    try:
+        h, m = (int(p) for p in text.split(":"))
+    except ValueError:
+        raise ValueError(f"HH:MM bekleniyor: {text!r}") from None
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise ValueError(f"geçersiz saat: {text!r}")
+    return h, m
+
+
+def service_command(service, cmd):
+    """Çekirdeğe ait komutlar (add / rule / snooze / list / import / ping); GUI ve
+    daemon ortak. Komut bunlardan değilse None."""
+    from datetime import datetime
+    c = cmd.get("cmd")
+    if c == "ping":
+        return {"ok": True, "msg": f"çalışıyor (pid {os.getpid()})"}
+    if c == "add":
+        h, m = _parse_hhmm(cmd["at"])
+        handle = service.add(h, m, cmd["title"], cmd["msg"], cmd["sound"])
+    elif c == "rule":
+        handle = service.add_rule(cmd["rule"], cmd["title"], cmd["msg"], cmd["sound"])
+    elif c == "snooze":
+        handle = service.snooze(minutes=cmd.get("minutes", 5))
+        if handle is None:
+            return {"ok": False, "msg": "ertelenecek alarm yok"}
+        at = datetime.fromtimestamp(handle.deadline).strftime("%H:%M")
+        return {"ok": True, "msg": f"⏰ {at} saatine ertelendi", "deadline": handle.deadline}
+    elif c == "import":
+        import importer
+        try:
+            counts = importer.import_file(service, cmd["path"], cmd.get("source"),
+                                          cmd.get("sound", True))
+        except (OSError, ValueError) as e:
+            return {"ok": False, "msg": f"içe aktarılamadı: {e}"}
+        return {"ok": True, "msg": importer.format_counts(counts), **counts}
+    elif c == "list":
+        lines = [f"{datetime.fromtimestamp(h.deadline):%Y-%m-%d %H:%M}  {h.args[0]}"
+                 for h in service.pending()]
+        return {"ok": True, "msg": "\n".join(lines) or "bekleyen alarm yok"}
+    else:
+        return None
+    at = datetime.fromtimestamp(handle.deadline).strftime("%Y-%m-%d %H:%M")
+    return {"ok": True, "msg": f"✓ {at} için eklendi", "deadline": handle.deadline}
+
+
+class CommandServer:
+    """Tek örnek kilidi + komut dinleyicisi.
+
+    `claim()` portu alabilirse sunucu döndürür (bu süreç ilk örnektir).
+    `fallback=True`: port tutuluysa (yabancı süreç) boş bir portu dinler;
+    port anahtar dosyasına yazılır, `forward` oradan bulur.
+    `serve(handler)` istekleri ayrı bir thread'de `handler(cmd) -> yanıt`
+    ile işler; handler Tk işlerini kendi thread'ine aktarmalıdır.
+    """
+
+    def __init__(self, sock, key):
+        self.sock    = sock
+        self.key     = key
+        self._thread = None
+
+    @classmethod
+    def claim(cls, port=None, fallback=False):
+        sock = cls._listen(PORT if port is None else port)
+        if sock is None and fallback:
+            sock = cls._listen(0)
+        if sock is None:
+            return None
+        key = secrets.token_hex(16)
+        tmp = KEY_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(f"{key}\n{sock.getsockname()[1]}\n")
+        if os.name != "nt":
+            os.chmod(tmp, 0o600)
+        os.replace(tmp, KEY_PATH)
+        return cls(sock, key)
+
+    @staticmethod
+    def _listen(port):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if os.name == "nt":
+            # Windows'ta SO_REUSEADDR başka sürecin portu çalmasına izin verir
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((HOST, port))
+            sock.listen(8)
+        except OSError:
+            sock.close()
+            return None
+        return sock
+
+    def serve(self, handler):
+        self._thread = threading.Thread(target=self._run, args=(handler,),
+                                        daemon=True, name="ipc")
+        self._thread.start()
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _run(self, handler):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return   # close() çağrıldı
+            with conn:
+                conn.settimeout(1.0)
+                try:
+                    line = conn.makefile("r", encoding="utf-8").readline()
+                    reply = self._handle(handler, line)
+                    conn.sendall((json.dumps(reply, ensure_ascii=False) + "\n").encode())
+                except (OSError, ValueError):   # ValueError: UTF-8 olmayan istek
+                    pass
+
+    def _handle(self, handler, line):
+        try:
+            cmd = json.loads(line)
+        except ValueError:
+            return {"ok": False, "msg": "geçersiz istek"}
+        if not isinstance(cmd, dict):
+            return {"ok": False, "msg": "geçersiz istek"}
+        if not secrets.compare_digest(str(cmd.pop("key", "")), self.key):
+            return {"ok": False, "msg": "anahtar uyuşmuyor"}
+        try:
+            return handler(cmd) or {"ok": False, "msg": f"bilinmeyen komut: {cmd.get('cmd')}"}
+        except Exception as e:
+            # Her hata yanıta döner: kabul thread'i ölürse port tutulu kalır,
+            # sonraki çağrılar yanıtsız bekler
+            return {"ok": False, "msg": str(e) or type(e).__name__}
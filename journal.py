@@ -0,0 +1,210 @@
+"""
+Focus Notifier — alarm olay günlüğü (bellek eşlemeli halka tampon)
+  • Her çalma / durdurma / erteleme 64 baytlık sabit genişlikli kayıt
+  • Dosya boyutu sabit (başlık + kapasite × kayıt); dolunca en eskinin
+    üzerine yazılır. Ekleme: mmap'e pack_into, fsync yok
+  • Okuyucu: son N kayıt, zaman aralığı (ikili arama), canlı takip (-f)
+  • Kullanım: python journal.py [-n 20] [--since 2026-10-01] [--until ...] [-f]
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+KIND_FIRE   = 1
+KIND_STOP   = 2   # çalmadan önce iptal
+KIND_SNOOZE = 3
+KIND_NAMES  = {KIND_FIRE: "çaldı", KIND_STOP: "durdu", KIND_SNOOZE: "ertelendi"}
+
+FLAG_SOUND     = 1
+FLAG_RECURRING = 2
+
+CAPACITY = 65536   # kayıt; 4 MB
+
+# Başlık: sihirli sözcük, sürüm, kayıt boyu, kapasite, yazılan toplam kayıt
+_HEADER = struct.Struct("<4sHHIQ")
+_HEADER_SIZE = 64
+_MAGIC   = b"FNJ1"
+_VERSION = 1
+# Kayıt: sıra no (1'den), olay zamanı, hedef deadline, alarm kimliği,
+# tür, bayraklar, başlığın ilk 30 baytı (UTF-8)
+_RECORD = struct.Struct("<QddqBB30s")
+_TITLE  = 30
+
+
+class Record(namedtuple("Record", "seq ts target key kind flags title")):
+    """Okunan kayıt; `late` = çalma gecikmesi (ts - hedef)."""
+
+    __slots__ = ()
+
+    @property
+    def late(self):
+        return self.ts - self.target if self.target else 0.0
+
+    def format(self):
+        at = datetime.fromtimestamp(self.ts).strftime("%Y-%m-%d %H:%M:%S")
+        if self.kind == KIND_FIRE:
+            extra = f"{self.late:+7.2f} sn"
+        elif self.kind == KIND_SNOOZE:
+            extra = f"→ {datetime.fromtimestamp(self.target):%H:%M}".ljust(10)
+        else:
+            extra = " " * 10
+        return f"{at}  {KIND_NAMES.get(self.kind, '?'):<9} {extra}  {self.title}"
+
+
+class Journal:
+    """Halka tampon günlüğü; yazma ve okuma aynı nesneden.
+
+    Ekleme sırası zaman sırasıdır (duvar saati geri atlamadıkça); aralık
+    sorguları buna dayanır. Aynı dosyayı başka bir süreç `readonly=True`
+    ile açıp yazar çalışırken okuyabilir.
+    """
+
+    def __init__(self, path, capacity=CAPACITY, readonly=False):
+        self.path     = path
+        self.readonly = readonly
+        self._lock    = threading.Lock()
+        size = _HEADER_SIZE + capacity * _RECORD.size
+        if readonly:
+            with open(path, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            fresh = not os.path.exists(path) or os.path.getsize(path) < _HEADER_SIZE
+            if not fresh:
+                with open(path, "rb") as f:
+                    magic, ver, rsize, cap, _ = _HEADER.unpack(f.read(_HEADER.size))
+                # Başka biçim ya da kapasite: eski dosya yeniden başlatılır
+                fresh = (magic, ver, rsize, cap) != (_MAGIC, _VERSION, _RECORD.size,
+                                                     capacity)
+            with open(path, "w+b" if fresh else "r+b") as f:
+                if fresh:
+                    f.truncate(size)
+                    f.write(_HEADER.pack(_MAGIC, _VERSION, _RECORD.size, capacity, 0))
+                    f.flush()
+                self._mm = mmap.mmap(f.fileno(), size)
+        magic, ver, rsize, cap, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or rsize != _RECORD.size:
+            self._mm.close()
+            raise ValueError(f"günlük dosyası değil: {path}")
+        self.capacity = cap
+
+    @property
+    def total(self):
+        """Bugüne dek yazılan kayıt sayısı (ezilenler dahil)."""
+        return _HEADER.unpack_from(self._mm, 0)[4]
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def close(self):
+        self._mm.close()
+
+    # ── Yazma ──────────────────────────────────────
+    def append(self, kind, title="", target=0.0, key=-1, flags=0, ts=None):
+        """Kayıt ekle; sıra numarasını döndür. Önce kayıt, sonra başlıktaki
+        sayaç yazılır: okuyucu yarım kayıt görmez."""
+        ts = time.time() if ts is None else ts
+        # Karakter sınırında kes: yarım kalan çok baytlı harf atılır
+        raw = title.encode("utf-8")[:_TITLE].decode("utf-8", "ignore").encode("utf-8")
+        with self._lock:
+            mm = self._mm
+            seq = _HEADER.unpack_from(mm, 0)[4] + 1
+            off = _HEADER_SIZE + (seq - 1) % self.capacity * _RECORD.size
+            _RECORD.pack_into(mm, off, seq, ts, target or 0.0,
+                              -1 if key is None else key, kind, flags, raw)
+            struct.pack_into("<Q", mm, _HEADER.size - 8, seq)
+        return seq
+
+    # ── Okuma ──────────────────────────────────────
+    def _read(self, seq):
+        """Sıra numarasındaki kayıt; üzerine yazılmışsa None."""
+        off = _HEADER_SIZE + (seq - 1) % self.capacity * _RECORD.size
+        rec = _RECORD.unpack_from(self._mm, off)
+        if rec[0] != seq:
+            return None
+        title = rec[6].rstrip(b"\0").decode("utf-8", "ignore")
+        return Record(*rec[:6], title)
+
+    def _ts(self, seq):
+        off = _HEADER_SIZE + (seq - 1) % self.capacity * _RECORD.size
+        return struct.unpack_from("<d", self._mm, off + 8)[0]
+
+    def _bounds(self):
+        total = self.total
+        return max(1, total - self.capacity + 1), total   # ilk, son sıra no
+
+    def records(self, since_seq=0):
+        """`since_seq`'ten sonraki kayıtlar, eskiden yeniye."""
+        first, last = self._bounds()
+        for seq in range(max(first, since_seq + 1), last + 1):
+            rec = self._read(seq)
+            if rec is not None:
+                yield rec
+
+    def tail(self, n=20):
+        _, last = self._bounds()
+        return list(self.records(last - n))
+
+    def between(self, t0=None, t1=None):
+        """t0 <= ts < t1 kayıtları; başlangıç ikili aramayla bulunur."""
+        first, last = self._bounds()
+        lo, hi = first, last + 1
+        if t0 is not None:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._ts(mid) < t0:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        for rec in self.records(lo - 1):
+            if t1 is not None and rec.ts >= t1:
+                break
+            yield rec
+
+    def follow(self, since_seq=None, interval=0.5):
+        """Yeni kayıtları geldikçe üret (tail -f)."""
+        seq = self.total if since_seq is None else since_seq
+        while True:
+            for rec in self.records(seq):
+                seq = rec.seq
+                yield rec
+            if self.total == seq:
+                time.sleep(interval)
+
+
+def _parse_when(text):
+    return datetime.fromisoformat(text).timestamp()
+
+
+if __name__ == "__main__":
+    import argparse
+    from core import JOURNAL_PATH
+    p = argparse.ArgumentParser(description="Alarm olay günlüğü")
+    p.add_argument("-n", type=int, default=20, help="son N kayıt")
+    p.add_argument("--since", type=_parse_when, help="YYYY-MM-DD[ HH:MM]")
+    p.add_argument("--until", type=_parse_when)
+    p.add_argument("-f", "--follow", action="store_true", help="yeni kayıtları izle")
+    args = p.parse_args()
+    try:
+        j = Journal(JOURNAL_PATH, readonly=True)
+    except (OSError, ValueError) as e:
+        sys.exit(f"günlük açılamadı: {e}")
+    if args.since is not None or args.until is not None:
+        recs = j.between(args.since, args.until)
+    else:
+        recs = j.tail(args.n)
+    last = 0
+    for rec in recs:
+        print(rec.format())
+        last = rec.seq
+    if args.follow:
+        try:
+            for rec in j.follow(last or None):
+                print(rec.format(), flush=True)
+        except KeyboardInterrupt:
+            pass
@@ -2,316 +2,188 @@
 Focus Notifier — v3
   • Sekme 1: Bildirim + geri sayım + isteğe bağlı sesli alarm
   • Sekme 2: Kronometre
+  • Sekme 3: Görev kronometreleri (çok sayıda, tek ortak tick)
+  • Sekme 4: Yaklaşan alarmlar (sanal liste, saniyelik toplu geri sayım)
   • Saat seçici: Scroll / sürükle tarzı drum-roll picker
   • Sistem tepsisi desteği
+  • Tek örnek: ikinci çağrı komutunu çalışan örneğe iletir (instance.py)
 """
 
+import startup   # açılış ölçümü en erken başlasın
+import sys
+import instance
+# Zaten çalışan bir örnek varsa komutu ilet ve Tk'yi hiç yüklemeden çık
+_command = instance.parse_command(sys.argv[1:])
+_reply = instance.forward(_command)
+ipc = None
+if _reply is None:
+    ipc = instance.CommandServer.claim()
+    if ipc is None:   # aynı anda açılan diğer örnek portu kaptı
+        _reply = instance.forward(_command)
+    if ipc is None and _reply is None:
+        # Portu yabancı bir süreç tutuyor: başka porttan normal açılış
+        ipc = instance.CommandServer.claim(fallback=True)
+        if ipc is None:
+            _reply = {"ok": False, "msg": f"{instance.HOST}:{instance.PORT} kullanımda"}
+if _reply is not None:
+    sys.exit(instance.print_reply(_reply))
+import uiprof
+if uiprof.ENABLED:
+    uiprof.install()   # Tk geri çağrıları sarılmadan önce
 import tkinter as tk
 from tkinter import font as tkfont
 from datetime import datetime
 import threading
-import time
 import math
-import wave, struct, os, tempfile
-import pystray
-from PIL import Image, ImageDraw
-from winotify import Notification
-
-# ══════════════════════════════════════════════════
-#  RENK PALETİ — Koyu Saat / Terminal Estetiği
-# ══════════════════════════════════════════════════
-BG       = "#0D0D14"
-PANEL    = "#13131F"
-CARD     = "#18182A"
-CARD2    = "#1F1F35"
-BORDER   = "#272742"
-ACCENT   = "#00D4FF"   # siyan
-ACCENT2  = "#FF4F8B"   # pembe-kırmızı
-GREEN    = "#00FFB2"
-AMBER    = "#FFB830"
-TEXT     = "#E8EAF6"
-SUBTEXT  = "#525278"
-DIM      = "#2A2A44"
-
-F_MONO   = ("Consolas", 11)
-F_MONO_L = ("Consolas", 36, "bold")
-F_MONO_M = ("Consolas", 22, "bold")
-F_MONO_S = ("Consolas", 13, "bold")
-F_UI     = ("Segoe UI", 9)
-F_UI_B   = ("Segoe UI Semibold", 9)
-F_UI_T   = ("Segoe UI Semibold", 15)
-F_SM     = ("Segoe UI", 8)
-
-# ══════════════════════════════════════════════════
-#  SES — WAV üret + çal (çoklu yöntem)
-# ══════════════════════════════════════════════════
-def generate_beep_wav(path, freq=880, duration=0.3, volume=0.9, repeat=6):
-    """Sinüs dalgası tabanlı alarm sesi üret."""
-    sample_rate = 44100
-    n = int(sample_rate * duration)
-    silence = int(sample_rate * 0.07)
-    with wave.open(path, 'w') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        for _ in range(repeat):
-            for i in range(n):
-                env = 1.0
-                if i < n * 0.1:
-                    env = i / (n * 0.1)
-                elif i > n * 0.9:
-                    env = (n - i) / (n * 0.1)
-                val = int(32767 * volume * env *
-                          math.sin(2 * math.pi * freq * i / sample_rate))
-                wf.writeframes(struct.pack('<h', val))
-            for _ in range(silence):
-                wf.writeframes(struct.pack('<h', 0))
-
-# Betik ile aynı klasöre kaydet (temp silinirse sorun olmasın)
-_app_dir   = os.path.dirname(os.path.abspath(__file__))
-_beep_path = os.path.join(_app_dir, "fn_alarm.wav")
-generate_beep_wav(_beep_path)
-
-
-def _play_via_powershell(path):
-    """PowerShell SoundPlayer ile senkron çal — en güvenilir yöntem."""
-    import subprocess
-    ps_cmd = (
-        f"$p = New-Object System.Media.SoundPlayer('{path}');"
-        f"$p.PlaySync();"
-    )
-    subprocess.Popen(
-        ["powershell", "-WindowStyle", "Hidden", "-Command", ps_cmd],
-        creationflags=0x08000000   # CREATE_NO_WINDOW
-    )
-
-
-def _play_via_winsound(path):
-    import winsound
-    winsound.PlaySound(
-        path,
-        winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT
-    )
-
-
-def play_alarm():
-    """Alarm sesini ayrı thread'de çal; birincil başarısız olursa fallback."""
-    def _run():
-        try:
-            _play_via_powershell(_beep_path)
-        except Exception:
-            try:
-                _play_via_winsound(_beep_path)
-            except Exception:
-                pass
-    threading.Thread(target=_run, daemon=True).start()
+import time
+import os
+from bridge import BridgeTimeout, EventBridge
+from clock import SYSTEM
+from core import HISTORY_DIR, JOURNAL_PATH, STORE_PATH, AlarmService
+from history import History
+from journal import Journal
+import metrics
+from paths import DATA_DIR
+from store import AlarmStore
+from scheduler import PendingIndex
+from footprint import ModeMeter
+from frameclock import FrameClock
+from stopwatch import Stopwatch, StopwatchBank, format_sw
+from tray import MENU_SLOTS, Tray, next_change
+from theme import (BG, PANEL, CARD, CARD2, BORDER, ACCENT, ACCENT2, GREEN,
+                   AMBER, TEXT, SUBTEXT, DIM, F_MONO, F_UI, F_UI_B, F_SM)
+from widgets import AlarmListView, DrumPicker, LapListView, StopwatchRing, TimerListView
+# pystray / PIL / winotify ilk kullanımda yüklenir (startup.lazy_import)
+startup.mark("importlar")
 
 # ══════════════════════════════════════════════════
 #  GLOBAL DURUM
 # ══════════════════════════════════════════════════
-running       = False
-tray_icon     = None
+alarm_handle  = None   # aktif alarmın Scheduler handle'ı
+tray          = None   # tray.Tray — pencere ilk kapatılınca kurulur
 root          = None
 alarm_enabled = None   # BooleanVar — pencere oluşturulunca set edilecek
+# Zamana bağlı her bileşen bu saati kullanır (clock.py); UI kare süresi
+# ölçümleri gerçek perf_counter ile kalır
+CLOCK = SYSTEM
+
+# Zamanlama / bildirim / ses çekirdekte (core.py); UI sadece dinler
+history = History(HISTORY_DIR)
+service = AlarmService(store=AlarmStore(STORE_PATH), history=history,
+                       journal=Journal(JOURNAL_PATH), clock=CLOCK)
+# Worker thread'leri (scheduler, tepsi, IPC, içe aktarma) Tk'ye dokunmaz;
+# olaylarını köprüye bırakır, Tk tarafı toplu işler (bridge.py)
+service.listeners.append(lambda handle: bridge.post("fired", handle))
 
 # ══════════════════════════════════════════════════
 #  TRAY
 # ══════════════════════════════════════════════════
-def create_tray_image():
-    img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
-    d.ellipse([2, 2, 62, 62], fill="#00D4FF")
-    d.ellipse([10, 10, 54, 54], outline="#0D0D14", width=4)
-    d.line([32, 16, 32, 32], fill="#0D0D14", width=3)
-    d.line([32, 32, 46, 42], fill="#0D0D14", width=3)
-    return img
-
 def _show_window():
     root.deiconify(); root.lift(); root.focus_force()
+    # Arka plandan dönüş: saat / geri sayım hemen tazelenir, zincirler yeniden kurulur
+    frame_clock.restore()
+    bridge.set_interval(BRIDGE_MS)
+    mode_meter.switch("ön plan")
+    page_refresh()
 
 def show_window(icon=None, item=None):
-    root.after(0, _show_window)
+    bridge.post("show")
+
+UIPROF_PATH = os.path.join(DATA_DIR, "fn_uiprof.txt")
+
+def dump_ui_profile(event=None):
+    """--profile-ui açıkken geri çağrı profilini dosyaya yaz."""
+    if uiprof.profile is None:
+        return
+    path = uiprof.profile.dump(UIPROF_PATH)
+    # Toast'ta en yavaş geri çağrılar; tam tablo dosyada
+    service.notifier.submit(f"UI profili → {os.path.basename(path)}",
+                            "\n".join(uiprof.profile.brief_lines()))
 
 def quit_app(icon=None, item=None):
-    global running
-    running = False
-    if tray_icon: tray_icon.stop()
-    root.after(0, root.destroy)
-
-def setup_tray():
-    global tray_icon
-    menu = pystray.Menu(
-        pystray.MenuItem("Göster", show_window, default=True),
-        pystray.MenuItem("Çıkış",  quit_app)
-    )
-    tray_icon = pystray.Icon("FocusNotifier", create_tray_image(), "Focus Notifier", menu)
-    tray_icon.run()
+    bridge.post("quit")
+
+def _quit_app():
+    if uiprof.profile is not None:
+        uiprof.profile.dump(UIPROF_PATH)
+    record_sw_session()
+    for i in range(len(timers)):
+        record_sw_session(timers.elapsed(i))
+    ipc.close()
+    service.stop()
+    if tray: tray.stop()
+    bridge.stop()
+    root.destroy()
+
+_tray_after   = None
+_tray_version = None
+_tray_lines   = []
+_tray_wakeups = 0
+
+def tray_refresh():
+    """Tepsi simgesini / menüsünü güncelle; bir sonraki kare değişimine kur.
+
+    Saniyelik yoklama yok: simge en fazla dakikada bir (son dakikada bir
+    kez) değişir; alarm / kronometre olayları bu fonksiyonu ayrıca çağırır.
+    """
+    global _tray_after, _tray_version, _tray_lines, _tray_wakeups
+    if tray is None:
+        return
+    _tray_wakeups += 1
+    if _tray_after is not None:
+        root.after_cancel(_tray_after)
+        _tray_after = None
+    sched = service.scheduler
+    if sched.version != _tray_version:
+        _tray_version = sched.version
+        today = CLOCK.now().date()
+        _tray_lines = []
+        for h in sched.upcoming(MENU_SLOTS):
+            at = datetime.fromtimestamp(h.deadline)
+            fmt = "%H:%M" if at.date() == today else "%a %H:%M"
+            _tray_lines.append(f"{at.strftime(fmt)}  {h.args[0]}")
+    nd = sched.next_deadline()
+    remaining = None if nd is None else nd - CLOCK.time()
+    tray.update(remaining, stopwatch.running or timers.n_running > 0, _tray_lines)
+    wait = next_change(remaining)
+    if wait is not None:
+        _tray_after = root.after(int(wait * 1000) + 20, tray_refresh)
 
 def on_close():
+    """Tepsiye küçül: arka plan kipi — sadece scheduler ve tepsi uyanır."""
+    global tray
     root.withdraw()
-    if tray_icon is None:
-        threading.Thread(target=setup_tray, daemon=True).start()
+    frame_clock.suspend()   # saat, geri sayım, kronometre kareleri durur
+    bridge.set_interval(BRIDGE_MS, BRIDGE_BG_MS)
+    mode_meter.switch("arka plan")
+    if tray is None:
+        tray = Tray(show_window, quit_app, extra_items=(
+            ("UI profilini kaydet", lambda icon, item: bridge.post("dump_profile"),
+             uiprof.ENABLED),))
+        tray.start()
+    tray_refresh()
 
 # ══════════════════════════════════════════════════
-#  BİLDİRİM & ZAMANLAYICI
+#  BİLDİRİM
 # ══════════════════════════════════════════════════
-def send_notification(title, message):
-    toast = Notification(app_id="FocusNotifier", title=title, msg=message, duration="short")
-    toast.show()
-
-def scheduler_thread(target_h, target_m, title, message, sound):
-    global running
-    target_str = f"{target_h:02d}:{target_m:02d}"
-    while running:
-        now = datetime.now()
-        if now.strftime("%H:%M") == target_str:
-            send_notification(title, message)
-            if sound:
-                play_alarm()
-            running = False
-            # UI'yi ana thread'den güncelle
-            root.after(0, _alarm_fired)
-            return
-        time.sleep(1)
-
-
-def _alarm_fired():
+def _alarm_fired(handle):
     """Alarm çaldıktan sonra UI'yi sıfırla."""
+    global alarm_handle
+    tray_refresh()
+    if handle is not alarm_handle:
+        return   # durdurulup yeniden başlatılmış eski alarm
+    if handle.active:
+        # Tekrarlı alarm: servis bir sonraki deadline'ı zaten kurdu
+        at = datetime.fromtimestamp(handle.deadline).strftime("%a %H:%M")
+        set_status0(f"✓ Alarm çaldı — sonraki {at}", GREEN)
+        start_countdown(handle)
+        return
+    alarm_handle = None
     set_status0("✓ Alarm çaldı!", GREEN)
     start_btn0.config(state="normal", bg=ACCENT)
     stop_btn0.config(state="disabled", bg=DIM)
     cd_lbl.config(text="ALARM ÇALDI", fg=GREEN)
 
-# ══════════════════════════════════════════════════
-#  DRUM-ROLL PICKER (kaydırılabilir saat/dakika)
-# ══════════════════════════════════════════════════
-class DrumPicker(tk.Canvas):
-    """Dikey kaydırmalı drum-roll sayı seçici."""
-
-    ITEM_H = 38
-    VISIBLE = 3   # görünen satır sayısı (tek sayı olmalı)
-
-    def __init__(self, master, values, init_val, fg=ACCENT, **kw):
-        h = self.ITEM_H * self.VISIBLE
-        super().__init__(master, width=70, height=h,
-                         bg=CARD2, highlightthickness=0, **kw)
-        self._values = values
-        self._fg     = fg
-        self._idx    = values.index(init_val) if init_val in values else 0
-        self._drag_y = None
-        self._offset = 0.0   # piksel kayma (animasyon için)
-
-        self.bind("<MouseWheel>",      self._on_wheel)
-        self.bind("<ButtonPress-1>",   self._on_press)
-        self.bind("<B1-Motion>",       self._on_drag)
-        self.bind("<ButtonRelease-1>", self._on_release)
-
-        self._draw()
-
-    # ── Çizim ──────────────────────────────────────
-    def _draw(self):
-        self.delete("all")
-        W = 70
-        H = self.ITEM_H * self.VISIBLE
-        mid = H // 2
-
-        # Arka plan
-        self.create_rectangle(0, 0, W, H, fill=CARD2, outline="")
-
-        # Seçili satır vurgusu
-        self.create_rectangle(0, mid - self.ITEM_H//2,
-                              W, mid + self.ITEM_H//2,
-                              fill=CARD, outline=ACCENT, width=1)
-
-        # Sayılar
-        n = len(self._values)
-        half = self.VISIBLE // 2
-        for rel in range(-half - 1, half + 2):
-            real_idx = (self._idx + rel) % n
-            val = self._values[real_idx]
-            y = mid + rel * self.ITEM_H + self._offset
-            dist = abs(rel - self._offset / self.ITEM_H)
-            if dist < 0.1:
-                col = self._fg
-                fsize = 22
-                fw = "bold"
-            elif dist < 1.2:
-                # Aradaki geçiş
-                alpha = max(0, 1 - dist)
-                col = self._blend(self._fg, SUBTEXT, alpha)
-                fsize = int(13 + 9 * max(0, 1 - dist))
-                fw = "normal"
-            else:
-                col = SUBTEXT
-                fsize = 13
-                fw = "normal"
-            self.create_text(W // 2, y,
-                             text=f"{val:02d}",
-                             font=("Consolas", fsize, fw),
-                             fill=col, anchor="center")
-
-        # Üst/alt fade maskesi
-        for i, y0 in [(0, 0), (1, mid + self.ITEM_H//2)]:
-            fade_h = self.ITEM_H
-            fill = CARD2 if i == 0 else CARD2
-            end_y = y0 + fade_h if i == 0 else y0
-            start_y = y0 if i == 0 else y0 + fade_h
-            # Basit dikdörtgen mask
-            if i == 0:
-                self.create_rectangle(0, 0, W, mid - self.ITEM_H//2,
-                                      fill=CARD2, outline="", stipple="")
-            else:
-                self.create_rectangle(0, mid + self.ITEM_H//2, W, H,
-                                      fill=CARD2, outline="")
-
-        # Üst / Alt çizgi
-        self.create_line(0, mid - self.ITEM_H//2, W, mid - self.ITEM_H//2,
-                         fill=ACCENT, width=1)
-        self.create_line(0, mid + self.ITEM_H//2, W, mid + self.ITEM_H//2,
-                         fill=ACCENT, width=1)
-
-    @staticmethod
-    def _blend(hex1, hex2, t):
-        r1,g1,b1 = int(hex1[1:3],16), int(hex1[3:5],16), int(hex1[5:7],16)
-        r2,g2,b2 = int(hex2[1:3],16), int(hex2[3:5],16), int(hex2[5:7],16)
-        r = int(r1*t + r2*(1-t))
-        g = int(g1*t + g2*(1-t))
-        b = int(b1*t + b2*(1-t))
-        return f"#{r:02X}{g:02X}{b:02X}"
-
-    # ── Etkileşim ──────────────────────────────────
-    def _on_wheel(self, e):
-        delta = -1 if e.delta > 0 else 1
-        self._idx = (self._idx + delta) % len(self._values)
-        self._draw()
-
-    def _on_press(self, e):
-        self._drag_y = e.y
-        self._base_idx = self._idx
-
-    def _on_drag(self, e):
-        if self._drag_y is None: return
-        dy = self._drag_y - e.y
-        steps = int(dy / self.ITEM_H)
-        self._idx = (self._base_idx + steps) % len(self._values)
-        self._offset = -(dy % self.ITEM_H - (self.ITEM_H if dy % self.ITEM_H > self.ITEM_H/2 else 0))
-        self._draw()
-
-    def _on_release(self, e):
-        self._offset = 0.0
-        self._drag_y = None
-        self._draw()
-
-    # ── Değer okuma ────────────────────────────────
-    def get(self):
-        return self._values[self._idx]
-
-    def set_val(self, v):
-        if v in self._values:
-            self._idx = self._values.index(v)
-            self._draw()
-
-
 # ══════════════════════════════════════════════════
 #  SEKMELİ PANEL sistemi (sade, özel çizim)
 # ══════════════════════════════════════════════════
@@ -389,6 +261,22 @@ root.configure(bg=PANEL)
 root.protocol("WM_DELETE_WINDOW", on_close)
 
 alarm_enabled = tk.BooleanVar(value=True)
+# Tekrar seçenekleri: (etiket, kural gün ifadesi); None = bir kez
+REPEAT_MODES = (("Bir kez", None), ("Her gün", "daily"), ("Hafta içi", "weekdays"))
+repeat_idx = 0
+# Tüm periyodik UI güncellemeleri bu saate abone olur
+frame_clock = FrameClock(root, CLOCK.monotonic, CLOCK.time)
+# Thread'ler arası olaylar; tepsideyken boş pompa aralığı BRIDGE_BG_MS'e
+# dek uzar (boşta dakikada ~60 uyanma), olay gelince BRIDGE_MS'e döner
+BRIDGE_MS    = 100
+BRIDGE_BG_MS = 1000
+bridge = EventBridge(root, BRIDGE_MS)
+bridge.on("fired", _alarm_fired)   # restore sırasında çalan alarmlar için erken
+# Uyanma = UI kare saati + köprü pompası + scheduler thread'i + tepsi zamanlayıcısı
+mode_meter  = ModeMeter(lambda: frame_clock.wakeups + bridge.pumps
+                        + service.scheduler.wakeups + _tray_wakeups, "ön plan")
+service.start()   # depodaki alarmlar geri yüklenir
+startup.mark("Tk kökü")
 
 # ══════════════════════════════════════════════════
 #  BAŞLIK BAR
@@ -403,10 +291,9 @@ tk.Label(header, text="⏱  FOCUS NOTIFIER",
 clock_lbl = tk.Label(header, font=("Consolas", 13, "bold"), bg=BG, fg=SUBTEXT)
 clock_lbl.place(x=340, y=16)
 
-def update_clock():
-    clock_lbl.config(text=datetime.now().strftime("%H:%M:%S"))
-    root.after(1000, update_clock)
-update_clock()
+def update_clock(now):
+    clock_lbl.config(text=datetime.fromtimestamp(now).strftime("%H:%M:%S"))
+clock_sub = frame_clock.subscribe(update_clock, 1000)
 
 # Ince çizgi
 tk.Frame(root, bg=ACCENT, height=1).pack(fill="x")
@@ -414,62 +301,44 @@ tk.Frame(root, bg=ACCENT, height=1).pack(fill="x")
 # ══════════════════════════════════════════════════
 #  SEKME SİSTEMİ
 # ══════════════════════════════════════════════════
-tab_labels = ["  🔔  BİLDİRİM  ", "  ⏱  KRONOMETRİ  "]
+tab_labels = ["🔔 BİLDİRİM", "⏱ KRONOMETRİ", "⏲ GÖREVLER", "☰ ALARMLAR"]
 
 content_frame = tk.Frame(root, bg=CARD)
 content_frame.pack(fill="both", expand=True)
 
 pages = {}
+current_tab = 0
+page_builders = {}   # idx -> sayfa widget'larını kuran fonksiyon
+_built = set()
+
+def ensure_page(idx):
+    # Sayfa widget'ları ilk gösterimde (ya da ilk uzaktan komutta) kurulur
+    if idx not in _built:
+        _built.add(idx)
+        page_builders[idx](pages[idx])
+        startup.mark(f"sayfa {idx} kuruldu")
 
 def switch_tab(idx):
+    global current_tab
+    ensure_page(idx)
     for i, f in pages.items():
         f.place_forget()
     pages[idx].place(x=0, y=0, relwidth=1, relheight=1)
+    current_tab = idx
+    page_refresh()
 
 tab_bar = TabBar(root, tab_labels, switch_tab)
 tab_bar.pack(fill="x")
 tab_bar.update_idletasks()
 
 # ── SAYFA ÇERÇEVELERI ──
-for i in range(2):
+for i in range(len(tab_labels)):
     f = tk.Frame(content_frame, bg=CARD)
     pages[i] = f
 
-switch_tab(0)   # varsayılan
-
 # ══════════════════════════════════════════════════
 #  SAYFA 0 — BİLDİRİM
 # ══════════════════════════════════════════════════
-pg0 = pages[0]
-
-# ── Saat Seçici ─────────────────────────────────
-lbl_frame = tk.Frame(pg0, bg=CARD)
-lbl_frame.place(x=0, y=12, width=480)
-tk.Label(lbl_frame, text="ALARM SAATİNİ SEÇ",
-         font=("Consolas", 9), bg=CARD, fg=SUBTEXT).pack()
-
-picker_outer = tk.Frame(pg0, bg=CARD)
-picker_outer.place(x=0, y=34, width=480)
-
-# Picker kapsayıcı (ortala)
-picker_wrap = tk.Frame(picker_outer, bg=CARD)
-picker_wrap.pack(anchor="center")
-
-hour_picker   = DrumPicker(picker_wrap, list(range(24)),
-                           datetime.now().hour,   fg=ACCENT)
-sep_lbl = tk.Label(picker_wrap, text=":", font=("Consolas", 32, "bold"),
-                   bg=CARD, fg=ACCENT)
-minute_picker = DrumPicker(picker_wrap, list(range(60)),
-                           datetime.now().minute, fg=ACCENT2)
-
-hour_picker.grid(row=0, column=0, padx=8)
-sep_lbl.grid(row=0, column=1, pady=4)
-minute_picker.grid(row=0, column=2, padx=8)
-
-tk.Label(picker_wrap, text="saat", font=F_SM, bg=CARD, fg=SUBTEXT).grid(row=1,column=0)
-tk.Label(picker_wrap, text="dk",   font=F_SM, bg=CARD, fg=SUBTEXT).grid(row=1,column=2)
-
-# ── Başlık & Mesaj ─────────────────────────────
 def field0(parent, label, var, y):
     tk.Label(parent, text=label, font=("Consolas", 8),
              bg=CARD, fg=SUBTEXT).place(x=28, y=y)
@@ -480,30 +349,9 @@ def field0(parent, label, var, y):
     e.place(x=28, y=y+17, width=424, height=32)
     return e
 
-title_var = tk.StringVar(value="Mola Zamanı!")
-msg_var   = tk.StringVar(value="Kalk, biraz gez, su iç! 💧")
-field0(pg0, "BİLDİRİM BAŞLIĞI", title_var, 182)
-field0(pg0, "MESAJ",            msg_var,   235)
-
-# ── Sesli alarm seçeneği ───────────────────────
-alarm_row = tk.Frame(pg0, bg=CARD)
-alarm_row.place(x=28, y=282)
-
-alarm_cb = tk.Checkbutton(alarm_row, text="  Sesli alarm çal",
-                          variable=alarm_enabled,
-                          font=F_UI, bg=CARD, fg=TEXT,
-                          activebackground=CARD, activeforeground=ACCENT,
-                          selectcolor=CARD2,
-                          highlightthickness=0, bd=0, cursor="hand2")
-alarm_cb.pack(side="left")
-
-# ── Başlat / Durdur ────────────────────────────
-btn_row0 = tk.Frame(pg0, bg=CARD)
-btn_row0.place(x=28, y=314)
-
 def do_start():
-    global running
-    if running:
+    global alarm_handle
+    if alarm_handle is not None and alarm_handle.active:
         set_status0("Zaten çalışıyor!", AMBER); return
     h = hour_picker.get()
     m = minute_picker.get()
@@ -511,211 +359,464 @@ def do_start():
     msg = msg_var.get().strip()
     if not ttl or not msg:
         set_status0("Başlık/mesaj boş!", ACCENT2); return
-    running = True
     sound = alarm_enabled.get()
-    threading.Thread(target=scheduler_thread,
-                     args=(h, m, ttl, msg, sound), daemon=True).start()
-    set_status0(f"✓ {h:02d}:{m:02d} için aktif", GREEN)
+    label, days = REPEAT_MODES[repeat_idx]
+    if days is None:
+        alarm_handle = service.add(h, m, ttl, msg, sound)
+    else:
+        alarm_handle = service.add_rule(f"{days} {h:02d}:{m:02d}", ttl, msg, sound)
+    extra = "" if days is None else f" ({label.lower()})"
+    set_status0(f"✓ {h:02d}:{m:02d} için aktif{extra}", GREEN)
     start_btn0.config(state="disabled", bg=DIM)
     stop_btn0.config(state="normal",   bg=ACCENT2)
-    start_countdown(h, m)
+    start_countdown(alarm_handle)
+    tray_refresh()
 
 def do_stop():
-    global running
-    running = False
+    global alarm_handle
+    if alarm_handle is not None:
+        service.cancel(alarm_handle)
+        alarm_handle = None
     set_status0("Durduruldu.", AMBER)
     start_btn0.config(state="normal", bg=ACCENT)
     stop_btn0.config(state="disabled", bg=DIM)
     cd_lbl.config(text="--:--:--", fg=SUBTEXT)
-
-start_btn0 = styled_btn(btn_row0, "▶  BAŞLAT", ACCENT, BG, do_start)
-start_btn0.pack(side="left", ipadx=18, ipady=8)
-
-stop_btn0 = styled_btn(btn_row0, "■  DURDUR", DIM, SUBTEXT, do_stop)
-stop_btn0.pack(side="left", padx=(12,0), ipadx=18, ipady=8)
-stop_btn0.config(state="disabled")
-
-# ── Durum mesajı ───────────────────────────────
-status_row0 = tk.Frame(pg0, bg=CARD)
-status_row0.place(x=28, y=362)
-status_dot0 = tk.Label(status_row0, text="●", font=F_UI, bg=CARD, fg=SUBTEXT)
-status_dot0.pack(side="left", padx=(0,4))
-status_lbl0 = tk.Label(status_row0, text="Bekliyor...", font=F_UI, bg=CARD, fg=SUBTEXT)
-status_lbl0.pack(side="left")
+    tray_refresh()
+
+def cycle_repeat():
+    global repeat_idx
+    repeat_idx = (repeat_idx + 1) % len(REPEAT_MODES)
+    repeat_btn.config(text=f"↻ {REPEAT_MODES[repeat_idx][0]}")
+
+def import_calendar():
+    """.ics / .csv seç; içe aktarma arka planda, sonuç durum satırında."""
+    filedialog = startup.lazy_import("tkinter.filedialog")
+    path = filedialog.askopenfilename(
+        title="Takvim içe aktar",
+        filetypes=[("Takvim", "*.ics *.csv"), ("Tümü", "*.*")])
+    if not path:
+        return
+    set_status0("İçe aktarılıyor…", AMBER)
+
+    def work():
+        reply = instance.service_command(service, {"cmd": "import", "path": path})
+        bridge.post("imported", reply)
+    threading.Thread(target=work, daemon=True, name="import").start()
+
+def _import_done(reply):
+    if reply["ok"]:
+        adopt_pending()
+    set_status0(reply["msg"], GREEN if reply["ok"] else ACCENT2)
+
+def adopt_pending():
+    """En yakın bekleyen alarmı arayüze bağla (önceki oturumdan, uzaktan
+    komutla ya da içe aktarmayla gelen). Arayüzde etkin bir alarm varsa
+    geri sayımı ve Durdur hedefi değişmez."""
+    global alarm_handle
+    tray_refresh()
+    if alarm_handle is not None and alarm_handle.active:
+        return
+    nxt = service.scheduler.upcoming(1)
+    if not nxt:
+        return
+    alarm_handle = nxt[0]
+    n = len(service.scheduler)
+    at = datetime.fromtimestamp(alarm_handle.deadline).strftime("%H:%M")
+    more = f" (+{n - 1})" if n > 1 else ""
+    set_status0(f"✓ {at} için aktif{more}", GREEN)
+    start_btn0.config(state="disabled", bg=DIM)
+    stop_btn0.config(state="normal",   bg=ACCENT2)
+    start_countdown(alarm_handle)
 
 def set_status0(msg, color):
     status_dot0.config(fg=color)
     status_lbl0.config(text=msg, fg=color)
 
-# ── GERİ SAYIM ─────────────────────────────────
-cd_outer = tk.Frame(pg0, bg=CARD2, highlightthickness=1, highlightbackground=BORDER)
-cd_outer.place(x=28, y=388, width=424, height=72)
-
-tk.Label(cd_outer, text="KALAN SÜRE", font=("Consolas", 8),
-         bg=CARD2, fg=SUBTEXT).place(x=16, y=8)
-
-cd_lbl = tk.Label(cd_outer, text="--:--:--",
-                  font=("Consolas", 32, "bold"), bg=CARD2, fg=SUBTEXT)
-cd_lbl.place(x=0, y=18, width=424)
+_cd_handle = None
+
+def countdown_tick(now):
+    if _cd_handle is None or not _cd_handle.active:
+        cd_sub.pause()
+        return
+    # Deadline scheduler ile aynı kaynaktan, `now` başlık saatiyle ortak
+    diff = int(math.ceil(_cd_handle.deadline - now))
+    if diff <= 0:
+        cd_lbl.config(text="ALARM ÇALDI", fg=GREEN)
+        cd_sub.pause()
+        return
+    h = diff // 3600
+    m = (diff % 3600) // 60
+    s = diff % 60
+    cd_lbl.config(text=f"{h:02d}:{m:02d}:{s:02d}", fg=ACCENT)
+
+cd_sub = frame_clock.subscribe(countdown_tick, 1000, active=False)
+
+def start_countdown(handle):
+    global _cd_handle
+    _cd_handle = handle
+    cd_sub.pause()
+    cd_sub.resume()
+
+def build_notify_page(pg0):
+    global hour_picker, minute_picker, title_var, msg_var
+    global start_btn0, stop_btn0, status_dot0, status_lbl0, cd_lbl, repeat_btn
+
+    # ── Saat Seçici ─────────────────────────────────
+    lbl_frame = tk.Frame(pg0, bg=CARD)
+    lbl_frame.place(x=0, y=12, width=480)
+    tk.Label(lbl_frame, text="ALARM SAATİNİ SEÇ",
+             font=("Consolas", 9), bg=CARD, fg=SUBTEXT).pack()
+
+    picker_outer = tk.Frame(pg0, bg=CARD)
+    picker_outer.place(x=0, y=34, width=480)
+
+    # Picker kapsayıcı (ortala)
+    picker_wrap = tk.Frame(picker_outer, bg=CARD)
+    picker_wrap.pack(anchor="center")
+
+    now = CLOCK.now()
+    hour_picker   = DrumPicker(picker_wrap, list(range(24)),
+                               now.hour,   fg=ACCENT)
+    sep_lbl = tk.Label(picker_wrap, text=":", font=("Consolas", 32, "bold"),
+                       bg=CARD, fg=ACCENT)
+    minute_picker = DrumPicker(picker_wrap, list(range(60)),
+                               now.minute, fg=ACCENT2)
+
+    hour_picker.grid(row=0, column=0, padx=8)
+    sep_lbl.grid(row=0, column=1, pady=4)
+    minute_picker.grid(row=0, column=2, padx=8)
+
+    tk.Label(picker_wrap, text="saat", font=F_SM, bg=CARD, fg=SUBTEXT).grid(row=1,column=0)
+    tk.Label(picker_wrap, text="dk",   font=F_SM, bg=CARD, fg=SUBTEXT).grid(row=1,column=2)
+
+    # ── Başlık & Mesaj ─────────────────────────────
+    title_var = tk.StringVar(value="Mola Zamanı!")
+    msg_var   = tk.StringVar(value="Kalk, biraz gez, su iç! 💧")
+    field0(pg0, "BİLDİRİM BAŞLIĞI", title_var, 182)
+    field0(pg0, "MESAJ",            msg_var,   235)
+
+    # ── Sesli alarm seçeneği ───────────────────────
+    alarm_row = tk.Frame(pg0, bg=CARD)
+    alarm_row.place(x=28, y=282)
+
+    alarm_cb = tk.Checkbutton(alarm_row, text="  Sesli alarm çal",
+                              variable=alarm_enabled,
+                              font=F_UI, bg=CARD, fg=TEXT,
+                              activebackground=CARD, activeforeground=ACCENT,
+                              selectcolor=CARD2,
+                              highlightthickness=0, bd=0, cursor="hand2")
+    alarm_cb.pack(side="left")
+
+    repeat_btn = styled_btn(alarm_row, f"↻ {REPEAT_MODES[repeat_idx][0]}",
+                            CARD2, SUBTEXT, cycle_repeat)
+    repeat_btn.pack(side="left", padx=(24,0), ipadx=8)
+
+    styled_btn(alarm_row, "📅 İçe aktar", CARD2, SUBTEXT,
+               import_calendar).pack(side="left", padx=(8,0), ipadx=8)
+
+    # ── Başlat / Durdur ────────────────────────────
+    btn_row0 = tk.Frame(pg0, bg=CARD)
+    btn_row0.place(x=28, y=314)
+
+    start_btn0 = styled_btn(btn_row0, "▶  BAŞLAT", ACCENT, BG, do_start)
+    start_btn0.pack(side="left", ipadx=18, ipady=8)
+
+    stop_btn0 = styled_btn(btn_row0, "■  DURDUR", DIM, SUBTEXT, do_stop)
+    stop_btn0.pack(side="left", padx=(12,0), ipadx=18, ipady=8)
+    stop_btn0.config(state="disabled")
+
+    # ── Durum mesajı ───────────────────────────────
+    status_row0 = tk.Frame(pg0, bg=CARD)
+    status_row0.place(x=28, y=362)
+    status_dot0 = tk.Label(status_row0, text="●", font=F_UI, bg=CARD, fg=SUBTEXT)
+    status_dot0.pack(side="left", padx=(0,4))
+    status_lbl0 = tk.Label(status_row0, text="Bekliyor...", font=F_UI, bg=CARD, fg=SUBTEXT)
+    status_lbl0.pack(side="left")
+
+    # ── GERİ SAYIM ─────────────────────────────────
+    cd_outer = tk.Frame(pg0, bg=CARD2, highlightthickness=1, highlightbackground=BORDER)
+    cd_outer.place(x=28, y=388, width=424, height=72)
+
+    tk.Label(cd_outer, text="KALAN SÜRE", font=("Consolas", 8),
+             bg=CARD2, fg=SUBTEXT).place(x=16, y=8)
+
+    cd_lbl = tk.Label(cd_outer, text="--:--:--",
+                      font=("Consolas", 32, "bold"), bg=CARD2, fg=SUBTEXT)
+    cd_lbl.place(x=0, y=18, width=424)
+
+    # Alt bilgi
+    tk.Label(pg0, text="Kapat → sistem tepsisine küçülür",
+             font=("Consolas", 7), bg=CARD, fg=SUBTEXT).place(x=28, y=476)
+
+page_builders[0] = build_notify_page
 
-_cd_after_id = None
+# ══════════════════════════════════════════════════
+#  SAYFA 1 — KRONOMETRİ
+# ══════════════════════════════════════════════════
+stopwatch = Stopwatch(CLOCK.perf)
+sw_ring   = None   # StopwatchRing — sayfa kurulunca oluşur
 
-def start_countdown(target_h, target_m):
-    global _cd_after_id
-    if _cd_after_id:
-        root.after_cancel(_cd_after_id)
+SW_R        = 110   # yarıçap
+SW_FRAME_MS = 30    # görünürken kare aralığı
 
-    def tick():
-        global _cd_after_id
-        if not running:
-            return
-        now = datetime.now()
-        target_today = now.replace(hour=target_h, minute=target_m,
-                                   second=0, microsecond=0)
-        if target_today <= now:
-            # Yarınki alarm
-            from datetime import timedelta
-            target_today += timedelta(days=1)
-        diff = int((target_today - now).total_seconds())
-        if diff <= 0:
-            cd_lbl.config(text="ALARM ÇALDI", fg=GREEN)
-            return
-        h = diff // 3600
-        m = (diff % 3600) // 60
-        s = diff % 60
-        cd_lbl.config(text=f"{h:02d}:{m:02d}:{s:02d}", fg=ACCENT)
-        _cd_after_id = root.after(1000, tick)
+def sw_visible():
+    return current_tab == 1 and root.state() == "normal"
 
-    tick()
+def sw_tick(now=None):
+    """Kareyi çiz; sadece çalışırken ve görünürken abone kal."""
+    t = time.perf_counter()
+    sw_ring.render(stopwatch.elapsed())
+    metrics.SW_FRAME_SECONDS.observe(time.perf_counter() - t)
+    if not (stopwatch.running and sw_visible()):
+        sw_sub.pause()
 
-# Alt bilgi
-tk.Label(pg0, text="Kapat → sistem tepsisine küçülür",
-         font=("Consolas", 7), bg=CARD, fg=SUBTEXT).place(x=28, y=476)
+sw_sub = frame_clock.subscribe(sw_tick, SW_FRAME_MS, active=False)
 
-# ══════════════════════════════════════════════════
-#  SAYFA 1 — KRONOMETRİ
-# ══════════════════════════════════════════════════
-pg1 = pages[1]
-
-_sw_running  = False
-_sw_start    = 0.0
-_sw_elapsed  = 0.0
-_sw_after    = None
-_sw_laps     = []
-
-sw_display_frame = tk.Frame(pg1, bg=CARD)
-sw_display_frame.place(x=0, y=30, width=480)
-
-# Dairesel progress (canvas)
-SW_R = 110   # yarıçap
-sw_canvas = tk.Canvas(pg1, width=SW_R*2+20, height=SW_R*2+20,
-                       bg=CARD, highlightthickness=0)
-sw_canvas.place(x=480//2 - (SW_R+10), y=20)
-
-def draw_sw_circle(frac):
-    sw_canvas.delete("all")
-    cx = cy = SW_R + 10
-    r = SW_R
-    # Arka çember
-    sw_canvas.create_oval(cx-r, cy-r, cx+r, cy+r,
-                          outline=DIM, width=8)
-    # İlerleme yayı
-    if frac > 0:
-        extent = -frac * 360
-        sw_canvas.create_arc(cx-r, cy-r, cx+r, cy+r,
-                             start=90, extent=extent,
-                             outline=ACCENT, width=8, style="arc")
-    # Merkez zaman
-    sw_canvas.create_text(cx, cy, text=_format_sw(_sw_elapsed),
-                          font=("Consolas", 28, "bold"), fill=TEXT)
-    # Alt küçük metin
-    frac_txt = f"{int(frac*100):03d}%"
-    sw_canvas.create_text(cx, cy+38, text=frac_txt,
-                          font=("Consolas", 10), fill=SUBTEXT)
-
-def _format_sw(secs):
-    h = int(secs) // 3600
-    m = (int(secs) % 3600) // 60
-    s = int(secs) % 60
-    cs = int((secs - int(secs)) * 100)
-    if h:
-        return f"{h:02d}:{m:02d}:{s:02d}"
-    return f"{m:02d}:{s:02d}.{cs:02d}"
-
-def sw_tick():
-    global _sw_elapsed, _sw_after
-    if _sw_running:
-        _sw_elapsed = time.perf_counter() - _sw_start
-    frac = (_sw_elapsed % 60) / 60
-    draw_sw_circle(frac)
-    _sw_after = root.after(30, sw_tick)
+def sw_refresh():
+    """Durum ya da görünürlük değişti: son kareyi çiz, gerekirse aboneliği aç."""
+    if sw_ring is None:
+        return
+    sw_tick()
+    if stopwatch.running and sw_visible():
+        sw_sub.resume()
 
 def sw_start_stop():
-    global _sw_running, _sw_start
-    if _sw_running:
-        _sw_running = False
-        sw_ss_btn.config(text="▶  DEVAM", bg=ACCENT)
-    else:
-        _sw_running = True
-        _sw_start = time.perf_counter() - _sw_elapsed
+    if stopwatch.toggle():
         sw_ss_btn.config(text="⏸  DURDUR", bg=ACCENT2)
-        if _sw_after is None:
-            sw_tick()
+    else:
+        sw_ss_btn.config(text="▶  DEVAM", bg=ACCENT)
+    sw_refresh()
+    tray_refresh()
+
+def update_lap_stats():
+    laps = stopwatch.laps
+    if len(laps) < 2:
+        lap_stats_lbl.config(text="")
+        return
+    lap_stats_lbl.config(
+        text=f"en iyi {format_sw(laps.split(laps.best))}  •  "
+             f"en kötü {format_sw(laps.split(laps.worst))}  •  "
+             f"ort {format_sw(laps.mean())}")
 
 def sw_lap():
-    if _sw_running or _sw_elapsed > 0:
-        idx = len(_sw_laps) + 1
-        t = _format_sw(_sw_elapsed)
-        _sw_laps.append(t)
-        lap_listbox.insert(0, f"  #{idx:02d}   {t}")
+    if stopwatch.lap() is not None:
+        lap_view.refresh()
+        update_lap_stats()
+
+def record_sw_session(secs=None):
+    try:
+        history.record_session(stopwatch.elapsed() if secs is None else secs,
+                               CLOCK.time())
+    except OSError:
+        pass
 
 def sw_reset():
-    global _sw_running, _sw_elapsed, _sw_start, _sw_laps, _sw_after
-    _sw_running = False
-    _sw_elapsed = 0.0
-    _sw_laps = []
-    if _sw_after:
-        root.after_cancel(_sw_after)
-        _sw_after = None
-    draw_sw_circle(0)
-    lap_listbox.delete(0, "end")
+    record_sw_session()
+    stopwatch.reset()
+    sw_sub.pause()
+    sw_ring.render(0)
+    lap_view.refresh()
+    update_lap_stats()
     sw_ss_btn.config(text="▶  BAŞLAT", bg=ACCENT)
+    tray_refresh()
+
+def build_stopwatch_page(pg1):
+    global sw_ring, sw_ss_btn, lap_view, lap_stats_lbl
+
+    sw_display_frame = tk.Frame(pg1, bg=CARD)
+    sw_display_frame.place(x=0, y=30, width=480)
+
+    sw_canvas = tk.Canvas(pg1, width=SW_R*2+20, height=SW_R*2+20,
+                           bg=CARD, highlightthickness=0)
+    sw_canvas.place(x=480//2 - (SW_R+10), y=20)
+    sw_ring = StopwatchRing(sw_canvas, SW_R)
+
+    # Butonlar
+    sw_btn_row = tk.Frame(pg1, bg=CARD)
+    sw_btn_row.place(x=0, y=260, width=480)
+    sw_btn_inner = tk.Frame(sw_btn_row, bg=CARD)
+    sw_btn_inner.pack(anchor="center")
 
-# Butonlar
-sw_btn_row = tk.Frame(pg1, bg=CARD)
-sw_btn_row.place(x=0, y=260, width=480)
-sw_btn_inner = tk.Frame(sw_btn_row, bg=CARD)
-sw_btn_inner.pack(anchor="center")
+    sw_ss_btn  = styled_btn(sw_btn_inner, "▶  BAŞLAT", ACCENT,  BG, sw_start_stop)
+    sw_lap_btn = styled_btn(sw_btn_inner, "⚑  LAP",    CARD2, ACCENT, sw_lap)
+    sw_rst_btn = styled_btn(sw_btn_inner, "↺  SIFIRLA", DIM,  SUBTEXT, sw_reset)
 
-sw_ss_btn  = styled_btn(sw_btn_inner, "▶  BAŞLAT", ACCENT,  BG, sw_start_stop)
-sw_lap_btn = styled_btn(sw_btn_inner, "⚑  LAP",    CARD2, ACCENT, sw_lap)
-sw_rst_btn = styled_btn(sw_btn_inner, "↺  SIFIRLA", DIM,  SUBTEXT, sw_reset)
+    sw_ss_btn.pack(side="left", ipadx=16, ipady=8, padx=4)
+    sw_lap_btn.pack(side="left", ipadx=16, ipady=8, padx=4)
+    sw_rst_btn.pack(side="left", ipadx=16, ipady=8, padx=4)
 
-sw_ss_btn.pack(side="left", ipadx=16, ipady=8, padx=4)
-sw_lap_btn.pack(side="left", ipadx=16, ipady=8, padx=4)
-sw_rst_btn.pack(side="left", ipadx=16, ipady=8, padx=4)
+    # Lap listesi
+    tk.Label(pg1, text="LAP KAYITLARI", font=("Consolas", 8),
+             bg=CARD, fg=SUBTEXT).place(x=28, y=308)
+    lap_stats_lbl = tk.Label(pg1, text="", font=("Consolas", 8),
+                             bg=CARD, fg=SUBTEXT)
+    lap_stats_lbl.place(x=452, y=308, anchor="ne")
 
-# Lap listesi
-tk.Label(pg1, text="LAP KAYITLARI", font=("Consolas", 8),
-         bg=CARD, fg=SUBTEXT).place(x=28, y=308)
+    lap_frame = tk.Frame(pg1, bg=CARD2, highlightthickness=1, highlightbackground=BORDER)
+    lap_frame.place(x=28, y=326, width=424, height=140)
 
-lap_frame = tk.Frame(pg1, bg=CARD2, highlightthickness=1, highlightbackground=BORDER)
-lap_frame.place(x=28, y=326, width=424, height=140)
+    lap_scrollbar = tk.Scrollbar(lap_frame, bg=CARD2, troughcolor=CARD2,
+                                  highlightthickness=0, bd=0)
+    lap_scrollbar.pack(side="right", fill="y")
 
-lap_scrollbar = tk.Scrollbar(lap_frame, bg=CARD2, troughcolor=CARD2,
-                              highlightthickness=0, bd=0)
-lap_scrollbar.pack(side="right", fill="y")
+    # Sadece görünen satırlar çizilir (binlerce lap için sabit maliyet)
+    lap_canvas = tk.Canvas(lap_frame, bg=CARD2, highlightthickness=0, bd=0)
+    lap_canvas.pack(fill="both", expand=True)
+    lap_view = LapListView(lap_canvas, stopwatch.laps, 404, 138, lap_scrollbar)
+    lap_scrollbar.config(command=lap_view.yview)
+
+page_builders[1] = build_stopwatch_page
+
+# ══════════════════════════════════════════════════
+#  SAYFA 2 — GÖREV KRONOMETRELERİ
+# ══════════════════════════════════════════════════
+timers     = StopwatchBank(CLOCK.perf)
+timer_view = None   # TimerListView — sayfa kurulunca oluşur
+
+def timers_visible():
+    return current_tab == 2 and root.state() == "normal"
+
+def timers_tick(now=None):
+    """Tüm kronometreler için tek tick: sadece görünen satırlar çizilir."""
+    timer_view.render()
+    if not (timers.n_running and timers_visible()):
+        timers_sub.pause()
+
+timers_sub = frame_clock.subscribe(timers_tick, SW_FRAME_MS, active=False)
+
+def timers_refresh():
+    if timer_view is None:
+        return
+    timers_tick()
+    if timers.n_running and timers_visible():
+        timers_sub.resume()
+    timer_count_lbl.config(text=f"{len(timers)} kronometre  •  {timers.n_running} çalışıyor")
+
+def timer_action(i, action):
+    if action == "toggle":
+        timers.toggle(i)
+    else:
+        record_sw_session(timers.reset(i) if action == "reset" else timers.remove(i))
+    timers_refresh()
+    tray_refresh()
+
+def timer_add():
+    name = timer_name_var.get().strip() or f"Görev {len(timers) + 1}"
+    i = timers.add(name)
+    timers.start(i)
+    timer_name_var.set("")
+    if i >= timer_view.top + timer_view.rows:
+        timer_view.top = i - timer_view.rows + 1
+    timers_refresh()
+    tray_refresh()
+
+def build_timers_page(pg2):
+    global timer_view, timer_name_var, timer_count_lbl
+
+    timer_name_var = tk.StringVar()
+    tk.Label(pg2, text="GÖREV ADI", font=("Consolas", 8),
+             bg=CARD, fg=SUBTEXT).place(x=28, y=16)
+    name_entry = tk.Entry(pg2, textvariable=timer_name_var, font=F_MONO,
+                          bg=CARD2, fg=TEXT, insertbackground=ACCENT,
+                          bd=0, highlightthickness=1,
+                          highlightcolor=ACCENT, highlightbackground=BORDER)
+    name_entry.place(x=28, y=33, width=300, height=32)
+    name_entry.bind("<Return>", lambda e: timer_add())
+    styled_btn(pg2, "＋  BAŞLAT", ACCENT, BG, timer_add).place(x=340, y=33,
+                                                              width=112, height=32)
+
+    tk.Label(pg2, text="KRONOMETRELER", font=("Consolas", 8),
+             bg=CARD, fg=SUBTEXT).place(x=28, y=84)
+    timer_count_lbl = tk.Label(pg2, text="", font=("Consolas", 8),
+                               bg=CARD, fg=SUBTEXT)
+    timer_count_lbl.place(x=452, y=84, anchor="ne")
+
+    timer_frame = tk.Frame(pg2, bg=CARD2, highlightthickness=1, highlightbackground=BORDER)
+    timer_frame.place(x=28, y=102, width=424, height=364)
+    timer_scrollbar = tk.Scrollbar(timer_frame, bg=CARD2, troughcolor=CARD2,
+                                   highlightthickness=0, bd=0)
+    timer_scrollbar.pack(side="right", fill="y")
+    timer_canvas = tk.Canvas(timer_frame, bg=CARD2, highlightthickness=0, bd=0)
+    timer_canvas.pack(fill="both", expand=True)
+    timer_view = TimerListView(timer_canvas, timers, 404, 362, timer_action,
+                               timer_scrollbar)
+    timer_scrollbar.config(command=timer_view.yview)
+
+    tk.Label(pg2, text="Tıkla → başlat / duraklat  •  ↺ sıfırla  •  ✕ sil",
+             font=("Consolas", 7), bg=CARD, fg=SUBTEXT).place(x=28, y=476)
+
+page_builders[2] = build_timers_page
 
-lap_listbox = tk.Listbox(lap_frame, font=("Consolas", 10),
-                         bg=CARD2, fg=TEXT, selectbackground=BORDER,
-                         highlightthickness=0, bd=0, relief="flat",
-                         yscrollcommand=lap_scrollbar.set,
-                         activestyle="none")
-lap_listbox.pack(fill="both", expand=True)
-lap_scrollbar.config(command=lap_listbox.yview)
+# ══════════════════════════════════════════════════
+#  SAYFA 3 — YAKLAŞAN ALARMLAR
+# ══════════════════════════════════════════════════
+alarm_view  = None   # AlarmListView — sayfa kurulunca oluşur
+alarm_index = None   # PendingIndex — aynı anda; değişenler artımlı uygulanır
+
+def alarms_visible():
+    return current_tab == 3 and root.state() == "normal"
+
+def alarms_tick(now):
+    """Saniyede bir, başlık saatiyle aynı uyanmada: görünen satırların
+    geri sayımı tek geçişte. Sıralı liste yeniden kurulmaz: sadece değişen
+    handle'lar bisect ile yerleştirilir (PendingIndex)."""
+    if alarm_index.sync():
+        alarm_view.set_items(alarm_index)
+        alarm_count_lbl.config(text=f"{len(alarm_index)} bekleyen")
+    alarm_view.render(now)
+    if not alarms_visible():
+        alarms_sub.pause()
+
+alarms_sub = frame_clock.subscribe(alarms_tick, 1000, active=False)
+
+def alarms_refresh():
+    if alarm_view is not None and alarms_visible():
+        alarms_sub.resume()   # hemen bir kez çizer
+
+def alarm_cancel(handle):
+    if handle is alarm_handle:
+        do_stop()   # bildirim sekmesinin durumu da sıfırlansın
+    else:
+        service.cancel(handle)
+        tray_refresh()
+    alarms_tick(CLOCK.time())
+
+def build_alarms_page(pg3):
+    global alarm_view, alarm_index, alarm_count_lbl
+
+    tk.Label(pg3, text="YAKLAŞAN ALARMLAR", font=("Consolas", 8),
+             bg=CARD, fg=SUBTEXT).place(x=28, y=16)
+    alarm_count_lbl = tk.Label(pg3, text="", font=("Consolas", 8),
+                               bg=CARD, fg=SUBTEXT)
+    alarm_count_lbl.place(x=452, y=16, anchor="ne")
+
+    alarm_frame = tk.Frame(pg3, bg=CARD2, highlightthickness=1, highlightbackground=BORDER)
+    alarm_frame.place(x=28, y=34, width=424, height=432)
+    alarm_scrollbar = tk.Scrollbar(alarm_frame, bg=CARD2, troughcolor=CARD2,
+                                   highlightthickness=0, bd=0)
+    alarm_scrollbar.pack(side="right", fill="y")
+    alarm_canvas = tk.Canvas(alarm_frame, bg=CARD2, highlightthickness=0, bd=0)
+    alarm_canvas.pack(fill="both", expand=True)
+    alarm_view = AlarmListView(alarm_canvas, 404, 430, alarm_cancel, alarm_scrollbar,
+                               CLOCK.time)
+    alarm_scrollbar.config(command=alarm_view.yview)
+    alarm_index = PendingIndex(service.scheduler)
+    alarm_view.set_items(alarm_index)
+    alarm_count_lbl.config(text=f"{len(alarm_index)} bekleyen")
+
+    tk.Label(pg3, text="↻ tekrarlı  •  ✕ iptal",
+             font=("Consolas", 7), bg=CARD, fg=SUBTEXT).place(x=28, y=476)
+
+page_builders[3] = build_alarms_page
+
+def page_refresh():
+    """Sekme ya da pencere görünürlüğü değişti: kare aboneliklerini güncelle."""
+    sw_refresh()
+    timers_refresh()
+    alarms_refresh()
 
-# İlk çizim
-draw_sw_circle(0)
+switch_tab(0)   # varsayılan
+adopt_pending()
 
 # ══════════════════════════════════════════════════
 #  ALT DURUM ÇUBUĞU
@@ -726,4 +827,110 @@ tk.Label(footer,
          text="Kapat → sistem tepsisine küçülür  •  Arka planda çalışır",
          font=("Consolas", 7), bg=BG, fg=SUBTEXT).pack(side="left", padx=10)
 
-root.mainloop()
\ No newline at end of file
+# ── Pencere göründüğünde: ilk seferde açılış raporu ──
+_first_map = True
+
+def _on_map(e):
+    global _first_map
+    if e.widget is not root:
+        return
+    if _first_map:
+        _first_map = False
+        startup.mark("ilk pencere")
+        if startup.ENABLED:
+            startup.report()
+    page_refresh()   # simge durumundan geri dönüş
+
+root.bind("<Map>", _on_map)
+
+# ══════════════════════════════════════════════════
+#  UZAKTAN KOMUTLAR (ikinci örnek / betikler)
+# ══════════════════════════════════════════════════
+def sw_command(action):
+    ensure_page(1)
+    if action == "lap":
+        sw_lap()
+    elif action == "reset":
+        sw_reset()
+    elif action == "toggle" or (action == "start") != stopwatch.running:
+        sw_start_stop()
+
+def timer_command(action, name):
+    try:
+        i = timers.index(name)
+    except KeyError:
+        if action != "start":
+            return
+        i = timers.add(name)
+    if action == "reset" or action == "remove":
+        timer_action(i, action)
+        return
+    if action == "toggle" or (action == "start") != bool(timers.on[i]):
+        timers.toggle(i)
+    timers_refresh()
+    tray_refresh()
+
+def timer_lines():
+    return [f"{format_sw(timers.elapsed(i)):>11}  {'▶' if timers.on[i] else '⏸'}  "
+            f"{timers.names[i]}" for i in range(len(timers))]
+
+def handle_command(cmd):
+    """IPC thread'inde çağrılır: çekirdek komutları doğrudan, UI işleri köprüyle."""
+    reply = instance.service_command(service, cmd)
+    c = cmd.get("cmd")
+    if reply is not None:
+        if c in ("add", "rule", "import", "snooze") and reply["ok"]:
+            bridge.post("adopt")
+        return reply
+    if c == "show":
+        bridge.post("show")
+        return {"ok": True, "msg": "pencere gösterildi"}
+    if c == "stopwatch":
+        bridge.post("stopwatch", cmd["action"])
+        return {"ok": True, "msg": f"kronometre: {cmd['action']}"}
+    if c == "timer":
+        if cmd["action"] == "list":
+            try:
+                lines = bridge.request("timer_list",
+                                       timeout=2 * BRIDGE_BG_MS / 1000)
+            except BridgeTimeout:
+                return {"ok": False, "msg": "arayüz yanıt vermedi"}
+            return {"ok": True, "msg": "\n".join(lines) or "kronometre yok"}
+        if not cmd.get("name"):
+            return {"ok": False, "msg": "kronometre adı gerekli"}
+        bridge.post("timer", cmd["action"], cmd["name"])
+        return {"ok": True, "msg": f"{cmd['name']}: {cmd['action']}"}
+    if c == "status":
+        return {"ok": True, "msg": "\n".join(mode_meter.report_lines())}
+    return None
+
+# Tür → Tk tarafı işleyici; birleştirilenler partide bir kez çalışır
+bridge.on("show",         _show_window,    coalesce=True)
+bridge.on("quit",         _quit_app,       coalesce=True)
+bridge.on("adopt",        adopt_pending,   coalesce=True)
+bridge.on("dump_profile", dump_ui_profile, coalesce=True)
+bridge.on("imported",     _import_done)
+bridge.on("stopwatch",    sw_command)
+bridge.on("timer",        timer_command)
+bridge.on("timer_list",   timer_lines)
+bridge.start()
+
+ipc.serve(handle_command)
+if metrics.ENABLED:
+    metrics.watch_service(service)
+    metrics.REGISTRY.gauge("fn_ui_wakeups_total", "UI kare saati uyanmaları",
+                           lambda: frame_clock.wakeups, "counter")
+    metrics.REGISTRY.gauge("fn_bridge_events_total", "Köprüde işlenen olaylar",
+                           lambda: bridge.handled, "counter")
+    metrics.REGISTRY.gauge("fn_background", "Pencere tepside (1) / açık (0)",
+                           lambda: int(mode_meter.mode == "arka plan"))
+    if metrics.MetricsServer.start() is None:
+        print(f"{metrics.HOST}:{metrics.PORT} kullanımda; metrikler kapalı",
+              file=sys.stderr)
+if _command["cmd"] != "show":
+    # İlk örnek komutla açıldıysa (ör. main.py add 09:30) onu da uygula
+    root.after(0, lambda: instance.print_reply(handle_command(_command)))
+if uiprof.ENABLED:
+    root.bind_all("<Control-Shift-P>", dump_ui_profile)
+
+root.mainloop()
@@ -0,0 +1,200 @@
+"""
+Focus Notifier — sağlık metrikleri (Prometheus metin biçimi)
+  • Sayaç ve histogramlar modül düzeyinde bir kez oluşturulur; sıcak yolda
+    `inc()` bir toplama, `observe()` bisect + dizi hücresi artırmadır
+  • Uç nokta isteğe bağlı: `--metrics` ya da FN_METRICS=1 ile
+    http://127.0.0.1:47292/metrics (FN_METRICS_PORT); sadece localhost
+  • Ölçüm kapalıyken de sayaçlar güncellenir (maliyeti yok denecek kadar az);
+    sadece HTTP sunucusu açılmaz
+"""
+
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
+ENABLED = "--metrics" in sys.argv or bool(os.environ.get("FN_METRICS"))
+HOST    = "127.0.0.1"
+PORT    = int(os.environ.get("FN_METRICS_PORT", "47292"))
+
+
+class Counter:
+    __slots__ = ("name", "help", "value")
+
+    def __init__(self, name, help_):
+        self.name  = name
+        self.help  = help_
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+    def lines(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter",
+                f"{self.name} {self.value}"]
+
+
+class Histogram:
+    """Sabit kovalı histogram; kova sayıları array('Q') içinde (kümülatif
+    değil, raporda toplanır)."""
+
+    __slots__ = ("name", "help", "bounds", "counts", "sum")
+
+    def __init__(self, name, help_, bounds):
+        self.name   = name
+        self.help   = help_
+        self.bounds = tuple(bounds)
+        self.counts = array("Q", [0]) * (len(self.bounds) + 1)   # son: +Inf
+        self.sum    = 0.0
+
+    def observe(self, v):
+        self.counts[bisect_left(self.bounds, v)] += 1
+        self.sum += v
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def lines(self):
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        acc = 0
+        for le, n in zip(self.bounds, self.counts):
+            acc += n
+            out.append(f'{self.name}_bucket{{le="{le:g}"}} {acc}')
+        acc += self.counts[-1]
+        out += [f'{self.name}_bucket{{le="+Inf"}} {acc}',
+                f"{self.name}_sum {self.sum:.6f}", f"{self.name}_count {acc}"]
+        return out
+
+
+class Gauge:
+    """Değeri rapor anında `fn()` ile okunan ölçü (None → yazılmaz)."""
+
+    __slots__ = ("name", "help", "fn", "kind")
+
+    def __init__(self, name, help_, fn, kind="gauge"):
+        self.name = name
+        self.help = help_
+        self.fn   = fn
+        self.kind = kind
+
+    def lines(self):
+        try:
+            v = self.fn()
+        except Exception:
+            v = None
+        if v is None:
+            return []
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}",
+                f"{self.name} {v:g}" if isinstance(v, float) else f"{self.name} {v}"]
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+        self._names  = set()
+
+    def _add(self, m):
+        if m.name in self._names:
+            raise ValueError(f"metrik zaten kayıtlı: {m.name}")
+        self._names.add(m.name)
+        self.metrics.append(m)
+        return m
+
+    def counter(self, name, help_):
+        return self._add(Counter(name, help_))
+
+    def histogram(self, name, help_, bounds):
+        return self._add(Histogram(name, help_, bounds))
+
+    def gauge(self, name, help_, fn, kind="gauge"):
+        """Okuma fonksiyonlu ölçü; `kind="counter"` dış sayaçlar için."""
+        return self._add(Gauge(name, help_, fn, kind))
+
+    def render(self):
+        lines = []
+        for m in self.metrics:
+            lines += m.lines()
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+_LATENCY = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 30, 60)
+_CALL    = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+_FRAME   = (0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.1)
+
+ALARMS_SCHEDULED = REGISTRY.counter("fn_alarms_scheduled_total",
+                                    "Kurulan alarmlar (geri yüklenenler dahil)")
+ALARMS_FIRED     = REGISTRY.counter("fn_alarms_fired_total", "Çalan alarmlar")
+FIRE_LATENCY     = REGISTRY.histogram("fn_alarm_fire_latency_seconds",
+                                      "Çalma anı - hedef deadline", _LATENCY)
+NOTIFY_SECONDS   = REGISTRY.histogram("fn_notification_show_seconds",
+                                      "Toast gösterme süresi", _CALL)
+PLAY_SECONDS     = REGISTRY.histogram("fn_alarm_play_seconds",
+                                      "Alarm sesi çalma çağrısının süresi", _CALL)
+PLAY_DISPATCH    = REGISTRY.histogram("fn_alarm_play_dispatch_seconds",
+                                      "Tetikleme -> ses çıkış çağrısı (kuyruk gecikmesi)",
+                                      _LATENCY)
+SW_FRAME_SECONDS = REGISTRY.histogram("fn_sw_frame_seconds",
+                                      "Kronometre karesinin çizim süresi", _FRAME)
+
+
+def _rss():
+    from footprint import rss_bytes
+    return rss_bytes()
+
+
+REGISTRY.gauge("process_resident_memory_bytes", "Yerleşik bellek (RSS)", _rss)
+
+
+def watch_service(service, registry=REGISTRY):
+    """AlarmService'in okuma anında hesaplanan ölçüleri (GUI ve daemon)."""
+    sched = service.scheduler
+    registry.gauge("fn_alarms_pending", "Bekleyen alarmlar", lambda: len(sched))
+    registry.gauge("fn_scheduler_wakeups_total", "Zamanlayıcı thread'i uyanmaları",
+                   lambda: sched.wakeups, "counter")
+
+
+class MetricsServer:
+    """`GET /metrics` → REGISTRY.render(); ayrı daemon thread'de."""
+
+    def __init__(self, httpd):
+        self.httpd = httpd
+
+    @classmethod
+    def start(cls, registry=REGISTRY, port=None):
+        """Sunucuyu başlat; port alınamazsa None."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            httpd = ThreadingHTTPServer((HOST, PORT if port is None else port), Handler)
+        except OSError:
+            return None
+        httpd.daemon_threads = True
+        threading.Thread(target=httpd.serve_forever, daemon=True, name="metrics").start()
+        return cls(httpd)
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,181 @@
+"""
+Focus Notifier — bildirim dağıtımı
+  • Kuyruk + ayrı worker thread: zamanlayıcı toast'u asla beklemez
+  • Aynı saniyede gelen bildirimler tek özet toast'ta birleşir
+  • Hız sınırı (token bucket) ve takılabilir çıkışlar (sink)
+  • Saniye gruplama, bekleme ve jetonlar `clock` üzerinden (clock.py)
+"""
+
+import collections
+import threading
+import time
+
+import startup
+from clock import SYSTEM
+from metrics import NOTIFY_SECONDS
+
+APP_ID = "FocusNotifier"
+
+
+class WinotifySink:
+    """Windows toast bildirimi (winotify ilk kullanımda yüklenir)."""
+
+    def __init__(self):
+        self._cls = startup.lazy_import("winotify").Notification
+
+    def show(self, title, message):
+        toast = self._cls(app_id=APP_ID, title=title, msg=message, duration="short")
+        toast.show()
+
+
+class PrintSink:
+    """Windows dışı: bildirimi stdout'a yaz."""
+
+    def show(self, title, message):
+        print(f"[{APP_ID}] {title}: {message}", flush=True)
+
+
+class RecordingSink:
+    """Testler için: gösterilen bildirimleri (zaman, başlık, mesaj) kaydeder."""
+
+    def __init__(self):
+        self.shown = []
+        self._cond = threading.Condition()
+
+    def show(self, title, message):
+        with self._cond:
+            self.shown.append((time.time(), title, message))
+            self._cond.notify_all()
+
+    def wait_for(self, n, timeout=5.0):
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self.shown) >= n, timeout)
+
+
+def default_sink():
+    try:
+        return WinotifySink()
+    except ImportError:
+        return PrintSink()
+
+
+class NotificationDispatcher:
+    """Bildirimleri kuyruktan ayrı bir thread'de gösterir.
+
+    İlk bildirimden sonra `linger` saniye beklenir; bu sürede aynı duvar
+    saati saniyesinde gelenler tek özet toast olur. En fazla `burst`
+    toast art arda gösterilir, sonra `per` saniyede bir jeton dolar;
+    jeton beklerken birikenler de saniyelerine göre özetlenip sırayla
+    gösterilir (farklı saniyeler tek toast'ta birleşmez).
+    Tüm zaman okumaları ve beklemeler `clock` üzerinden; sanal saatte
+    bekleme saati ileri alır.
+    """
+
+    MAX_LINES = 5   # özet toast'ta listelenen başlık sayısı
+
+    def __init__(self, sink=None, linger=0.25, burst=3, per=2.0, clock=SYSTEM):
+        self.sink      = sink
+        self.clock     = clock
+        self.linger    = linger
+        self.burst     = burst
+        self.per       = per
+        self.sent      = 0   # gösterilen toast
+        self.merged    = 0   # özete katılan bildirim
+        self.durations = collections.deque(maxlen=64)   # sink.show süresi (sn)
+        self._queue    = collections.deque()   # (saniye, monotonic, başlık, mesaj)
+        self._cond     = threading.Condition()
+        self._tokens   = float(burst)
+        self._refill_t = clock.monotonic()
+        self._thread   = None
+        self._closed   = False
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._closed = False
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="notify")
+                self._thread.start()
+
+    def submit(self, title, message):
+        """Beklemeden kuyruğa ekle."""
+        with self._cond:
+            self._queue.append((int(self.clock.time()), self.clock.monotonic(),
+                                title, message))
+            self._cond.notify()
+
+    def close(self, timeout=1.0):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        t, self._thread = self._thread, None
+        if t is not None:
+            t.join(timeout)
+
+    # ── Worker ─────────────────────────────────────
+    def _take_token(self):
+        """Jeton yoksa dolana kadar bekle (kilit dışında çağrılır)."""
+        now = self.clock.monotonic()
+        self._tokens = min(self.burst,
+                           self._tokens + (now - self._refill_t) / self.per)
+        self._refill_t = now
+        if self._tokens < 1:
+            self.clock.sleep((1 - self._tokens) * self.per)
+            return self._take_token()
+        self._tokens -= 1
+        return True
+
+    def _next_batch(self):
+        with self._cond:
+            while not (self._queue or self._closed):
+                self._cond.wait()
+            if not self._queue:
+                return None
+            sec, t0 = self._queue[0][0], self._queue[0][1]
+        # Aynı saniyede gelecekleri bekle; kilit dışında (submit beklemez),
+        # kuyruğun başını sadece bu thread alır
+        left = t0 + self.linger - self.clock.monotonic()
+        if left > 0 and not self._closed:
+            self.clock.sleep(left)
+        with self._cond:
+            batch = []
+            while self._queue and self._queue[0][0] == sec:
+                batch.append(self._queue.popleft())
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._take_token()
+            # Jeton beklerken aynı saniyede gelenler bu toast'a katılır;
+            # sonraki saniyelerinkiler kendi özetlerinde kalır
+            sec = batch[0][0]
+            with self._cond:
+                while self._queue and self._queue[0][0] == sec:
+                    batch.append(self._queue.popleft())
+            self._deliver(batch)
+
+    def _deliver(self, batch):
+        if len(batch) == 1:
+            _, _, title, message = batch[0]
+        else:
+            title = f"{len(batch)} alarm çaldı"
+            lines = [f"• {b[2]}" for b in batch[:self.MAX_LINES]]
+            if len(batch) > self.MAX_LINES:
+                lines.append(f"… +{len(batch) - self.MAX_LINES}")
+            message = "\n".join(lines)
+            self.merged += len(batch)
+        if self.sink is None:
+            # winotify ilk bildirimde yüklenir, açılışta değil
+            self.sink = default_sink()
+        t = self.clock.perf()
+        try:
+            self.sink.show(title, message)
+        except Exception:
+            pass
+        dt = self.clock.perf() - t
+        self.durations.append(dt)
+        NOTIFY_SECONDS.observe(dt)
+        self.sent += 1
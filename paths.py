@@ -0,0 +1,34 @@
+"""
+Focus Notifier — kalıcı dosyaların dizini
+  • Kaynaktan çalışırken betiklerin yanı (geliştirme, eski kurulumlar)
+  • Tek dosya EXE'de (PyInstaller onefile) __file__ her açılışta silinen
+    _MEIxxxx dizinidir: veri kullanıcı dizinine yazılır
+    (Windows: %APPDATA%\\FocusNotifier, diğerleri: $XDG_DATA_HOME/focus-notifier)
+  • FN_DATA_DIR ortam değişkeni her ikisini de geçersiz kılar
+  • tkinter ve çekirdek modülleri import etmez (instance.py erken yükler)
+"""
+
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _user_dir():
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "FocusNotifier")
+    base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "focus-notifier")
+
+
+def data_dir():
+    """Kalıcı dosyaların dizini; yoksa oluşturulur."""
+    path = os.environ.get("FN_DATA_DIR")
+    if not path:
+        path = _user_dir() if getattr(sys, "frozen", False) else APP_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+DATA_DIR = data_dir()
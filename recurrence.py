@@ -0,0 +1,151 @@
+"""
+Focus Notifier — tekrar kuralları
+  • Kural metni bir kez derlenir; sonuç "bir sonraki çalma" fonksiyonudur
+  • Takvim açılmaz, yoklama yok: saat listesinde bisect, aralıkta aritmetik
+  • Aynı metin tek nesneye derlenir (binlerce kural, az bellek)
+
+Söz dizimi (sırası serbest, boşlukla ayrılır):
+  daily 09:30                       her gün
+  weekdays 09:00,13:30              hafta içi, birden fazla saat
+  mon,wed,fri 07:15 / mon-fri 08:00 belirli günler
+  every 50m 09:00-18:00 weekdays    pencere içinde her 50 dk (09:00'dan başlar)
+  every 2h                          gün boyu, gece yarısından itibaren
+  daily 09:00 until 2026-12-31T09:00  son çalma bu andan sonra olamaz
+"""
+
+import bisect
+import functools
+from datetime import datetime, time as dtime, timedelta
+
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+ALL_DAYS  = 0b1111111
+DAY_SETS  = {"daily": ALL_DAYS, "everyday": ALL_DAYS,
+             "weekdays": 0b0011111, "weekends": 0b1100000}
+UNITS     = {"s": 1, "m": 60, "h": 3600}
+DAY_SECS  = 86400
+
+
+class RuleError(ValueError):
+    """Geçersiz tekrar kuralı."""
+
+
+def _parse_hhmm(text):
+    try:
+        h, m = (int(p) for p in text.split(":"))
+    except ValueError:
+        raise RuleError(f"HH:MM bekleniyor: {text!r}") from None
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise RuleError(f"geçersiz saat: {text!r}")
+    return h * 3600 + m * 60
+
+
+def _parse_days(text):
+    if text in DAY_SETS:
+        return DAY_SETS[text]
+    mask = 0
+    for part in text.split(","):
+        a, _, b = part.partition("-")
+        if a not in DAY_NAMES or (b and b not in DAY_NAMES):
+            return None
+        i, j = DAY_NAMES.index(a), DAY_NAMES.index(b or a)
+        for k in range(i, i + (j - i) % 7 + 1):   # "sat-mon" gibi sarmalar da olur
+            mask |= 1 << (k % 7)
+    return mask
+
+
+class Rule:
+    """Derlenmiş kural: gün maskesi + (sabit saatler | başlangıç/bitiş/adım).
+
+    Günün saniyesi cinsinden çalışır; `next_after` en fazla 8 gün ilerler,
+    her gün için tek bisect ya da tek bölme yapar.
+    """
+
+    __slots__ = ("text", "mask", "times", "start", "end", "step", "until")
+
+    def __init__(self, text, mask, times=(), start=0, end=DAY_SECS - 1, step=0,
+                 until=None):
+        self.text  = text
+        self.mask  = mask
+        self.times = times   # sıralı saniye listesi (step == 0 ise)
+        self.start = start
+        self.end   = end
+        self.step  = step
+        self.until = until   # epoch sn; sonrası yok (None = sınırsız)
+
+    def __repr__(self):
+        return f"Rule({self.text!r})"
+
+    def _first_after(self, sod):
+        """Gün içinde `sod` saniyesinden sonraki ilk çalma; yoksa None."""
+        if self.step:
+            if sod < self.start:
+                return self.start
+            t = self.start + (int(sod - self.start) // self.step + 1) * self.step
+            return t if t <= self.end else None
+        i = bisect.bisect_right(self.times, sod)
+        return self.times[i] if i < len(self.times) else None
+
+    def next_after(self, ts):
+        """`ts` (epoch sn) anından kesin sonraki çalmayı epoch sn olarak döndür;
+        `until` geçildiyse None."""
+        if self.until is not None and ts >= self.until:
+            return None
+        now = datetime.fromtimestamp(ts)
+        day = now.date()
+        sod = (now.hour * 3600 + now.minute * 60 + now.second
+               + now.microsecond / 1e6)
+        for k in range(8):
+            d = day + timedelta(days=k)
+            if self.mask >> d.weekday() & 1:
+                s = self._first_after(sod if k == 0 else -1)
+                if s is not None:
+                    t = (datetime.combine(d, dtime()) + timedelta(seconds=s)).timestamp()
+                    return None if self.until is not None and t > self.until else t
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_rule(text):
+    """Kural metnini derle; hatalıysa RuleError."""
+    tokens = text.lower().split()
+    if not tokens:
+        raise RuleError("boş kural")
+    mask, times, window, step, until = None, [], None, 0, None
+    it = iter(tokens)
+    for tok in it:
+        if tok == "until":
+            spec = next(it, "")
+            try:
+                until = datetime.fromisoformat(spec.upper()).timestamp()
+            except ValueError:
+                raise RuleError(f"tarih bekleniyor (ör. 2026-12-31T09:00): {spec!r}") from None
+        elif tok == "every":
+            spec = next(it, "")
+            try:
+                step = int(spec[:-1]) * UNITS[spec[-1:]]
+            except (ValueError, KeyError):
+                raise RuleError(f"aralık bekleniyor (ör. 50m, 2h): {spec!r}") from None
+            if not 0 < step < DAY_SECS:
+                raise RuleError(f"geçersiz aralık: {spec!r}")
+        elif "-" in tok and ":" in tok:
+            a, _, b = tok.partition("-")
+            window = (_parse_hhmm(a), _parse_hhmm(b))
+            if window[0] > window[1]:
+                raise RuleError(f"pencere gece yarısını geçemez: {tok!r}")
+        elif ":" in tok:
+            times.extend(_parse_hhmm(t) for t in tok.split(",") if t)
+        else:
+            days = _parse_days(tok)
+            if days is None:
+                raise RuleError(f"bilinmeyen ifade: {tok!r}")
+            mask = (mask or 0) | days
+    if mask is None:
+        mask = ALL_DAYS
+    if step:
+        if times:
+            raise RuleError("'every' ile sabit saat birlikte kullanılamaz")
+        start, end = window or (0, DAY_SECS - 1)
+        return Rule(text, mask, start=start, end=end, step=step, until=until)
+    if window or not times:
+        raise RuleError("saat ya da 'every N' gerekli")
+    return Rule(text, mask, times=tuple(sorted(set(times))), until=until)
@@ -0,0 +1,330 @@
+"""
+Focus Notifier — zamanlayıcı motoru
+  • Tek thread, deadline sıralı öncelik kuyruğu (heap)
+  • Bir sonraki deadline'a kadar Condition üzerinde uyur
+  • add / cancel / reschedule handle'ları; binlerce alarm tek thread
+  • Saat takılabilir (clock.py); sanal saatle `run_until` thread'siz,
+    beklemeden oynatır
+"""
+
+import heapq
+import itertools
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from clock import SYSTEM
+
+
+def next_occurrence(hour, minute, now=None):
+    """Verilen HH:MM'in bir sonraki gerçekleşmesini epoch saniye olarak döndür."""
+    now = now or datetime.now()
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return target.timestamp()
+
+
+class AlarmHandle:
+    """Zamanlayıcıya eklenmiş tek bir alarmın tutamacı."""
+
+    __slots__ = ("_sched", "_gen", "deadline", "callback", "args", "key",
+                 "cancelled", "fired")
+
+    def __init__(self, sched, deadline, callback, args, key=None):
+        self._sched    = sched
+        self._gen      = 0          # reschedule sonrası eski heap girdileri geçersiz
+        self.deadline  = deadline
+        self.callback  = callback
+        self.args      = args
+        self.key       = key        # çağıranın kimliği (ör. depo kayıt id'si)
+        self.cancelled = False
+        self.fired     = False
+
+    @property
+    def active(self):
+        return not (self.cancelled or self.fired)
+
+    def cancel(self):
+        return self._sched.cancel(self)
+
+    def reschedule(self, deadline):
+        return self._sched.reschedule(self, deadline)
+
+    def remaining(self):
+        return self.deadline - self._sched.clock.time()
+
+
+class PendingIndex:
+    """Bekleyen alarmların deadline sıralı görünümü; artımlı güncellenir.
+
+    Scheduler'daki her değişiklik handle'ı kirli kümesine ekler (herhangi
+    bir thread'de); `sync()` sahibi thread'de kirlileri bisect ile eski
+    yerinden çıkarıp yenisine yerleştirir. Tüm heap'in kopyalanıp
+    sıralanması sadece başta bir kez olur. `len()` ve indeksleme liste gibi.
+    """
+
+    def __init__(self, sched):
+        self._lock      = threading.Lock()
+        self._dirty     = set()
+        sched.watch(self._mark)   # önce izle: ilk kopya sırasında değişen kaçmaz
+        # Deadline'lar bir kez okunur: sıralama ve kayıt aynı değerle
+        pairs = sorted(((h.deadline, h) for h in sched.pending()), key=lambda p: p[0])
+        self._deadlines = [d for d, _ in pairs]
+        self._handles   = [h for _, h in pairs]
+        self._at        = {h: d for d, h in pairs}
+        self.version    = 1   # sync her değişiklik uyguladığında artar
+
+    def _mark(self, h):
+        with self._lock:
+            self._dirty.add(h)
+
+    def sync(self):
+        """Kirli handle'ları uygula; bir şey değiştiyse True."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return False
+        hs, ds, at = self._handles, self._deadlines, self._at
+        for h in dirty:
+            old = at.pop(h, None)
+            if old is not None:
+                i = bisect_left(ds, old)
+                while hs[i] is not h:   # aynı deadline'lı komşular
+                    i += 1
+                del hs[i], ds[i]
+            if h.active:
+                d = h.deadline
+                i = bisect_right(ds, d)
+                hs.insert(i, h)
+                ds.insert(i, d)
+                at[h] = d
+        self.version += 1
+        return True
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __getitem__(self, i):
+        return self._handles[i]
+
+
+class Scheduler:
+    """Deadline sıralı tek thread'li alarm motoru.
+
+    İptal edilen / yeniden planlanan girdiler heap'ten hemen silinmez
+    (lazy deletion); ölü girdiler canlıları geçince heap yeniden kurulur.
+    """
+
+    MAX_SLEEP = 60.0   # duvar saati kaymalarına karşı üst uyku sınırı
+
+    def __init__(self, clock=SYSTEM):
+        self.clock    = clock   # time() sağlayan saat (clock.SystemClock / VirtualClock)
+        self._heap    = []
+        self._seq     = itertools.count()
+        self._cond    = threading.Condition()
+        self._live    = 0
+        self._stale   = 0
+        self._thread  = None
+        self._stopped = False
+        self.wakeups  = 0
+        self.version  = 0   # bekleyen küme her değiştiğinde artar (önbellek anahtarı)
+        self._watchers = []
+
+    # ── Yaşam döngüsü ──────────────────────────────
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name="scheduler")
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        t, self._thread = self._thread, None
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout=1.0)
+
+    def watch(self, fn):
+        """Değişen her handle için `fn(handle)` (kilit altında; hızlı olmalı)."""
+        with self._cond:
+            self._watchers.append(fn)
+
+    def _changed(self, h):
+        for fn in self._watchers:
+            fn(h)
+
+    # ── Handle işlemleri ───────────────────────────
+    def add(self, deadline, callback, *args, key=None):
+        h = AlarmHandle(self, deadline, callback, args, key)
+        with self._cond:
+            self._live += 1
+            self.version += 1
+            self._push(h)
+            self._changed(h)
+        return h
+
+    def add_many(self, items):
+        """Toplu ekleme: (deadline, callback, args, key) öğeleri; tek heapify."""
+        hs = [AlarmHandle(self, d, cb, args, key) for d, cb, args, key in items]
+        with self._cond:
+            seq = self._seq
+            self._heap.extend((h.deadline, next(seq), 0, h) for h in hs)
+            heapq.heapify(self._heap)
+            self._live += len(hs)
+            self.version += 1
+            if self._watchers:
+                for h in hs:
+                    self._changed(h)
+            self._cond.notify()
+        return hs
+
+    def cancel(self, handle):
+        with self._cond:
+            if not handle.active:
+                return False
+            handle.cancelled = True
+            self._live  -= 1
+            self.version += 1
+            self._changed(handle)
+            self._stale += 1
+            self._maybe_compact()
+            return True
+
+    def reschedule(self, handle, deadline):
+        """Bekleyen ya da çalmış bir alarmı yeni deadline'a taşı."""
+        with self._cond:
+            if handle.cancelled:
+                return False
+            if handle.fired:
+                handle.fired = False
+                self._live += 1
+            else:
+                self._stale += 1
+            handle._gen += 1
+            handle.deadline = deadline
+            self.version += 1
+            self._changed(handle)
+            self._push(handle)
+            self._maybe_compact()
+            return True
+
+    def __len__(self):
+        return self._live
+
+    def pending(self):
+        """Bekleyen handle'lar, deadline sırasıyla."""
+        with self._cond:
+            hs = [e[3] for e in self._heap if self._valid(e)]
+        hs.sort(key=lambda h: h.deadline)
+        return hs
+
+    def upcoming(self, n):
+        """En yakın `n` bekleyen handle (tam sıralama yapmadan)."""
+        with self._cond:
+            top = heapq.nsmallest(n, (e for e in self._heap if self._valid(e)))
+        return [e[3] for e in top]
+
+    def next_deadline(self):
+        with self._cond:
+            self._drop_stale_top()
+            return self._heap[0][0] if self._heap else None
+
+    # ── İç yardımcılar (kilit altında çağrılır) ────
+    def _push(self, h):
+        entry = (h.deadline, next(self._seq), h._gen, h)
+        heapq.heappush(self._heap, entry)
+        # Sadece en erken deadline değiştiyse thread'i uyandır
+        if self._heap[0] is entry:
+            self._cond.notify()
+
+    @staticmethod
+    def _valid(entry):
+        h = entry[3]
+        return h.active and entry[2] == h._gen
+
+    def _drop_stale_top(self):
+        heap = self._heap
+        while heap and not self._valid(heap[0]):
+            heapq.heappop(heap)
+            self._stale -= 1
+
+    def _maybe_compact(self):
+        if self._stale > 64 and self._stale > self._live:
+            self._heap = [e for e in self._heap if self._valid(e)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _pop_due(self, now):
+        """Süresi gelmiş alarmları heap'ten çıkar ve işaretle."""
+        due = []
+        heap = self._heap
+        while heap:
+            entry = heap[0]
+            if not self._valid(entry):
+                heapq.heappop(heap)
+                self._stale -= 1
+                continue
+            if entry[0] > now:
+                break
+            heapq.heappop(heap)
+            h = entry[3]
+            h.fired = True
+            self._live -= 1
+            self.version += 1
+            self._changed(h)
+            due.append(h)
+        return due
+
+    # ── Ana döngü ──────────────────────────────────
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                due = self._pop_due(self.clock.time())
+                if not due:
+                    self._drop_stale_top()
+                    timeout = self.MAX_SLEEP
+                    if self._heap:
+                        timeout = min(timeout, self._heap[0][0] - self.clock.time())
+                    if timeout > 0:
+                        self._cond.wait(timeout)
+                        self.wakeups += 1
+                    continue
+            self._dispatch(due)
+
+    @staticmethod
+    def _dispatch(due):
+        for h in due:
+            try:
+                h.callback(h, *h.args)
+            except Exception:
+                pass
+
+    def run_until(self, until):
+        """Sanal saatle thread'siz çalıştır: `until` anına kadar her alarmı
+        kendi deadline'ında çağır (saat oraya alınır); çalan sayısını döndür.
+
+        Saat `set(t)` sağlamalı (clock.VirtualClock); `start()` ile birlikte
+        kullanılmaz. Geri çağrıların eklediği / kaydırdığı alarmlar da aynı
+        koşuda çalar.
+        """
+        clock = self.clock
+        fired = 0
+        while True:
+            with self._cond:
+                self._drop_stale_top()
+                if not self._heap or self._heap[0][0] > until:
+                    break
+                clock.set(max(clock.time(), self._heap[0][0]))
+                due = self._pop_due(clock.time())
+                self.wakeups += 1
+            self._dispatch(due)
+            fired += len(due)
+        clock.set(max(clock.time(), until))
+        return fired
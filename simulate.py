@@ -0,0 +1,125 @@
+"""
+Focus Notifier — sanal zamanda alarm simülasyonu
+  • Gerçek AlarmService + Scheduler, VirtualClock üzerinde thread'siz;
+    deadline'lar arası bekleme yok: 24 saat milisaniyeler içinde
+  • Kayıtlı alarmlar (fn_alarms.jsonl) geçici kopyadan geri yüklenir;
+    asıl dosya, geçmiş ve olay günlüğü değişmez
+  • Her çalmanın zamanı ve başlığı yazılır; sonunda toplam ve süre
+  • Kullanım: python simulate.py [--hours 24] [--start "2026-10-19 08:00"]
+             [--at 09:30] [--rule "every 50m 09:00-18:00 weekdays"]
+             [--import takvim.ics] [--store -] [-q]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from clock import VirtualClock
+from core import STORE_PATH, AlarmService
+from store import AlarmStore
+
+
+class _Silent:
+    """Ses ve bildirim yerine: simülasyonda hiçbir şey çalınmaz."""
+
+    def start(self):
+        pass
+
+    def close(self):
+        pass
+
+    def load(self, name, loader):
+        pass
+
+    def play(self, name):
+        pass
+
+    def submit(self, title, message):
+        pass
+
+
+def make_service(start, store_path=None):
+    """Sanal saatli servis; `store_path` verilirse oradan geri yükler."""
+    silent = _Silent()
+    store = AlarmStore(store_path) if store_path else None
+    service = AlarmService(player=silent, notifier=silent, store=store,
+                           clock=VirtualClock(start))
+    service.restore()
+    return service
+
+
+def run(service, hours=24.0):
+    """`hours` sanal saat boyunca çal; [(zaman, başlık, tekrarlı), ...] döndür."""
+    clock = service.clock
+    fires = []
+
+    def on_fired(h):
+        title, _, _, rule = h.args[:4]
+        fires.append((clock.time(), title, rule is not None))
+    service.listeners.append(on_fired)
+    try:
+        service.scheduler.run_until(clock.time() + hours * 3600)
+    finally:
+        service.listeners.remove(on_fired)
+    return fires
+
+
+def _parse_start(text):
+    return datetime.fromisoformat(text).timestamp()
+
+
+def build_parser():
+    from daemon import parse_hhmm, parse_rule
+    p = argparse.ArgumentParser(description="Alarmları sanal zamanda oynat")
+    p.add_argument("--hours", type=float, default=24.0, help="simüle edilecek süre")
+    p.add_argument("--start", type=_parse_start, help="başlangıç (YYYY-MM-DD[ HH:MM]); "
+                                                     "varsayılan: şimdi")
+    p.add_argument("--at", type=parse_hhmm, action="append", default=[], metavar="HH:MM")
+    p.add_argument("--rule", type=parse_rule, action="append", default=[], metavar="KURAL")
+    p.add_argument("--import", dest="imports", action="append", default=[],
+                   metavar="DOSYA", help=".ics / .csv takvim")
+    p.add_argument("--title", default="Mola Zamanı!")
+    p.add_argument("--store", default=STORE_PATH, metavar="DOSYA",
+                   help="geri yüklenecek alarm günlüğü; '-' ile boş başla")
+    p.add_argument("-q", "--quiet", action="store_true", help="sadece özet")
+    return p
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start = time.time() if args.start is None else args.start
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = None
+        if args.store != "-" and os.path.exists(args.store):
+            store_path = os.path.join(tmp, "alarms.jsonl")
+            shutil.copyfile(args.store, store_path)
+        service = make_service(start, store_path)
+        for h, m in args.at:
+            service.add(h, m, args.title, "")
+        for rule in args.rule:
+            service.add_rule(rule, args.title, "")
+        if args.imports:
+            from importer import import_file
+            for path in args.imports:
+                import_file(service, path)
+        pending = len(service.scheduler)
+        t = time.perf_counter()
+        fires = run(service, args.hours)
+        dt = time.perf_counter() - t
+        if service.store is not None:
+            service.store.close()
+    if not args.quiet:
+        for ts, title, recurring in fires:
+            print(f"{datetime.fromtimestamp(ts):%Y-%m-%d %H:%M:%S}  "
+                  f"{'↻' if recurring else ' '} {title}")
+    print(f"{len(fires)} çalma / {pending} alarm, {args.hours:g} saat "
+          f"{dt * 1000:.1f} ms'de; uyanma {service.scheduler.wakeups}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Focus Notifier — açılış ölçümü
+  • Tembel (ilk kullanımda) import + süre kaydı
+  • Açılış fazları ve ilk pencereye kadar geçen süre
+  • `--startup-report` ya da FN_STARTUP_REPORT=1 ile stderr'e rapor
+"""
+
+import importlib
+import os
+import sys
+import time
+
+_T0 = time.perf_counter()
+
+ENABLED = "--startup-report" in sys.argv or bool(os.environ.get("FN_STARTUP_REPORT"))
+
+_marks   = []   # (etiket, t)
+_imports = []   # (modül, süre, yeni modül sayısı, t)
+
+
+def mark(label):
+    """Açılış fazı işaretle (süre _T0'dan itibaren)."""
+    _marks.append((label, time.perf_counter()))
+
+
+def lazy_import(name):
+    """Modülü ilk kullanımda içe aktar; ilk yüklemenin süresini kaydet."""
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    before = len(sys.modules)
+    t = time.perf_counter()
+    mod = importlib.import_module(name)
+    _imports.append((name, time.perf_counter() - t,
+                     len(sys.modules) - before, t))
+    return mod
+
+
+def report(out=None):
+    """-X importtime biçimine benzer raporu yaz."""
+    out = out or sys.stderr
+    print("import time: cumulative [us] | new modules | at [ms] | package", file=out)
+    for name, dt, n, t in _imports:
+        print(f"import time: {int(dt * 1e6):>15} | {n:>11} | "
+              f"{(t - _T0) * 1000:>8.1f} | {name}", file=out)
+    prev = _T0
+    for label, t in _marks:
+        print(f"startup: {(t - _T0) * 1000:>8.1f} ms  (+{(t - prev) * 1000:6.1f})  {label}",
+              file=out)
+        prev = t
+    out.flush()
@@ -0,0 +1,191 @@
+"""
+Focus Notifier — kronometre durumu (tkinter'siz)
+  • Başlat / duraklat / lap / sıfırla
+  • Süre perf_counter ile ölçülür, çizim UI tarafında
+  • Lap'ler ham float olarak array('d') içinde; istatistik lap başına O(1)
+  • StopwatchBank: çok sayıda adlandırılmış kronometre, paralel dizilerde
+"""
+
+import time
+from array import array
+
+
+def format_sw(secs):
+    h = int(secs) // 3600
+    m = (int(secs) % 3600) // 60
+    s = int(secs) % 60
+    cs = int((secs - int(secs)) * 100)
+    if h:
+        return f"{h:02d}:{m:02d}:{s:02d}"
+    return f"{m:02d}:{s:02d}.{cs:02d}"
+
+
+class LapLog:
+    """Lap zamanları (başlangıçtan itibaren sn) ve artımlı istatistikler."""
+
+    __slots__ = ("times", "best", "worst")
+
+    def __init__(self):
+        self.times = array("d")
+        self.best  = -1   # en kısa split'in indeksi
+        self.worst = -1   # en uzun split'in indeksi
+
+    def __len__(self):
+        return len(self.times)
+
+    def split(self, i):
+        """i. lap'in kendi süresi."""
+        return self.times[i] - (self.times[i - 1] if i else 0.0)
+
+    def delta(self, i):
+        """i. split ile bir önceki split arasındaki fark (ilk lap için 0)."""
+        return self.split(i) - self.split(i - 1) if i else 0.0
+
+    def mean(self):
+        # Split'lerin toplamı son lap zamanına eşittir
+        n = len(self.times)
+        return self.times[-1] / n if n else 0.0
+
+    def append(self, t):
+        self.times.append(t)
+        i = len(self.times) - 1
+        s = self.split(i)
+        if self.best < 0 or s < self.split(self.best):
+            self.best = i
+        if self.worst < 0 or s > self.split(self.worst):
+            self.worst = i
+        return i
+
+    def clear(self):
+        del self.times[:]
+        self.best = self.worst = -1
+
+
+class Stopwatch:
+    """Tek bir kronometrenin durumu."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock   = clock
+        self.running = False
+        self._start  = 0.0
+        self._acc    = 0.0   # duraklatılana kadar biriken süre
+        self.laps    = LapLog()
+
+    def elapsed(self):
+        if self.running:
+            return self.clock() - self._start
+        return self._acc
+
+    def start(self):
+        if not self.running:
+            self._start = self.clock() - self._acc
+            self.running = True
+
+    def pause(self):
+        if self.running:
+            self._acc = self.clock() - self._start
+            self.running = False
+
+    def toggle(self):
+        self.pause() if self.running else self.start()
+        return self.running
+
+    def lap(self):
+        """Lap kaydet; (sıra no, süre) döndür, kayıt yoksa None."""
+        t = self.elapsed()
+        if not self.running and t <= 0:
+            return None
+        return self.laps.append(t) + 1, t
+
+    def reset(self):
+        self.running = False
+        self._acc = 0.0
+        self.laps.clear()
+
+
+class StopwatchBank:
+    """Adlandırılmış kronometreler — dizi yapısı (struct of arrays).
+
+    Kronometre başına nesne yoktur; i. kronometrenin durumu `names[i]`,
+    `t0[i]` / `acc[i]` (array('d')) ve `on[i]` (bytearray) hücreleridir.
+    Geçen süre saklanmaz, tek saat okumasından türetilir: ortak tick
+    `elapsed_range()` ile istediği aralığı tek geçişte hesaplar.
+    `version` küme ya da çalışma durumu her değiştiğinde artar.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock     = clock
+        self.names     = []
+        self.t0        = array("d")   # çalışırken: clock() - önceki birikim
+        self.acc       = array("d")   # duraklatılmışken biriken süre
+        self.on        = bytearray()
+        self.n_running = 0
+        self.version   = 0
+        self._ids      = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, name):
+        """Ad → indeks; yoksa KeyError."""
+        return self._ids[name]
+
+    def add(self, name):
+        """Kronometre ekle (varsa mevcut indeksi döndür)."""
+        i = self._ids.get(name)
+        if i is None:
+            i = self._ids[name] = len(self.names)
+            self.names.append(name)
+            self.t0.append(0.0)
+            self.acc.append(0.0)
+            self.on.append(0)
+            self.version += 1
+        return i
+
+    def remove(self, i):
+        """Sil; geçen süreyi döndür. Sonraki indeksler bir kayar (sıra korunur)."""
+        t = self.elapsed(i)
+        self.n_running -= self.on[i]
+        del self._ids[self.names[i]]
+        del self.names[i], self.t0[i], self.acc[i], self.on[i]
+        for k in range(i, len(self.names)):
+            self._ids[self.names[k]] = k
+        self.version += 1
+        return t
+
+    def elapsed(self, i, now=None):
+        if self.on[i]:
+            return (self.clock() if now is None else now) - self.t0[i]
+        return self.acc[i]
+
+    def elapsed_range(self, lo, hi, now=None):
+        """[lo, hi) aralığının süreleri; saat bir kez okunur."""
+        now = self.clock() if now is None else now
+        t0, acc, on = self.t0, self.acc, self.on
+        return [now - t0[i] if on[i] else acc[i] for i in range(lo, hi)]
+
+    def start(self, i):
+        if not self.on[i]:
+            self.t0[i] = self.clock() - self.acc[i]
+            self.on[i] = 1
+            self.n_running += 1
+            self.version += 1
+
+    def pause(self, i):
+        if self.on[i]:
+            self.acc[i] = self.clock() - self.t0[i]
+            self.on[i] = 0
+            self.n_running -= 1
+            self.version += 1
+
+    def toggle(self, i):
+        self.pause(i) if self.on[i] else self.start(i)
+        return bool(self.on[i])
+
+    def reset(self, i):
+        """Sıfırla; sıfırlanmadan önceki süreyi döndür."""
+        t = self.elapsed(i)
+        self.pause(i)
+        self.acc[i] = 0.0
+        self.version += 1
+        return t
@@ -0,0 +1,152 @@
+"""
+Focus Notifier — kalıcı alarm deposu
+  • Append-only günlük (satır başına bir JSON dizisi); ekle/sil O(1) ekleme
+  • Açılışta tüm dosya tek json.loads ile okunur (on binlerce alarm, ms'ler)
+  • Ölü kayıtlar canlıları geçince günlük sıkıştırılır (atomik os.replace)
+"""
+
+import json
+import os
+import threading
+
+# Kayıt biçimleri:
+#   ["a", id, deadline, başlık, mesaj, ses]   alarm eklendi
+#   ["a", id, deadline, başlık, mesaj, ses, kural]   tekrarlı alarm
+#   ["a", id, deadline, başlık, mesaj, ses, kural|"", uid]   içe aktarılmış
+#   ["r", id, deadline]                        yeniden planlandı
+#   ["d", id]                                  iptal edildi / çaldı
+#
+# Canlı alarmlar bellekte de "a" satırı olarak tutulur (nesne üretilmez).
+ID, DEADLINE, TITLE, MESSAGE, SOUND, RULE, UID = 1, 2, 3, 4, 5, 6, 7
+
+
+def _dumps(row):
+    return json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class AlarmStore:
+    """Alarm günlüğü; `alarms` canlı "a" satırlarını id ile tutar."""
+
+    COMPACT_MIN = 1024   # bu kadar ölü kayıttan önce sıkıştırma yok
+
+    def __init__(self, path, fsync=False):
+        self.path    = path
+        self.fsync   = fsync
+        self.alarms  = {}
+        self._dead   = 0
+        self._next   = 1
+        self._lock   = threading.Lock()
+        self._fh     = None
+
+    # ── Yükleme ────────────────────────────────────
+    @staticmethod
+    def _parse(data):
+        try:
+            return json.loads("[" + data.rstrip("\n").replace("\n", ",") + "]")
+        except ValueError:
+            # Yarım kalmış satır (çökme): satır satır, bozukları atla
+            rows = []
+            for line in data.splitlines():
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    pass
+            return rows
+
+    def load(self):
+        """Günlüğü oku ve yeniden oynat; canlı kayıtları döndür."""
+        with self._lock:
+            try:
+                with open(self.path, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                raw = b""
+            end = raw.rfind(b"\n") + 1
+            if end < len(raw):
+                # Yarım yazılmış son satır (çökme): kes, yoksa sonraki ekleme
+                # aynı satıra yapışır ve o alarm da kaybolur
+                os.truncate(self.path, end)
+                raw = raw[:end]
+            data = raw.decode("utf-8", "replace")
+            alarms = {}
+            rows = self._parse(data) if data else []
+            last = 0
+            for row in rows:
+                op, aid = row[0], row[1]
+                if aid > last:
+                    last = aid
+                if op == "a":
+                    alarms[aid] = row
+                elif op == "d":
+                    alarms.pop(aid, None)
+                else:
+                    rec = alarms.get(aid)
+                    if rec is not None:
+                        rec[DEADLINE] = row[2]
+            self.alarms = alarms
+            self._dead = len(rows) - len(alarms)
+            self._next = last + 1
+            if self._dead > self.COMPACT_MIN and self._dead > len(alarms):
+                self._compact()
+            return list(alarms.values())
+
+    # ── Ekleme ─────────────────────────────────────
+    def _append(self, row):
+        if self._fh is None:
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(_dumps(row))
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+
+    def add(self, deadline, title, message, sound=True, rule=None, uid=None):
+        with self._lock:
+            row = ["a", self._next, deadline, title, message, 1 if sound else 0]
+            if rule or uid:
+                row.append(rule or "")
+            if uid:
+                row.append(uid)
+            self._next += 1
+            self.alarms[row[ID]] = row
+            self._append(row)
+            return row
+
+    def reschedule(self, alarm_id, deadline):
+        with self._lock:
+            rec = self.alarms.get(alarm_id)
+            if rec is None:
+                return
+            rec[DEADLINE] = deadline
+            self._append(["r", alarm_id, deadline])
+            self._dead += 1
+            if self._dead > self.COMPACT_MIN and self._dead > len(self.alarms):
+                self._compact()
+
+    def remove(self, alarm_id):
+        with self._lock:
+            if self.alarms.pop(alarm_id, None) is None:
+                return
+            self._append(["d", alarm_id])
+            self._dead += 2   # hem "a" hem "d" satırı artık ölü
+            if self._dead > self.COMPACT_MIN and self._dead > len(self.alarms):
+                self._compact()
+
+    # ── Sıkıştırma ─────────────────────────────────
+    def _compact(self):
+        """Sadece canlı kayıtları yeni dosyaya yaz ve atomik olarak değiştir."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(_dumps(r) for r in self.alarms.values())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._dead = 0
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
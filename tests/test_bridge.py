@@ -0,0 +1,46 @@
+import threading
+
+from bridge import EventBridge
+
+
+class FakeHost:
+    """`after` kuyruğunu elle çalıştıran host; çağıran thread'leri kaydeder."""
+
+    def __init__(self):
+        self.calls   = []
+        self.threads = set()
+        self._n      = 0
+
+    def after(self, ms, fn):
+        self.threads.add(threading.get_ident())
+        self._n += 1
+        self.calls.append((self._n, ms, fn))
+        return self._n
+
+    def after_cancel(self, aid):
+        self.calls = [c for c in self.calls if c[0] != aid]
+
+    def run_next(self):
+        _, ms, fn = self.calls.pop(0)
+        fn()
+        return ms
+
+
+def test_workers_never_touch_host_and_idle_pump_backs_off():
+    host = FakeHost()
+    b = EventBridge(host, 100, 1000)
+    got = []
+    b.on("fired", got.append)
+    b.start()
+    t = threading.Thread(target=lambda: [b.post("fired", i) for i in range(5)])
+    t.start()
+    t.join()
+    assert host.threads == {threading.get_ident()}
+    assert host.run_next() == 100
+    assert got == [0, 1, 2, 3, 4]
+    delays = [host.run_next() for _ in range(6)]
+    assert delays == [100, 200, 400, 800, 1000, 1000]
+    b.post("fired", 5)
+    host.run_next()
+    assert got[-1] == 5
+    assert host.calls[0][1] == 100   # olay geldi: aralık yeniden taban
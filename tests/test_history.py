@@ -0,0 +1,45 @@
+import os
+from datetime import datetime
+
+from history import History
+
+TS = datetime(2026, 10, 18, 9, 0).timestamp()
+
+
+def test_record_appends_without_rewriting_rollup(tmp_path):
+    h = History(str(tmp_path))
+    for i in range(10):
+        h.record_alarm(TS + i)
+    h.record_session(90, TS)
+    assert not os.path.exists(tmp_path / "rollup.json")
+    assert h.day(datetime.fromtimestamp(TS).date()) == [10, 1, 90.0]
+    h.close()
+    assert os.path.exists(tmp_path / "rollup.json")
+    again = History(str(tmp_path))
+    again.load()
+    assert again.count == 11
+
+
+def test_unflushed_events_replayed_after_crash(tmp_path):
+    h = History(str(tmp_path))
+    h.record_alarm(TS)
+    h.flush()
+    h.record_alarm(TS + 60)   # özet yazılmadan "çökme"
+    again = History(str(tmp_path))
+    assert again.day(datetime.fromtimestamp(TS).date())[0] == 2
+    h.close()
+
+
+def test_readonly_reader_leaves_files_alone(tmp_path):
+    h = History(str(tmp_path))
+    h.record_alarm(TS)
+    h.record_alarm(TS + 60)
+    # Yazan süreç iki sütun yazımı arasında: ts bir olay önde
+    with open(tmp_path / "ts.col", "ab") as f:
+        f.write(b"\0" * 8)
+    sizes = {p.name: p.stat().st_size for p in tmp_path.iterdir()}
+    reader = History(str(tmp_path), readonly=True)
+    assert reader.day(datetime.fromtimestamp(TS).date())[0] == 2
+    assert {p.name: p.stat().st_size for p in tmp_path.iterdir()} == sizes
+    assert not os.path.exists(tmp_path / "rollup.json")
+    h.close()
@@ -0,0 +1,77 @@
+import io
+from datetime import datetime
+
+from importer import parse_ics, sync
+from simulate import make_service, run
+
+NOW = datetime(2026, 10, 18, 8, 0).timestamp()
+
+
+def _ics(*events):
+    lines = ["BEGIN:VCALENDAR"]
+    for uid, dtstart, rrule in events:
+        lines += ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTART:{dtstart}",
+                  f"SUMMARY:{uid}"]
+        if rrule:
+            lines.append(f"RRULE:{rrule}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return io.StringIO("\r\n".join(lines) + "\r\n")
+
+
+def _import(service, *events):
+    return sync(service, parse_ics(_ics(*events)), "takvim")
+
+
+def test_future_dtstart_anchors_recurring_event():
+    service = make_service(NOW)
+    counts = _import(service, ("a", "20261201T090000", "FREQ=DAILY"))
+    assert counts["added"] == 1
+    (h,) = service.pending()
+    assert h.deadline == datetime(2026, 12, 1, 9, 0).timestamp()
+    assert h.args[3] is not None   # tekrarlı kaldı
+
+    # Yeniden içe aktarma aynı seriyi değiştirmez
+    assert _import(service, ("a", "20261201T090000", "FREQ=DAILY"))["unchanged"] == 1
+
+
+def test_past_dtstart_fires_from_today():
+    service = make_service(NOW)
+    _import(service, ("a", "20260101T090000", "FREQ=DAILY"))
+    (h,) = service.pending()
+    assert h.deadline == datetime(2026, 10, 18, 9, 0).timestamp()
+
+
+def test_count_series_still_running_is_kept_and_ends():
+    service = make_service(NOW)
+    counts = _import(service, ("a", "20261001T090000", "FREQ=DAILY;COUNT=100"))
+    assert counts["added"] == 1 and counts["skipped"] == 0
+    (h,) = service.pending()
+    assert h.deadline == datetime(2026, 10, 18, 9, 0).timestamp()
+    # 1–17 Ekim geçti: kalan 83 çalma, sonra seri biter
+    fires = run(service, 24 * 200)
+    assert len(fires) == 83
+    assert datetime.fromtimestamp(fires[-1][0]) == datetime(2027, 1, 8, 9, 0)
+    assert len(service.scheduler) == 0
+
+
+def test_until_series():
+    service = make_service(NOW)
+    _import(service, ("a", "20261001T090000", "FREQ=WEEKLY;BYDAY=MO;UNTIL=20261102"))
+    fires = run(service, 24 * 60)
+    assert [datetime.fromtimestamp(t).day for t, _, _ in fires] == [19, 26, 2]
+
+
+def test_finished_series_is_skipped():
+    service = make_service(NOW)
+    counts = _import(service, ("a", "20260101T090000", "FREQ=DAILY;COUNT=3"))
+    assert counts["skipped"] == 1 and not service.pending()
+
+
+def test_unsupported_rule_is_reported_not_scheduled_as_one_shot():
+    service = make_service(NOW)
+    counts = _import(service, ("a", "20261001T090000", "FREQ=DAILY;INTERVAL=2"),
+                     ("b", "20261201T090000", "FREQ=MONTHLY"))
+    assert counts["unsupported"] == 2
+    assert counts["skipped"] == 0 and counts["added"] == 0
+    assert not service.pending()
@@ -0,0 +1,34 @@
+import socket
+import threading
+
+import instance
+
+
+def test_foreign_listener_is_no_instance_and_claim_falls_back(tmp_path, monkeypatch):
+    foreign = socket.socket()
+    foreign.bind((instance.HOST, 0))
+    foreign.listen(1)
+    port = foreign.getsockname()[1]
+
+    def hang_up():
+        conn, _ = foreign.accept()
+        conn.sendall(b"HTTP/1.0 400 Bad Request\r\n\r\n")
+        conn.close()
+    t = threading.Thread(target=hang_up, daemon=True)
+    t.start()
+    monkeypatch.setattr(instance, "PORT", port)
+    monkeypatch.setattr(instance, "KEY_PATH", str(tmp_path / "fn_instance.key"))
+    try:
+        assert instance.forward({"cmd": "ping"}) is None
+        assert instance.CommandServer.claim() is None
+        server = instance.CommandServer.claim(fallback=True)
+        assert server is not None
+        try:
+            server.serve(lambda cmd: instance.service_command(None, cmd))
+            reply = instance.forward({"cmd": "ping"})
+            assert reply["ok"] and "çalışıyor" in reply["msg"]
+            assert instance.read_key()[1] == server.sock.getsockname()[1] != port
+        finally:
+            server.close()
+    finally:
+        foreign.close()
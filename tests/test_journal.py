@@ -0,0 +1,11 @@
+from journal import KIND_FIRE, Journal
+
+
+def test_title_truncated_on_character_boundary(tmp_path):
+    j = Journal(str(tmp_path / "j.bin"), capacity=8)
+    title = "a" + "ğ" * 20   # 1 + 40 bayt; 30. bayt bir harfin ortası
+    j.append(KIND_FIRE, title, ts=1.0)
+    (rec,) = j.tail(1)
+    assert rec.title == "a" + "ğ" * 14
+    assert len(rec.title.encode("utf-8")) == 29
+    j.close()
@@ -0,0 +1,64 @@
+import time
+
+from clock import VirtualClock
+from notify import NotificationDispatcher, RecordingSink
+
+
+def test_rate_limited_backlog_is_coalesced_per_second():
+    sink = RecordingSink()
+    d = NotificationDispatcher(sink, linger=0.0, burst=1, per=0.1)
+    t0 = time.monotonic() - 1
+    # İlk toast jetonu harcar; kalanlar sınırlayıcı beklerken kuyrukta
+    for sec, title in ((100, "a"), (101, "b"), (101, "c"), (102, "d"),
+                       (103, "e"), (103, "f"), (103, "g")):
+        d._queue.append((sec, t0, title, ""))
+    d.start()
+    try:
+        assert sink.wait_for(4, timeout=5.0)
+        time.sleep(0.3)
+    finally:
+        d.close()
+    titles = [t for _, t, _ in sink.shown]
+    assert titles == ["a", "2 alarm çaldı", "d", "3 alarm çaldı"]
+    assert d.merged == 5
+
+
+def test_dispatcher_runs_on_virtual_clock():
+    clock = VirtualClock(1000.0)
+    sink = RecordingSink()
+    d = NotificationDispatcher(sink, linger=5.0, burst=1, per=60.0, clock=clock)
+    d.submit("a", "")
+    d.submit("b", "")
+    clock.advance(1)
+    d.submit("c", "")
+    t = time.monotonic()
+    d.start()
+    try:
+        assert sink.wait_for(2, timeout=5.0)
+    finally:
+        d.close()
+    assert time.monotonic() - t < 2.0   # linger ve jeton beklemesi sanal
+    assert [s[1] for s in sink.shown] == ["2 alarm çaldı", "c"]
+    assert clock.monotonic() >= 60.0
+
+
+def test_default_sink_resolved_on_first_notification(monkeypatch):
+    import notify
+    made = []
+
+    def fake_default():
+        made.append(RecordingSink())
+        return made[-1]
+    monkeypatch.setattr(notify, "default_sink", fake_default)
+    d = NotificationDispatcher(linger=0.0)
+    d.start()
+    try:
+        time.sleep(0.1)
+        assert made == []   # thread çalışıyor, sink henüz yok
+        d.submit("a", "")
+        t = time.monotonic()
+        while not made and time.monotonic() - t < 5.0:
+            time.sleep(0.01)
+        assert made[0].wait_for(1, timeout=5.0)
+    finally:
+        d.close()
@@ -0,0 +1,21 @@
+import sys
+
+import paths
+
+
+def test_frozen_build_uses_user_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("FN_DATA_DIR", raising=False)
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    d = paths.data_dir()
+    assert d.startswith(str(tmp_path)) and d != paths.APP_DIR
+    monkeypatch.delattr(sys, "frozen")
+    assert paths.data_dir() == paths.APP_DIR
+
+
+def test_env_overrides(tmp_path, monkeypatch):
+    monkeypatch.setenv("FN_DATA_DIR", str(tmp_path / "veri"))
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    assert paths.data_dir() == str(tmp_path / "veri")
+    assert (tmp_path / "veri").is_dir()
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+
+from recurrence import ALL_DAYS, RuleError, compile_rule
+
+
+def T(text):
+    """Yerel "YYYY-MM-DD HH:MM[:SS]" → epoch sn (2026-10-19 pazartesi)."""
+    return datetime.fromisoformat(text).timestamp()
+
+
+@pytest.mark.parametrize("text, mask, times, step", [
+    ("daily 09:30",                  ALL_DAYS,  (34200,),       0),
+    ("09:30",                        ALL_DAYS,  (34200,),       0),
+    ("weekdays 13:30,09:00,09:00",   0b0011111, (32400, 48600), 0),
+    ("weekends 10:00",               0b1100000, (36000,),       0),
+    ("mon,wed,fri 07:15",            0b0010101, (26100,),       0),
+    ("mon-fri 08:00",                0b0011111, (28800,),       0),
+    ("sat-mon 08:00",                0b1100001, (28800,),       0),   # sarmal aralık
+    ("fri-tue 08:00",                0b1110011, (28800,),       0),
+    ("mon tue 08:00",                0b0000011, (28800,),       0),
+    ("EVERY 2H",                     ALL_DAYS,  (),             7200),
+    ("every 90s",                    ALL_DAYS,  (),             90),
+])
+def test_grammar(text, mask, times, step):
+    rule = compile_rule(text)
+    assert (rule.mask, rule.times, rule.step) == (mask, times, step)
+
+
+@pytest.mark.parametrize("text", [
+    "", "daily", "weekdays", "every", "every 0m", "every 24h", "every 5x",
+    "every 5m 09:00", "daily 25:00", "daily 9", "funday 09:00",
+    "mon-xyz 09:00", "every 5m 18:00-09:00", "09:00-18:00",
+    "daily 09:00 until", "daily 09:00 until yarın",
+])
+def test_invalid_rules(text):
+    with pytest.raises(RuleError):
+        compile_rule(text)
+
+
+def test_same_text_compiles_to_one_object():
+    assert compile_rule("weekdays 09:00") is compile_rule("weekdays 09:00")
+
+
+@pytest.mark.parametrize("text, now, expected", [
+    # sabit saatler: bisect, eşit an "sonra" sayılmaz
+    ("daily 09:30",            "2026-10-19 08:00",    "2026-10-19 09:30"),
+    ("daily 09:30",            "2026-10-19 09:30",    "2026-10-20 09:30"),
+    ("daily 09:00,13:30",      "2026-10-19 09:00:01", "2026-10-19 13:30"),
+    # gün maskesi: cuma akşamından pazartesiye
+    ("weekdays 09:00",         "2026-10-23 18:00",    "2026-10-26 09:00"),
+    ("sat-mon 08:00",          "2026-10-20 09:00",    "2026-10-24 08:00"),
+    ("sat-mon 08:00",          "2026-10-25 09:00",    "2026-10-26 08:00"),
+    ("sun 08:00",              "2026-10-25 08:00",    "2026-11-01 08:00"),   # tam bir hafta
+    # every: pencere başından itibaren adımlar
+    ("every 50m 09:00-18:00",  "2026-10-19 07:00",    "2026-10-19 09:00"),
+    ("every 50m 09:00-18:00",  "2026-10-19 09:00",    "2026-10-19 09:50"),
+    ("every 50m 09:00-18:00",  "2026-10-19 10:39",    "2026-10-19 10:40"),
+    ("every 50m 09:00-18:00",  "2026-10-19 10:40",    "2026-10-19 11:30"),
+    ("every 50m 09:00-18:00",  "2026-10-19 17:20",    "2026-10-20 09:00"),   # 18:10 pencere dışı
+    ("every 60m 09:00-18:00",  "2026-10-19 17:30",    "2026-10-19 18:00"),   # bitiş dahil
+    ("every 50m 09:00-18:00 weekdays", "2026-10-23 17:30", "2026-10-26 09:00"),
+    ("every 2h",               "2026-10-19 23:30",    "2026-10-20 00:00"),
+    ("every 2h",               "2026-10-19 00:00",    "2026-10-19 02:00"),
+    # until: son çalma sınırın kendisi olabilir, sonrası yok
+    ("daily 09:00 until 2026-10-21T09:00", "2026-10-20 10:00", "2026-10-21 09:00"),
+    ("daily 09:00 until 2026-10-21T08:59", "2026-10-20 10:00", None),
+    ("daily 09:00 until 2026-10-21T09:00", "2026-10-21 09:00", None),
+    ("every 50m 09:00-18:00 until 2026-10-19T10:00", "2026-10-19 09:00", "2026-10-19 09:50"),
+    ("every 50m 09:00-18:00 until 2026-10-19T10:00", "2026-10-19 09:50", None),
+])
+def test_next_after(text, now, expected):
+    got = compile_rule(text).next_after(T(now))
+    assert got == (None if expected is None else T(expected))
+
+
+def test_series_walk_stops_at_until():
+    rule = compile_rule("mon,wed,fri 07:15 until 2026-11-01T00:00")
+    t, fires = T("2026-10-19 00:00"), []
+    while (t := rule.next_after(t)) is not None:
+        fires.append(datetime.fromtimestamp(t).strftime("%a %d %H:%M"))
+    assert fires == ["Mon 19 07:15", "Wed 21 07:15", "Fri 23 07:15",
+                     "Mon 26 07:15", "Wed 28 07:15", "Fri 30 07:15"]
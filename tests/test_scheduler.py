@@ -0,0 +1,29 @@
+import random
+
+from clock import VirtualClock
+from scheduler import PendingIndex, Scheduler
+
+
+def _order(index):
+    return [index[i] for i in range(len(index))]
+
+
+def test_pending_index_tracks_changes_incrementally():
+    clock = VirtualClock(0.0)
+    sched = Scheduler(clock)
+    rnd = random.Random(7)
+    hs = [sched.add(rnd.uniform(1, 1000), lambda h: None) for _ in range(200)]
+    index = PendingIndex(sched)
+    assert _order(index) == sched.pending()
+    assert not index.sync()
+
+    for h in rnd.sample(hs, 40):
+        h.cancel()
+    for h in rnd.sample([h for h in hs if h.active], 40):
+        h.reschedule(rnd.uniform(1, 1000))
+    hs += [sched.add(rnd.uniform(1, 1000), lambda h: None) for _ in range(30)]
+    sched.run_until(300)
+
+    assert index.sync()
+    assert _order(index) == sched.pending()
+    assert len(index) == len(sched)
@@ -0,0 +1,50 @@
+from store import DEADLINE, TITLE, AlarmStore
+
+
+def _reload(path):
+    s = AlarmStore(path)
+    rows = s.load()
+    s.close()
+    return {r[TITLE]: r[DEADLINE] for r in rows}
+
+
+def test_replay_add_reschedule_remove(tmp_path):
+    path = str(tmp_path / "alarms.jsonl")
+    s = AlarmStore(path)
+    s.load()
+    a = s.add(100.0, "a", "")
+    b = s.add(200.0, "b", "", rule="daily 09:00")
+    s.add(300.0, "c", "", uid="x@cal")
+    s.reschedule(b[1], 250.0)
+    s.remove(a[1])
+    s.close()
+    assert _reload(path) == {"b": 250.0, "c": 300.0}
+    s = AlarmStore(path)
+    s.load()
+    assert s.add(400.0, "d", "")[1] == 4   # silinenin id'si yeniden verilmez
+    s.close()
+
+
+def test_torn_last_line_is_cut_before_next_append(tmp_path):
+    path = tmp_path / "alarms.jsonl"
+    path.write_text('["a",1,10.0,"a","",1]\n["a",2,30', encoding="utf-8")
+    s = AlarmStore(str(path))
+    assert [r[TITLE] for r in s.load()] == ["a"]
+    s.add(50.0, "b", "")
+    s.close()
+    assert path.read_text(encoding="utf-8").endswith('"b","",1]\n')
+    assert _reload(str(path)) == {"a": 10.0, "b": 50.0}
+
+
+def test_reschedule_compacts_the_journal(tmp_path):
+    path = tmp_path / "alarms.jsonl"
+    s = AlarmStore(str(path))
+    s.COMPACT_MIN = 16
+    s.load()
+    row = s.add(0.0, "tekrarlı", "", rule="every 5m")
+    for i in range(1, 1000):
+        s.reschedule(row[1], float(i))
+    s.close()
+    assert s._dead <= s.COMPACT_MIN + 1
+    assert len(path.read_text(encoding="utf-8").splitlines()) <= s.COMPACT_MIN + 2
+    assert _reload(str(path)) == {"tekrarlı": 999.0}
@@ -0,0 +1,14 @@
+from uiprof import CallbackProfile
+
+
+def test_brief_lines_list_slowest_callbacks_by_p99():
+    prof = CallbackProfile(size=64)
+    for name, dur in (("sw_tick", 0.002), ("DrumPicker._draw", 0.030),
+                      ("update_clock", 0.001), ("tick", 0.010)):
+        nid = prof._id(name)
+        for _ in range(5):
+            prof.record(nid, dur, 0.004)
+    lines = prof.brief_lines()
+    assert lines[0].startswith("gecikme p99 4.0 ms")
+    assert [l.split(":")[0] for l in lines[1:]] == ["DrumPicker._draw", "tick", "sw_tick"]
+    assert CallbackProfile().brief_lines() == ["henüz geri çağrı yok"]
@@ -0,0 +1,28 @@
+"""
+Focus Notifier — tema: renk paleti ve fontlar
+"""
+
+# ══════════════════════════════════════════════════
+#  RENK PALETİ — Koyu Saat / Terminal Estetiği
+# ══════════════════════════════════════════════════
+BG       = "#0D0D14"
+PANEL    = "#13131F"
+CARD     = "#18182A"
+CARD2    = "#1F1F35"
+BORDER   = "#272742"
+ACCENT   = "#00D4FF"   # siyan
+ACCENT2  = "#FF4F8B"   # pembe-kırmızı
+GREEN    = "#00FFB2"
+AMBER    = "#FFB830"
+TEXT     = "#E8EAF6"
+SUBTEXT  = "#525278"
+DIM      = "#2A2A44"
+
+F_MONO   = ("Consolas", 11)
+F_MONO_L = ("Consolas", 36, "bold")
+F_MONO_M = ("Consolas", 22, "bold")
+F_MONO_S = ("Consolas", 13, "bold")
+F_UI     = ("Segoe UI", 9)
+F_UI_B   = ("Segoe UI Semibold", 9)
+F_UI_T   = ("Segoe UI Semibold", 15)
+F_SM     = ("Segoe UI", 8)
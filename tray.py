@@ -0,0 +1,152 @@
+"""
+Focus Notifier — sistem tepsisi
+  • Simge kareleri (60 yay adımı × renk durumu × kronometre işareti) tepsi
+    thread'inde bir kez çizilir; sonra sadece önbellekten seçilir
+  • Simge yalnızca gösterilen kare değişince değiştirilir
+  • Menüde sabit sayıda "yaklaşan alarm" yuvası; liste değişince sadece
+    update_menu (menü yeniden kurulmaz)
+  • PIL / pystray ilk kullanımda yüklenir
+"""
+
+import math
+import threading
+
+import startup
+from theme import ACCENT, AMBER, BG, DIM, GREEN, TEXT
+
+STEPS      = 60    # yay adımı: kalan dakika (en fazla bir saat)
+SIZE       = 32    # tepsi simgesi; 2 kat büyük çizilip küçültülür
+SOON       = 60    # son dakikada yay AMBER
+MENU_SLOTS = 5
+
+
+def _noop(icon, item):
+    pass
+
+
+def frame_key(remaining, sw_running):
+    """Gösterilecek kare: (durum, adım, kronometre). Aynı anahtar = aynı görüntü."""
+    if remaining is None or remaining <= 0:
+        return ("idle", 0, sw_running)
+    step = min(STEPS, int(math.ceil(remaining / 60)))
+    return ("soon" if remaining <= SOON else "alarm", step, sw_running)
+
+
+def next_change(remaining):
+    """Kare anahtarı kaç sn sonra değişir (kronometre hariç); yoksa None."""
+    if remaining is None or remaining <= 0:
+        return None
+    step = min(STEPS, int(math.ceil(remaining / 60)))
+    return remaining - (step - 1) * 60
+
+
+class SpriteCache:
+    """Tüm tepsi karelerini bir kez çizer; `frames[anahtar]` → PIL Image."""
+
+    def __init__(self, size=SIZE):
+        Image     = startup.lazy_import("PIL.Image")
+        ImageDraw = startup.lazy_import("PIL.ImageDraw")
+        self._Image, self._Draw = Image, ImageDraw
+        big = size * 2
+        self.size = size
+        self.frames = {}
+        for sw in (False, True):
+            self.frames[("idle", 0, sw)] = self._render(big, None, 0, sw)
+            for state, col in (("alarm", ACCENT), ("soon", AMBER)):
+                for step in range(1, STEPS + 1):
+                    self.frames[(state, step, sw)] = self._render(big, col, step, sw)
+
+    def _render(self, s, col, step, sw):
+        img = self._Image.new("RGBA", (s, s), (0, 0, 0, 0))
+        d = self._Draw.Draw(img)
+        c, w = s // 2, max(2, s // 10)
+        if col is None:
+            # Boşta: klasik simge (dolu daire + akrep/yelkovan)
+            d.ellipse([1, 1, s - 2, s - 2], fill=ACCENT)
+            d.ellipse([s // 6, s // 6, s - s // 6, s - s // 6], outline=BG, width=w)
+        else:
+            d.ellipse([1, 1, s - 2, s - 2], fill=BG, outline=DIM, width=w)
+            # Kalan süre yayı: saat 12'den saat yönünde
+            d.arc([w // 2, w // 2, s - w // 2 - 1, s - w // 2 - 1],
+                  start=-90, end=-90 + step * 360 / STEPS, fill=col, width=w)
+        hand = BG if col is None else TEXT
+        d.line([c, s // 4, c, c], fill=hand, width=max(2, w // 2))
+        d.line([c, c, c + s // 5, c + s // 6], fill=hand, width=max(2, w // 2))
+        if sw:
+            r = s // 6
+            d.ellipse([s - 2 * r - 1, s - 2 * r - 1, s - 1, s - 1],
+                      fill=GREEN, outline=BG, width=max(1, w // 3))
+        return img.resize((self.size, self.size), self._Image.LANCZOS)
+
+
+class Tray:
+    """pystray simgesi + durum güncellemesi.
+
+    `update()` her thread'den çağrılabilir ve ucuzdur: kare anahtarı ya da
+    menü satırları değişmedikçe pystray'e dokunmaz. `run()` tepsi
+    thread'inde çalışır (kareleri çizer, sonra olay döngüsüne girer).
+    """
+
+    def __init__(self, on_show, on_quit, extra_items=()):
+        self.on_show  = on_show
+        self.on_quit  = on_quit
+        self.extra    = extra_items   # (metin, eylem, görünür) üçlüleri
+        self.icon     = None
+        self.sprites  = None
+        self.swaps    = 0             # simge değiştirme sayısı
+        self._key     = None
+        self._want    = ("idle", 0, False)
+        self._lines   = ()
+        self._ready   = threading.Event()
+
+    # ── Tepsi thread'i ─────────────────────────────
+    def start(self):
+        threading.Thread(target=self.run, daemon=True, name="tray").start()
+
+    def run(self):
+        pystray = startup.lazy_import("pystray")
+        self.sprites = SpriteCache()
+        Item = pystray.MenuItem
+        slots = [Item(self._slot_text(i), _noop, enabled=False,
+                      visible=self._slot_visible(i)) for i in range(MENU_SLOTS)]
+        menu = pystray.Menu(
+            Item("Göster", lambda icon, item: self.on_show(), default=True),
+            pystray.Menu.SEPARATOR,
+            Item("Yaklaşan alarm yok", _noop, enabled=False,
+                 visible=lambda item: not self._lines),
+            *slots,
+            pystray.Menu.SEPARATOR,
+            *(Item(text, action, visible=vis) for text, action, vis in self.extra),
+            Item("Çıkış", lambda icon, item: self.on_quit()),
+        )
+        self._key = self._want
+        self.icon = pystray.Icon("FocusNotifier", self.sprites.frames[self._key],
+                                 "Focus Notifier", menu)
+        self._ready.set()
+        self.icon.run()
+
+    def _slot_text(self, i):
+        return lambda item: self._lines[i] if i < len(self._lines) else ""
+
+    def _slot_visible(self, i):
+        return lambda item: i < len(self._lines)
+
+    # ── Güncelleme ─────────────────────────────────
+    def update(self, remaining, sw_running, lines):
+        key = frame_key(remaining, sw_running)
+        self._want = key
+        if not self._ready.is_set():
+            self._lines = tuple(lines[:MENU_SLOTS])
+            return
+        if key != self._key:
+            self._key = key
+            self.icon.icon = self.sprites.frames[key]
+            self.swaps += 1
+        lines = tuple(lines[:MENU_SLOTS])
+        if lines != self._lines:
+            self._lines = lines
+            self.icon.update_menu()
+
+    def stop(self):
+        if self.icon is not None:
+            self.icon.stop()
@@ -0,0 +1,171 @@
+"""
+Focus Notifier — Tk olay döngüsü profili (isteğe bağlı)
+  • `--profile-ui` ya da FN_PROFILE_UI=1: tüm after / bind / command geri
+    çağrıları sarılır; kapalıyken hiçbir şey sarılmaz (ek yük yok)
+  • Her çağrının süresi, after için ayrıca gecikmesi (istenen → gerçek başlangıç)
+  • Sabit boyutlu halka tampon (array); rapor yüzdelikleri geri çağrı başına
+"""
+
+import os
+import sys
+import time
+from array import array
+
+ENABLED = "--profile-ui" in sys.argv or bool(os.environ.get("FN_PROFILE_UI"))
+
+SIZE   = 8192    # halka tampondaki son çağrı sayısı
+NO_LAG = -1.0    # after dışı çağrılar (olay, command) için gecikme yok
+
+profile = None   # install() sonrası etkin CallbackProfile
+
+
+def _name(func):
+    """Geri çağrının okunur adı; lambda'lar satır numarasıyla ayrışır."""
+    name = getattr(func, "__qualname__", None) or type(func).__name__
+    if "<lambda>" in name:
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            name = f"{name}:{code.co_firstlineno}"
+    return name
+
+
+def _pct(vals, p):
+    return vals[min(len(vals) - 1, int(len(vals) * p))]
+
+
+class CallbackProfile:
+    """Geri çağrı süreleri ve gecikmeleri için halka tampon.
+
+    Kayıt başına üç array hücresi yazılır; nesne üretilmez. İsimler bir
+    kez numaralanır (`names`), tamponda sadece numara tutulur.
+    """
+
+    def __init__(self, size=SIZE, clock=time.perf_counter):
+        self.size  = size
+        self.clock = clock
+        self.total = 0
+        self.names = []
+        self._ids  = {}
+        self._name = array("H", [0]) * size
+        self._dur  = array("d", [0.0]) * size
+        self._lag  = array("d", [NO_LAG]) * size
+        self._i    = 0
+
+    def _id(self, name):
+        nid = self._ids.get(name)
+        if nid is None:
+            nid = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return nid
+
+    def record(self, nid, dur, lag=NO_LAG):
+        i = self._i
+        self._name[i] = nid
+        self._dur[i]  = dur
+        self._lag[i]  = lag
+        self._i = (i + 1) % self.size
+        self.total += 1
+
+    def wrap(self, func, due=None):
+        """`func`'u ölçen sarmalayıcı; `due` verilirse gecikme de kaydedilir."""
+        nid, clock, record = self._id(_name(func)), self.clock, self.record
+        if due is None:
+            def run(*args):
+                t = clock()
+                try:
+                    return func(*args)
+                finally:
+                    record(nid, clock() - t)
+        else:
+            def run(*args):
+                t = clock()
+                try:
+                    return func(*args)
+                finally:
+                    record(nid, clock() - t, t - due)
+        run.__name__ = getattr(func, "__name__", "callback")
+        return run
+
+    # ── Rapor ──────────────────────────────────────
+    def summary(self):
+        """{ad: {n, p50, p95, p99, max, lag_p50, lag_p99, lag_max}} (ms)."""
+        n = min(self.total, self.size)
+        durs, lags = {}, {}
+        for i in range(n):
+            nid = self._name[i]
+            durs.setdefault(nid, []).append(self._dur[i] * 1000)
+            if self._lag[i] != NO_LAG:
+                lags.setdefault(nid, []).append(self._lag[i] * 1000)
+        out = {}
+        for nid, ds in durs.items():
+            ds.sort()
+            row = {"n": len(ds), "total": sum(ds), "p50": _pct(ds, 0.5),
+                   "p95": _pct(ds, 0.95), "p99": _pct(ds, 0.99), "max": ds[-1]}
+            ls = sorted(lags.get(nid, ()))
+            if ls:
+                row.update(lag_p50=_pct(ls, 0.5), lag_p99=_pct(ls, 0.99),
+                           lag_max=ls[-1])
+            out[self.names[nid]] = row
+        return out
+
+    def report_lines(self):
+        n = min(self.total, self.size)
+        lines = [f"UI geri çağrı profili — son {n} çağrı (toplam {self.total})"]
+        lags = sorted(v * 1000 for v in self._lag[:n] if v != NO_LAG)
+        if lags:
+            lines.append(f"after gecikmesi: p50 {_pct(lags, 0.5):.2f} ms  "
+                         f"p99 {_pct(lags, 0.99):.2f} ms  en kötü {lags[-1]:.2f} ms")
+        lines.append(f"{'n':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} "
+                     f"{'gec.p99':>8}  geri çağrı (süreler ms)")
+        rows = sorted(self.summary().items(), key=lambda kv: -kv[1]["total"])
+        for name, r in rows:
+            lag = f"{r['lag_p99']:8.2f}" if "lag_p99" in r else f"{'-':>8}"
+            lines.append(f"{r['n']:>6} {r['p50']:8.2f} {r['p95']:8.2f} "
+                         f"{r['p99']:8.2f} {r['max']:8.2f} {lag}  {name}")
+        return lines
+
+    def brief_lines(self, k=3):
+        """Bildirim için kısa özet: after gecikmesi + p99'u en kötü `k` geri çağrı."""
+        lines = []
+        n = min(self.total, self.size)
+        lags = sorted(v * 1000 for v in self._lag[:n] if v != NO_LAG)
+        if lags:
+            lines.append(f"gecikme p99 {_pct(lags, 0.99):.1f} ms, "
+                         f"en kötü {lags[-1]:.1f} ms")
+        rows = sorted(self.summary().items(), key=lambda kv: -kv[1]["p99"])
+        for name, r in rows[:k]:
+            lines.append(f"{name}: p99 {r['p99']:.1f} ms ({r['n']}×)")
+        return lines or ["henüz geri çağrı yok"]
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.report_lines()) + "\n")
+        return path
+
+
+def install(prof=None):
+    """tkinter'ın after ve geri çağrı kaydını sarar; Tk() oluşturulmadan
+    önce çağrılmalı. Etkin profili döndürür."""
+    global profile
+    if profile is not None:
+        return profile
+    import tkinter as tk
+    prof = profile = prof or CallbackProfile()
+    clock = prof.clock
+    orig_after, orig_register = tk.Misc.after, tk.Misc._register
+
+    def after(self, ms, func=None, *args):
+        if func is None:
+            return orig_after(self, ms)
+        # after_idle 'idle' geçirir: gecikme kuyrukta bekleme süresidir
+        due = clock() + (ms / 1000 if ms != "idle" else 0.0)
+        return orig_after(self, ms, prof.wrap(func, due), *args)
+
+    def _register(self, func, subst=None, needcleanup=1):
+        # after'ın iç trambolini (callit) zaten yukarıda ölçülen işlevi çağırır
+        if not getattr(func, "__qualname__", "").endswith("after.<locals>.callit"):
+            func = prof.wrap(func)
+        return orig_register(self, func, subst, needcleanup)
+
+    tk.Misc.after, tk.Misc._register = after, _register
+    return prof
@@ -0,0 +1,617 @@
+"""
+Focus Notifier — yeniden kullanılabilir çizim bileşenleri
+  • StopwatchRing: kalıcı (retained) canvas öğeleriyle kronometre halkası
+  • DrumRenderer / DrumPicker: sabit öğe havuzlu drum-roll seçici
+  • LapListView: sadece görünen satırları çizen sanal lap listesi
+  • TimerListView: çoklu kronometre listesi; ortak tick, sadece görünen satırlar
+  • AlarmListView: yaklaşan alarmlar; saniyelik tek geçiş, sadece görünen satırlar
+"""
+
+import time
+import tkinter as tk
+from datetime import datetime
+from tkinter import font as tkfont
+
+from stopwatch import format_sw
+from theme import ACCENT, ACCENT2, CARD, CARD2, DIM, GREEN, SUBTEXT, TEXT
+
+
+class StopwatchRing:
+    """Dairesel kronometre göstergesi.
+
+    Öğeler bir kez oluşturulur; her karede yalnızca değişen özellikler
+    (`extent`, metin) `itemconfig` ile güncellenir. Aynı santisaniye için
+    ikinci kez çizim yapılmaz. Canvas olarak create_*/itemconfig sağlayan
+    her nesne kullanılabilir.
+    """
+
+    def __init__(self, canvas, radius, pad=10):
+        self.canvas = canvas
+        cx = cy = radius + pad
+        box = (cx - radius, cy - radius, cx + radius, cy + radius)
+        # Arka çember
+        self._oval = canvas.create_oval(*box, outline=DIM, width=8)
+        # İlerleme yayı — frac == 0 iken gizli
+        self._arc  = canvas.create_arc(*box, start=90, extent=-1,
+                                       outline=ACCENT, width=8, style="arc",
+                                       state="hidden")
+        # Merkez zaman + alt küçük metin
+        self._time = canvas.create_text(cx, cy, text=format_sw(0),
+                                        font=("Consolas", 28, "bold"), fill=TEXT)
+        self._pct  = canvas.create_text(cx, cy + 38, text="000%",
+                                        font=("Consolas", 10), fill=SUBTEXT)
+        self._cs     = 0      # son çizilen santisaniye
+        self._extent = None
+        self._pct_v  = 0
+        self.frames  = 0      # gerçekten çizilen kare sayısı
+
+    def render(self, elapsed):
+        """Süreyi göster; değişiklik yoksa hiçbir şey yapma (False döner)."""
+        cs = int(elapsed * 100)
+        if cs == self._cs:
+            return False
+        self._cs = cs
+        self.frames += 1
+        cv = self.canvas
+        frac = (elapsed % 60) / 60
+
+        extent = -frac * 360
+        if frac > 0:
+            if self._extent is None:
+                cv.itemconfig(self._arc, state="normal", extent=extent)
+            else:
+                cv.itemconfig(self._arc, extent=extent)
+            self._extent = extent
+        elif self._extent is not None:
+            cv.itemconfig(self._arc, state="hidden")
+            self._extent = None
+
+        cv.itemconfig(self._time, text=format_sw(elapsed))
+        pct = int(frac * 100)
+        if pct != self._pct_v:
+            self._pct_v = pct
+            cv.itemconfig(self._pct, text=f"{pct:03d}%")
+        return True
+
+
+class LapListView:
+    """Sanal lap listesi (en yeni üstte).
+
+    Sadece görünen satır kadar metin öğesi vardır; lap sayısı ne olursa
+    olsun yeni lap / kaydırma sabit sayıda `itemconfig` demektir. En iyi
+    ve en kötü split renklendirilir. `yview` Tk scrollbar protokolüne uyar.
+    """
+
+    ROW_H = 18
+
+    def __init__(self, canvas, laps, width, height, scrollbar=None):
+        self.canvas    = canvas
+        self.laps      = laps
+        self.scrollbar = scrollbar
+        self.top       = 0   # ekranın en üstündeki satırın sıra no'su (0 = en yeni)
+        self.rows      = height // self.ROW_H
+        self._pool = []
+        for k in range(self.rows + 1):
+            item = canvas.create_text(8, k * self.ROW_H + self.ROW_H // 2,
+                                      text="", anchor="w", fill=TEXT,
+                                      font=("Consolas", 10))
+            self._pool.append([item, None, None])   # öğe, metin, renk
+        self._shown = 0
+        canvas.bind("<MouseWheel>",
+                    lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+
+    def _row(self, i):
+        laps = self.laps
+        split = laps.split(i)
+        text = f"#{i + 1:02d}   {format_sw(laps.times[i])}   +{format_sw(split)}"
+        if i:
+            d = laps.delta(i)
+            text += f"   {'+' if d >= 0 else '-'}{format_sw(abs(d))}"
+        if len(laps) > 1 and i == laps.best:
+            return text, GREEN
+        if len(laps) > 1 and i == laps.worst:
+            return text, ACCENT2
+        return text, TEXT
+
+    def refresh(self):
+        """Görünen satırları güncelle; değişmeyene dokunma."""
+        n = len(self.laps)
+        # Kullanıcı aşağı kaydırmışsa yeni lap'ler görünümü kaydırmasın
+        if self.top and n > self._shown:
+            self.top += n - self._shown
+        self._shown = n
+        self.top = max(0, min(self.top, n - self.rows))
+        cv = self.canvas
+        for k, slot in enumerate(self._pool):
+            i = n - 1 - (self.top + k)
+            text, col = self._row(i) if i >= 0 else ("", TEXT)
+            if slot[1] != text or slot[2] != col:
+                cv.itemconfig(slot[0], text=text, fill=col)
+                slot[1], slot[2] = text, col
+        if self.scrollbar is not None:
+            if n > self.rows:
+                self.scrollbar.set(self.top / n, (self.top + self.rows) / n)
+            else:
+                self.scrollbar.set(0, 1)
+
+    def yview(self, *args):
+        n = len(self.laps)
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.rows if args[2] == "pages" else 1)
+            self.top += step
+        self.refresh()
+
+
+class TimerListView:
+    """StopwatchBank için sanal liste: ● ad  süre  ↺  ✕.
+
+    Öğe havuzu görünen satır kadardır; `render(now)` sadece görünen
+    aralığın sürelerini hesaplar ve metni değişen öğeye dokunur. Kaç
+    kronometre olursa olsun kare maliyeti sabittir. Tıklama
+    `on_action(indeks, "toggle" | "reset" | "remove")` çağırır.
+    """
+
+    ROW_H = 26
+
+    def __init__(self, canvas, bank, width, height, on_action=None, scrollbar=None):
+        self.canvas    = canvas
+        self.bank      = bank
+        self.width     = width
+        self.on_action = on_action
+        self.scrollbar = scrollbar
+        self.top       = 0
+        self.rows      = height // self.ROW_H
+        self.frames    = 0
+        self._pool = []
+        for k in range(self.rows + 1):
+            y = k * self.ROW_H + self.ROW_H // 2
+            items = (canvas.create_text(10, y, text="", fill=DIM, font=("Consolas", 10)),
+                     canvas.create_text(24, y, text="", anchor="w", fill=TEXT,
+                                        font=("Consolas", 10)),
+                     canvas.create_text(width - 56, y, text="", anchor="e", fill=TEXT,
+                                        font=("Consolas", 11, "bold")),
+                     canvas.create_text(width - 38, y, text="", fill=SUBTEXT,
+                                        font=("Consolas", 10)),
+                     canvas.create_text(width - 14, y, text="", fill=SUBTEXT,
+                                        font=("Consolas", 10)))
+            self._pool.append([items, None, None, None])   # öğeler, ad, süre, çalışıyor
+        self._version = None
+        canvas.bind("<MouseWheel>",
+                    lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+        canvas.bind("<ButtonPress-1>", self._on_click)
+
+    def render(self, now=None):
+        """Görünen satırları çiz; değişen öğe yoksa False."""
+        bank = self.bank
+        n = len(bank)
+        self.top = max(0, min(self.top, n - self.rows))
+        lo = self.top
+        hi = min(n, lo + len(self._pool))
+        times = bank.elapsed_range(lo, hi, now)
+        cv, changed = self.canvas, False
+        for k, slot in enumerate(self._pool):
+            i = lo + k
+            if i < hi:
+                name, text, on = bank.names[i], format_sw(times[k]), bank.on[i]
+            else:
+                name, text, on = "", "", None
+            items = slot[0]
+            if slot[1] != name:
+                cv.itemconfig(items[1], text=name)
+                if not slot[1] or not name:   # satır doldu / boşaldı
+                    cv.itemconfig(items[3], text="↺" if name else "")
+                    cv.itemconfig(items[4], text="✕" if name else "")
+                slot[1] = name
+                changed = True
+            if slot[2] != text:
+                cv.itemconfig(items[2], text=text)
+                slot[2] = text
+                changed = True
+            if slot[3] != on:
+                cv.itemconfig(items[0], text="●" if on is not None else "",
+                              fill=GREEN if on else DIM)
+                cv.itemconfig(items[2], fill=TEXT if on else SUBTEXT)
+                slot[3] = on
+                changed = True
+        if changed:
+            self.frames += 1
+        if self._version != bank.version:
+            self._version = bank.version
+            if self.scrollbar is not None:
+                if n > self.rows:
+                    self.scrollbar.set(self.top / n, (self.top + self.rows) / n)
+                else:
+                    self.scrollbar.set(0, 1)
+        return changed
+
+    def yview(self, *args):
+        n = len(self.bank)
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            self.top += int(args[1]) * (self.rows if args[2] == "pages" else 1)
+        self._version = None   # kaydırma çubuğu da güncellensin
+        self.render()
+
+    def _on_click(self, e):
+        i = self.top + e.y // self.ROW_H
+        if self.on_action is None or not 0 <= i < len(self.bank):
+            return
+        if e.x >= self.width - 26:
+            self.on_action(i, "remove")
+        elif e.x >= self.width - 50:
+            self.on_action(i, "reset")
+        else:
+            self.on_action(i, "toggle")
+
+
+def _remaining(secs):
+    if secs <= 0:
+        return "şimdi"
+    secs = int(secs + 0.999)
+    d, secs = divmod(secs, 86400)
+    h, secs = divmod(secs, 3600)
+    m, s = divmod(secs, 60)
+    return f"{d}g {h:02d}:{m:02d}" if d else f"{h:02d}:{m:02d}:{s:02d}"
+
+
+class AlarmListView:
+    """Yaklaşan alarmlar: deadline sıralı listenin sadece görünen satırları.
+
+    `items` deadline sırasıyla handle benzeri nesnelerdir (`deadline`,
+    `args[0]` başlık, `args[3]` kural); liste ya da `len()` ve indeksleme
+    sağlayan scheduler.PendingIndex. `set_items()` liste değişince,
+    `render(now)` saniyede bir çağrılır; ikisinin de çizim maliyeti
+    listenin uzunluğuna değil görünen satır sayısına bağlıdır. Saat ve
+    başlık sadece satırdaki alarm değişince, kalan süre metni değişince
+    yazılır. ✕ tıklaması `on_cancel(handle)` çağırır.
+    """
+
+    ROW_H     = 24
+    TITLE_MAX = 24   # karakter
+
+    def __init__(self, canvas, width, height, on_cancel=None, scrollbar=None,
+                 clock=time.time):
+        self.canvas    = canvas
+        self.width     = width
+        self.on_cancel = on_cancel
+        self.scrollbar = scrollbar
+        self.clock     = clock   # kaydırmada geri sayım için duvar saati
+        self.items     = []
+        self.top       = 0
+        self.rows      = height // self.ROW_H
+        self.frames    = 0
+        self._pool = []
+        for k in range(self.rows + 1):
+            y = k * self.ROW_H + self.ROW_H // 2
+            items = (canvas.create_text(8, y, text="", anchor="w", fill=SUBTEXT,
+                                        font=("Consolas", 9)),
+                     canvas.create_text(92, y, text="", anchor="w", fill=TEXT,
+                                        font=("Consolas", 10)),
+                     canvas.create_text(width - 32, y, text="", anchor="e", fill=ACCENT,
+                                        font=("Consolas", 10, "bold")),
+                     canvas.create_text(width - 14, y, text="", fill=SUBTEXT,
+                                        font=("Consolas", 10)))
+            self._pool.append([items, None, None])   # öğeler, (handle, deadline), kalan
+        canvas.bind("<MouseWheel>",
+                    lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+        canvas.bind("<ButtonPress-1>", self._on_click)
+
+    def set_items(self, items):
+        self.items = items
+        self.top = max(0, min(self.top, len(items) - self.rows))
+        self._scrollbar()
+
+    def _scrollbar(self):
+        if self.scrollbar is None:
+            return
+        n = len(self.items)
+        if n > self.rows:
+            self.scrollbar.set(self.top / n, (self.top + self.rows) / n)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def render(self, now):
+        items, cv, changed = self.items, self.canvas, False
+        for k, slot in enumerate(self._pool):
+            i = self.top + k
+            h = items[i] if i < len(items) else None
+            ident = (h, h.deadline) if h is not None else None
+            if not items and k == 0:
+                ident = "boş"
+            if slot[1] != ident:
+                slot[1] = ident
+                changed = True
+                if h is not None:
+                    title = h.args[0]
+                    if len(title) > self.TITLE_MAX:
+                        title = title[:self.TITLE_MAX - 1] + "…"
+                    if h.args[3] is not None:
+                        title = "↻ " + title
+                    when = datetime.fromtimestamp(h.deadline).strftime("%a %H:%M")
+                    texts = (when, title, "✕")
+                else:
+                    texts = ("", "Bekleyen alarm yok" if ident else "", "")
+                cv.itemconfig(slot[0][0], text=texts[0])
+                cv.itemconfig(slot[0][1], text=texts[1], fill=TEXT if h else SUBTEXT)
+                cv.itemconfig(slot[0][3], text=texts[2])
+            rem = _remaining(h.deadline - now) if h is not None else ""
+            if slot[2] != rem:
+                cv.itemconfig(slot[0][2], text=rem)
+                slot[2] = rem
+                changed = True
+        if changed:
+            self.frames += 1
+        return changed
+
+    def yview(self, *args):
+        n = len(self.items)
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            self.top += int(args[1]) * (self.rows if args[2] == "pages" else 1)
+        self.top = max(0, min(self.top, n - self.rows))
+        self._scrollbar()
+        self.render(self.clock())
+
+    def _on_click(self, e):
+        i = self.top + e.y // self.ROW_H
+        if self.on_cancel is not None and e.x >= self.width - 26 and 0 <= i < len(self.items):
+            self.on_cancel(self.items[i])
+
+
+# ══════════════════════════════════════════════════
+#  DRUM-ROLL PICKER (kaydırılabilir saat/dakika)
+# ══════════════════════════════════════════════════
+def _blend(hex1, hex2, t):
+    r1,g1,b1 = int(hex1[1:3],16), int(hex1[3:5],16), int(hex1[5:7],16)
+    r2,g2,b2 = int(hex2[1:3],16), int(hex2[3:5],16), int(hex2[5:7],16)
+    r = int(r1*t + r2*(1-t))
+    g = int(g1*t + g2*(1-t))
+    b = int(b1*t + b2*(1-t))
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def _font_tuple(size, weight):
+    return ("Consolas", size, weight)
+
+
+class DrumRenderer:
+    """Drum-roll çizimi: sabit öğe havuzu + önceden hesaplanmış stil tablosu.
+
+    Tüm öğeler bir kez oluşturulur. Her satırın rengi/fontu merkeze olan
+    piksel uzaklığına bağlıdır ve bu tablo (fg, font_for) başına bir kez
+    hesaplanır; karede yalnızca değişen coords/text/fill/font güncellenir.
+    """
+
+    ITEM_H  = 38
+    VISIBLE = 3   # görünen satır sayısı (tek sayı olmalı)
+    WIDTH   = 70
+
+    _tables = {}   # (fg, font_for) -> [(renk, font), ...] piksel uzaklığına göre
+
+    def __init__(self, canvas, labels, fg=ACCENT, font_for=_font_tuple):
+        self.canvas = canvas
+        self.labels = labels
+        self.styles = self._style_table(fg, font_for)
+        W, H, IH = self.WIDTH, self.ITEM_H * self.VISIBLE, self.ITEM_H
+        mid = H // 2
+        self._mid = mid
+        half = self.VISIBLE // 2
+        self._rels = range(-half - 1, half + 2)
+
+        # Arka plan + seçili satır vurgusu
+        canvas.create_rectangle(0, 0, W, H, fill=CARD2, outline="")
+        canvas.create_rectangle(0, mid - IH//2, W, mid + IH//2,
+                                fill=CARD, outline=ACCENT, width=1)
+        # Sayı havuzu: [öğe, y, etiket idx, stil idx]
+        self._pool = []
+        for rel in self._rels:
+            item = canvas.create_text(W // 2, mid + rel * IH, text="",
+                                      anchor="center")
+            self._pool.append([item, None, None, None])
+        # Üst/alt maske + çizgiler (sayıların üstünde)
+        canvas.create_rectangle(0, 0, W, mid - IH//2, fill=CARD2, outline="")
+        canvas.create_rectangle(0, mid + IH//2, W, H, fill=CARD2, outline="")
+        canvas.create_line(0, mid - IH//2, W, mid - IH//2, fill=ACCENT, width=1)
+        canvas.create_line(0, mid + IH//2, W, mid + IH//2, fill=ACCENT, width=1)
+        self.frames = 0
+
+    @classmethod
+    def _style_table(cls, fg, font_for):
+        key = (fg, font_for)
+        table = cls._tables.get(key)
+        if table is None:
+            IH = cls.ITEM_H
+            span = (cls.VISIBLE // 2 + 2) * IH
+            table = []
+            for d_px in range(span + 1):
+                dist = d_px / IH
+                if dist < 0.1:
+                    col, fsize, fw = fg, 22, "bold"
+                elif dist < 1.2:
+                    # Aradaki geçiş
+                    alpha = max(0, 1 - dist)
+                    col = _blend(fg, SUBTEXT, alpha)
+                    fsize = int(13 + 9 * alpha)
+                    fw = "normal"
+                else:
+                    col, fsize, fw = SUBTEXT, 13, "normal"
+                table.append((col, font_for(fsize, fw)))
+            cls._tables[key] = table
+        return table
+
+    def render(self, pos):
+        """`pos`: kesirli satır konumu (0 → ilk değer ortada)."""
+        n = len(self.labels)
+        IH = self.ITEM_H
+        idx = round(pos)
+        off = int(round((idx - pos) * IH))   # merkez satırın piksel kayması
+        cv = self.canvas
+        styles = self.styles
+        x = self.WIDTH // 2
+        changed = False
+        for slot, rel in zip(self._pool, self._rels):
+            y = self._mid + rel * IH + off
+            lab = (idx + rel) % n
+            sty = min(abs(rel * IH + off), len(styles) - 1)
+            if slot[1] != y:
+                cv.coords(slot[0], x, y)
+                slot[1] = y
+                changed = True
+            if slot[2] != lab or slot[3] != sty:
+                kw = {}
+                if slot[2] != lab:
+                    kw["text"] = self.labels[lab]
+                    slot[2] = lab
+                if slot[3] != sty:
+                    old = styles[slot[3]] if slot[3] is not None else (None, None)
+                    col, font = styles[sty]
+                    if col != old[0]:
+                        kw["fill"] = col
+                    if font != old[1]:
+                        kw["font"] = font
+                    slot[3] = sty
+                if kw:
+                    cv.itemconfig(slot[0], **kw)
+                    changed = True
+        if changed:
+            self.frames += 1
+        return changed
+
+
+_named_fonts = {}
+
+def _named_font(size, weight):
+    """Adlandırılmış Tk fontu — Tk her karede font tanımı çözmez."""
+    f = _named_fonts.get((size, weight))
+    if f is None:
+        f = tkfont.Font(family="Consolas", size=size, weight=weight)
+        _named_fonts[(size, weight)] = f
+    return f.name
+
+
+class DrumPicker(tk.Canvas):
+    """Dikey kaydırmalı drum-roll sayı seçici.
+
+    Olaylar yalnızca konumu günceller; çizim kare başına en fazla bir kez
+    yapılır. Bırakınca hıza göre kinetik kayar, sonra en yakın değere oturur.
+    """
+
+    ITEM_H   = DrumRenderer.ITEM_H
+    VISIBLE  = DrumRenderer.VISIBLE
+    FRAME_MS = 16
+    FRICTION = 0.90    # kare başına hız çarpanı
+    MIN_V    = 2.0     # satır/sn — altında kinetik biter, yerine oturur
+    EASE     = 0.35    # hedefe yaklaşma oranı (kare başına)
+
+    def __init__(self, master, values, init_val, fg=ACCENT, **kw):
+        h = self.ITEM_H * self.VISIBLE
+        super().__init__(master, width=DrumRenderer.WIDTH, height=h,
+                         bg=CARD2, highlightthickness=0, **kw)
+        self._values = values
+        idx = values.index(init_val) if init_val in values else 0
+        self._pos    = float(idx)   # kesirli satır konumu
+        self._target = idx          # oturulacak satır
+        self._vel    = 0.0          # satır/sn (kinetik)
+        self._drag_y = None
+        self._samples = []          # (olay zamanı ms, y) — hız tahmini
+        self._frame  = None         # bekleyen kare (after id)
+
+        self._renderer = DrumRenderer(self, [f"{v:02d}" for v in values],
+                                      fg, _named_font)
+
+        self.bind("<MouseWheel>",      self._on_wheel)
+        self.bind("<ButtonPress-1>",   self._on_press)
+        self.bind("<B1-Motion>",       self._on_drag)
+        self.bind("<ButtonRelease-1>", self._on_release)
+
+        self._renderer.render(self._pos)
+
+    # ── Kare döngüsü ───────────────────────────────
+    def _request_frame(self):
+        if self._frame is None:
+            self._frame = self.after(self.FRAME_MS, self._on_frame)
+
+    def _on_frame(self):
+        self._frame = None
+        animating = False
+        if self._drag_y is None:
+            if self._vel:
+                # Kinetik kayma
+                self._pos += self._vel * self.FRAME_MS / 1000
+                self._vel *= self.FRICTION
+                if abs(self._vel) < self.MIN_V:
+                    self._vel = 0.0
+                self._target = round(self._pos)
+                animating = True
+            else:
+                d = self._target - self._pos
+                if abs(d) < 0.01:
+                    self._pos = float(self._target)
+                else:
+                    self._pos += d * self.EASE
+                    animating = True
+            self._wrap()
+        self._renderer.render(self._pos)
+        if animating:
+            self._request_frame()
+
+    def _wrap(self):
+        # Konumu [0, n) aralığında tut (kayan nokta birikmesin)
+        n = len(self._values)
+        k = self._target // n * n
+        if k:
+            self._pos -= k
+            self._target -= k
+
+    # ── Etkileşim ──────────────────────────────────
+    def _on_wheel(self, e):
+        self._vel = 0.0
+        self._target += -1 if e.delta > 0 else 1
+        self._request_frame()
+
+    def _on_press(self, e):
+        self._drag_y = e.y
+        self._base_pos = self._pos
+        self._vel = 0.0
+        self._samples = [(e.time, e.y)]
+
+    def _on_drag(self, e):
+        if self._drag_y is None: return
+        dy = self._drag_y - e.y
+        self._pos = self._base_pos + dy / self.ITEM_H
+        self._target = round(self._pos)
+        self._samples.append((e.time, e.y))
+        if len(self._samples) > 8:
+            del self._samples[0]
+        self._request_frame()
+
+    def _on_release(self, e):
+        if self._drag_y is None: return
+        self._drag_y = None
+        # Son ~100 ms'lik harekete göre fırlatma hızı
+        t1, y1 = e.time, e.y
+        t0, y0 = self._samples[0]
+        for t, y in self._samples:
+            if t1 - t <= 100:
+                t0, y0 = t, y
+                break
+        dt = (t1 - t0) / 1000
+        self._vel = (y0 - y1) / self.ITEM_H / dt if dt > 0 else 0.0
+        if abs(self._vel) < self.MIN_V:
+            self._vel = 0.0
+        self._request_frame()
+
+    # ── Değer okuma ────────────────────────────────
+    def get(self):
+        return self._values[self._target % len(self._values)]
+
+    def set_val(self, v):
+        if v in self._values:
+            self._vel = 0.0
+            self._target = self._values.index(v)
+            self._pos = float(self._target)
+            self._request_frame()